@@ -1,13 +1,17 @@
 # calendars/services/ics_service.py
-from datetime import datetime
-from typing import Dict, Any
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, Iterator, Optional
 import uuid
-from icalendar import Calendar, Event as ICSEvent
+from icalendar import Calendar, Event as ICSEvent, Timezone, vRecur
 from django.http import HttpResponse
+from django.utils import timezone as django_timezone
 
 class ICSService:
     """Service for handling ICS file operations"""
-    
+
+    PRODID = '-//My Calendar Application//example.com//'
+    UID_DOMAIN = 'flowagenda'
+
     @staticmethod
     def create_ics_event(event_data: Dict[str, Any]) -> str:
         """
@@ -16,21 +20,36 @@ class ICSService:
         Args:
             event_data: Dictionary containing event details
                 Required keys: title, start_datetime, end_datetime
-                Optional keys: description, location, attendees
+                Optional keys: id, description, location, attendees, rrule
                 
         Returns:
             String containing ICS file content
         """
         # Create calendar
-        cal = Calendar()
-        cal.add('prodid', '-//My Calendar Application//example.com//')
-        cal.add('version', '2.0')
+        cal = ICSService._calendar()
         
+        # Add event to calendar
+        cal.add_component(ICSService.build_vevent(event_data))
+        # VTIMEZONE for the TZID of recurring events
+        cal.add_missing_timezones()
+        
+        return cal.to_ical()
+
+    @staticmethod
+    def build_vevent(event_data: Dict[str, Any], dtstamp: Optional[datetime] = None) -> ICSEvent:
+        """Build one VEVENT component from event data (see create_ics_event)"""
         # Create event
         event = ICSEvent()
         event.add('summary', event_data['title'])
-        event.add('dtstart', event_data['start_datetime'])
-        event.add('dtend', event_data['end_datetime'])
+        start, end = event_data['start_datetime'], event_data.get('end_datetime')
+        if event_data.get('rrule'):
+            # Occurrences repeat in local wall-clock time (see recurrence.py), so
+            # clients must expand the rule in that zone rather than in UTC
+            start = ICSService._local(start)
+            end = end and ICSService._local(end)
+        event.add('dtstart', start)
+        if end:
+            event.add('dtend', end)
         
         # Add optional fields if they exist
         if event_data.get('description'):
@@ -38,22 +57,70 @@ class ICSService:
         
         if event_data.get('location'):
             event.add('location', event_data['location'])
+
+        # Recurring events export as one VEVENT with their rule
+        if event_data.get('rrule'):
+            event.add('rrule', vRecur.from_ical(event_data['rrule']))
             
-        # Add unique identifier
-        event.add('uid', str(uuid.uuid4()))
+        # Stable identifier so re-imports update the event instead of duplicating it
+        event.add('uid', ICSService.event_uid(event_data.get('id')))
         
         # Add creation timestamp
-        event.add('dtstamp', datetime.utcnow())
+        event.add('dtstamp', dtstamp or datetime.now(timezone.utc))
         
         # Add attendees if they exist
         for attendee in event_data.get('attendees', []):
             if attendee.get('email'):
                 event.add('attendee', f'mailto:{attendee["email"]}')
-        
-        # Add event to calendar
-        cal.add_component(event)
-        
-        return cal.to_ical()
+
+        return event
+
+    @staticmethod
+    def event_uid(event_id: Any = None) -> str:
+        """UID derived from the event id, or a random one for unsaved events"""
+        return f"{event_id or uuid.uuid4()}@{ICSService.UID_DOMAIN}"
+
+    @staticmethod
+    def stream_calendar(events: Iterable[Dict[str, Any]], batch_size: int = 100) -> Iterator[bytes]:
+        """
+        Yield a VCALENDAR as chunks: the header, VEVENTs in batches, the footer
+
+        Only one batch is held at a time, so memory stays flat however many
+        events the iterable produces.
+        """
+        header = ICSService._calendar()
+        # Recurring events carry a TZID in the current time zone
+        header.add_component(Timezone.from_tzid(django_timezone.get_current_timezone_name()))
+        header = header.to_ical()
+        # to_ical() of an empty calendar is the header lines followed by END:VCALENDAR
+        opening, closing = header.rsplit(b'END:VCALENDAR', 1)
+        yield opening
+
+        dtstamp = datetime.now(timezone.utc)
+        batch = []
+        for event_data in events:
+            batch.append(ICSService.build_vevent(event_data, dtstamp).to_ical())
+            if len(batch) >= batch_size:
+                yield b''.join(batch)
+                batch = []
+        if batch:
+            yield b''.join(batch)
+
+        yield b'END:VCALENDAR' + closing
+
+    @staticmethod
+    def _local(value: datetime) -> datetime:
+        """Aware value in the current time zone (naive values are taken as local)"""
+        if django_timezone.is_naive(value):
+            return django_timezone.make_aware(value)
+        return django_timezone.localtime(value)
+
+    @staticmethod
+    def _calendar() -> Calendar:
+        cal = Calendar()
+        cal.add('prodid', ICSService.PRODID)
+        cal.add('version', '2.0')
+        return cal
 
     @staticmethod
     def create_response(ics_content: bytes, filename: str = None) -> HttpResponse:
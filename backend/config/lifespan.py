@@ -0,0 +1,53 @@
+# config/lifespan.py
+import logging
+from asgiref.sync import sync_to_async
+
+logger = logging.getLogger(__name__)
+
+
+class LifespanApp:
+    """
+    ASGI lifespan handler for process-wide resources
+
+    Optionally warms up the shared services (settings.SERVICE_WARMUP) on
+    startup so the first request does not pay for loading spaCy or the LLM
+    clients. Closes the pooled HTTP sessions and LLM clients on shutdown so
+    keep-alive connections are released cleanly instead of being reported
+    as unclosed.
+    """
+
+    async def __call__(self, scope, receive, send):
+        while True:
+            message = await receive()
+
+            if message['type'] == 'lifespan.startup':
+                await self._warm_up()
+                await send({'type': 'lifespan.startup.complete'})
+
+            elif message['type'] == 'lifespan.shutdown':
+                # Imported lazily: app modules need Django to be set up first
+                from events.services.http_session import close_session_pools
+                from events.services.llm_clients import close_llm_clients
+
+                try:
+                    await close_session_pools()
+                except Exception as e:
+                    logger.error(f"Failed to close HTTP sessions on shutdown: {str(e)}")
+                await close_llm_clients()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _warm_up(self):
+        from django.conf import settings
+
+        config = getattr(settings, 'SERVICE_WARMUP', {})
+        if not config.get('enabled'):
+            return
+
+        # Imported lazily: app modules need Django to be set up first
+        from events.services.registry import get_service_registry
+
+        loaded = await sync_to_async(get_service_registry().warm_up, thread_sensitive=False)(
+            config.get('services')
+        )
+        logger.info(f"Warmed up services: {', '.join(loaded) or 'none'}")
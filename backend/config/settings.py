@@ -140,7 +140,146 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 OLLAMA_CONFIG = {
     'base_url': 'http://localhost:11434',  # Default Ollama server URL
     'default_model': 'llama3.2',  # Default model to use
-    'timeout': 30,  # Request timeout in seconds
+    'timeout': 30,  # Request (and socket read) timeout in seconds
+    'connect_timeout': 5,  # Connection establishment timeout in seconds
+    'pool_size': 100,  # Max open connections in the shared session
+    'pool_size_per_host': 10,  # Max open connections per Ollama host
+    'keepalive_timeout': 30,  # Seconds an idle connection is kept alive
+    'keep_alive': '30m',  # How long the server keeps the model (and the cached prompt prefix) loaded
+}
+
+# Shared OpenAI/Anthropic clients (one connection pool per provider and event loop)
+LLM_CLIENT = {
+    'timeout': 60,  # Request timeout in seconds
+    'connect_timeout': 5,  # Connection establishment timeout in seconds
+    'max_retries': 2,  # SDK retries on connection errors, 429s and 5xxs
+    'pool_size': 100,  # Max open connections per provider client
+    'pool_size_per_host': 20,  # Max idle keep-alive connections per provider client
+    'keepalive_timeout': 30,  # Seconds an idle connection is kept alive
+}
+
+# Failover and hedging across cloud providers for create-from-text parses
+PROVIDER_ROUTER = {
+    'providers': ['openai', 'anthropic'],  # Failover order; the configured provider always goes first ('ollama' may be added)
+    'budget': 30,  # Seconds a parse may take across all providers
+    'hedge': True,  # Start the next provider when the current one is slower than usual
+    'hedge_quantile': 0.9,  # Latency quantile after which a request is hedged
+    'hedge_delay': 5,  # Hedge delay in seconds until min_samples latencies are known
+    'min_samples': 20,  # Successful calls needed before the observed quantile is used
+    'latency_window': 200,  # Recent latencies kept per provider
+}
+
+# Per-provider circuit breaker and AIMD concurrency limit around parse calls (/llm/status/)
+LLM_CIRCUIT_BREAKER = {
+    'enabled': True,
+    'window_size': 20,  # Recent calls the failure rate is computed over
+    'min_calls': 10,  # Calls in the window before the breaker may open
+    'failure_rate': 0.5,  # Share of failed or slow calls that opens the breaker
+    'slow_call_seconds': 20,  # Calls slower than this count as failures
+    'open_seconds': 30,  # Seconds calls are rejected before a half-open probe
+    'half_open_calls': 1,  # Concurrent probes allowed while half-open
+    'min_limit': 1,  # Adaptive concurrency floor (starts at LLM_CONCURRENCY)
+    'max_limit': 64,  # Adaptive concurrency ceiling
+    'backoff_ratio': 0.5,  # Limit multiplier after a failed or slow call
+    'queue_timeout': 10,  # Seconds a call waits for a slot before failing fast
+}
+
+# Client-side token buckets per provider (or '<provider>/<model>'), sized below the account's limits
+LLM_RATE_LIMITS = {
+    'enabled': True,
+    'max_wait': 20,  # Seconds a call may queue for the bucket before failing over
+    'chars_per_token': 4,  # Prompt length to token estimate
+    'output_tokens': 1000,  # Output budget counted against tokens/min per call
+    'limits': {
+        'openai': {'requests_per_minute': 500, 'tokens_per_minute': 200000},
+        'anthropic': {'requests_per_minute': 50, 'tokens_per_minute': 40000},
+    },
+}
+
+# Max concurrent in-flight parse calls per provider (per process)
+LLM_CONCURRENCY = {
+    'openai': 8,
+    'anthropic': 4,
+    'ollama': 2,
+}
+
+# Batch create-from-text settings
+EVENTS_BATCH = {
+    'max_texts': 500,  # Max texts accepted by one batch request
+}
+
+# LLM parse-result cache (in-process LRU backed by the ParseCacheEntry table)
+LLM_PARSE_CACHE = {
+    'enabled': True,
+    'memory_max_entries': 512,  # Entries kept in each process's LRU tier
+    'db_enabled': True,  # Persist entries so they survive restarts and are shared
+    'db_max_entries': 10000,  # Least recently used entries beyond this are evicted
+    'db_evict_interval': 100,  # DB writes between sweeps of expired and excess entries
+    'ttl': 86400,  # Seconds before a cached parse expires
+}
+
+# Full-text event search (FTS5 on SQLite, tsvector/GIN on Postgres; icontains elsewhere)
+SEARCH_INDEX = {
+    'enabled': True,
+    'result_limit': 5,  # Results per type returned by global search
+    'snippet_words': 12,  # Approximate length of result snippets
+}
+
+# In-process typeahead index behind /autocomplete/
+AUTOCOMPLETE = {
+    'enabled': True,
+    'default_limit': 8,  # Suggestions returned when no limit is given
+    'max_limit': 25,  # Upper bound on the limit query parameter
+    'max_age': 300,  # Seconds before the index is rebuilt in the background to pick up other processes' writes
+}
+
+# Calendar range queries (/events/range/)
+RANGE_QUERY = {
+    'max_days': 366,  # Longest window a single request may cover
+    'max_events': 5000,  # Events returned per window before the response is truncated
+    'max_event_days': 31,  # Longest single event range queries look back for
+}
+
+# Overlap checks on create-from-text responses and /events/conflicts/
+CONFLICT_DETECTION = {
+    'enabled': True,
+    'max_conflicts': 1000,  # Pairs reported per check before the result is truncated
+}
+
+# Free/busy computation (/events/free-busy/)
+FREE_BUSY = {
+    'default_duration': 60,  # Minutes of busy time assumed for events without an end
+    'min_slot': 30,  # Default shortest free slot reported, in minutes
+}
+
+# Services built during ASGI lifespan startup instead of on the first request
+SERVICE_WARMUP = {
+    'enabled': os.getenv('SERVICE_WARMUP', 'false').lower() == 'true',
+    'services': ['events', 'llm', 'nlp'],  # Registry names (see events/services/registry.py)
+}
+
+# spaCy pipeline used by NLPService
+NLP_CONFIG = {
+    'model': 'en_core_web_sm',
+    'exclude': ['lemmatizer'],  # Pipeline components NLPService never reads
+    'batch_size': 64,  # Texts per nlp.pipe batch in parse_events_batch
+    'n_process': 1,  # Worker processes for nlp.pipe (>1 forks the pipeline)
+}
+
+# Rule-based parsing tried before the LLM (requires spaCy's en_core_web_sm model)
+NLP_FAST_PATH = {
+    'enabled': True,
+    'confidence_threshold': 0.8,  # Rule-based parses scoring below this go to the LLM
+    'fallback_threshold': 0.3,  # Lower bar used while every LLM provider's circuit is open
+}
+
+# Background processing of create-from-text jobs (see `manage.py run_event_workers`)
+EVENTS_JOB_QUEUE = {
+    'workers': 4,  # Concurrent async workers per process
+    'poll_interval': 1.0,  # Seconds to wait when the queue is empty
+    'lease_timeout': 300,  # Seconds before a running job is considered abandoned
+    'max_attempts': 3,  # Attempts before an abandoned job is marked failed
+    'enqueue_by_default': False,  # Queue create-from-text requests unless told otherwise
 }
 
 # Rest Framework settings
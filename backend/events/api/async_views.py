@@ -0,0 +1,402 @@
+# events/api/async_views.py
+"""
+Async-native versions of the events API endpoints that wait on LLM calls
+or the Ollama server.
+
+These are plain Django async views (DRF 3.14 views are sync-only), so under
+ASGI they run on the event loop instead of a threadpool. Responses keep the
+same envelopes as their DRF counterparts in views.py.
+"""
+import json
+import logging
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+from rest_framework import status
+from ..models import EventsGroup
+from ..services.events_service import EventsServiceError, EventsGroupNotFound
+from ..services.job_queue import get_queue_config
+from ..services.ollama_service import OllamaService
+from ..services.registry import get_events_service
+from ..services.search_index import get_search_index
+from ..services.conflicts import find_conflicts_for_events
+from ..services.circuit_breaker import get_provider_guard
+from ..services.provider_router import get_latency_tracker, get_router_config
+from ..services.rate_limit import rate_limiter_status
+from ..services.coalescing import get_request_coalescer
+from ..services.autocomplete import get_autocomplete_index, get_autocomplete_config
+from .serializers import EventSerializer, EventsGroupSerializer
+from .views import EventsGroupViewSet, search_querysets, format_search_results, indexed_search_results
+
+logger = logging.getLogger(__name__)
+
+# Process-wide instance; its LLM, Ollama and NLP services load on first use
+events_service = get_events_service()
+
+# Non-GET methods on a group detail URL still go through the DRF viewset
+events_group_detail_sync = EventsGroupViewSet.as_view({
+    'put': 'update',
+    'patch': 'partial_update',
+    'delete': 'destroy',
+})
+
+
+def _success(data=None, status_code=status.HTTP_200_OK):
+    """JSON equivalent of utils.success_response"""
+    response_data = {'success': True}
+    if data is not None:
+        response_data['data'] = data
+    return JsonResponse(response_data, status=status_code, safe=False)
+
+
+def _error(message, code, status_code=status.HTTP_400_BAD_REQUEST):
+    """JSON error envelope matching the events group views"""
+    return JsonResponse({
+        'success': False,
+        'error': {
+            'message': message,
+            'code': code
+        }
+    }, status=status_code)
+
+
+def _error_response(message, status_code=status.HTTP_400_BAD_REQUEST):
+    """JSON equivalent of utils.error_response"""
+    return JsonResponse({
+        'success': False,
+        'error': {
+            'message': str(message),
+            'status_code': status_code
+        }
+    }, status=status_code)
+
+
+def _parse_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() == 'true'
+
+
+def _request_data(request) -> dict:
+    """Read a JSON or form-encoded request body"""
+    if request.content_type == 'application/json':
+        return json.loads(request.body or b'{}')
+    return request.POST.dict()
+
+
+async def _serialize_group(group: EventsGroup) -> dict:
+    """Reload a group with its events prefetched and serialize it"""
+    group = await events_service.aget_events_group(group.id)
+    return EventsGroupSerializer(group).data
+
+
+@csrf_exempt
+@require_POST
+async def create_from_text(request):
+    """Create event(s) from natural language text."""
+    try:
+        try:
+            data = _request_data(request)
+        except (ValueError, UnicodeDecodeError):
+            return _error('Invalid JSON body', 'INVALID_BODY')
+
+        text = str(data.get('text', '')).strip()
+        use_llm = _parse_bool(data.get('use_llm', True))
+        enqueue = _parse_bool(data.get('enqueue', get_queue_config()['enqueue_by_default']))
+
+        if not text:
+            return _error('Text is required', 'MISSING_TEXT')
+
+        if enqueue:
+            # Queue the text for background workers and return immediately
+            group = await sync_to_async(events_service.enqueue_events_from_text)(text, use_llm)
+            return _success({
+                'group': await _serialize_group(group),
+                'event': None,
+                'multiple_events': False,
+                'queued': True
+            }, status_code=status.HTTP_202_ACCEPTED)
+
+        group = await events_service.acreate_events_from_text(text, use_llm)
+        group_data = await _serialize_group(group)
+        events = group_data['events']
+        conflicts = await sync_to_async(find_conflicts_for_events)([event['id'] for event in events])
+
+        return _success({
+            'group': group_data,
+            'event': events[0] if events else None,
+            'multiple_events': len(events) > 1,
+            'conflicts': conflicts
+        }, status_code=status.HTTP_201_CREATED)
+
+    except EventsServiceError as e:
+        logger.error(f"Failed to create event from text: {str(e)}")
+        return _error(str(e), 'EVENT_CREATION_ERROR')
+
+    except Exception as e:
+        logger.error(f"Unexpected error in create_from_text: {str(e)}")
+        return _error(
+            'An unexpected error occurred',
+            'INTERNAL_ERROR',
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@csrf_exempt
+@require_POST
+async def create_from_texts(request):
+    """
+    Create one events group per text for a batch of texts.
+
+    Texts are parsed concurrently within the provider's concurrency limit.
+    Per-text success or error is reported in a single response.
+    """
+    try:
+        try:
+            data = _request_data(request)
+        except (ValueError, UnicodeDecodeError):
+            return _error('Invalid JSON body', 'INVALID_BODY')
+
+        texts = data.get('texts')
+        use_llm = _parse_bool(data.get('use_llm', True))
+        max_texts = getattr(settings, 'EVENTS_BATCH', {}).get('max_texts', 500)
+
+        if not isinstance(texts, list) or not texts:
+            return _error('texts must be a non-empty list', 'MISSING_TEXTS')
+        if len(texts) > max_texts:
+            return _error(
+                f'A batch may contain at most {max_texts} texts',
+                'BATCH_TOO_LARGE'
+            )
+
+        results = await events_service.acreate_events_from_texts(texts, use_llm)
+        succeeded = sum(1 for result in results if result['success'])
+
+        return _success({
+            'results': results,
+            'total': len(results),
+            'succeeded': succeeded,
+            'failed': len(results) - succeeded
+        })
+
+    except Exception as e:
+        logger.error(f"Unexpected error in create_from_texts: {str(e)}")
+        return _error(
+            'An unexpected error occurred',
+            'INTERNAL_ERROR',
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+def _sse(event: str, data) -> str:
+    """Format a server-sent event frame"""
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+async def _stream_created_events(group: EventsGroup, text: str, use_llm: bool):
+    """Yield SSE frames for each event as it is parsed and saved"""
+    yield _sse('group', {'id': group.id, 'use_llm': group.use_llm})
+
+    count = 0
+    try:
+        async for event in events_service.astream_events_from_text(group, text, use_llm):
+            count += 1
+            event_data = await sync_to_async(lambda: EventSerializer(event).data)()
+            yield _sse('event', event_data)
+
+        yield _sse('done', {'group_id': group.id, 'event_count': count})
+
+    except EventsServiceError as e:
+        logger.error(f"Failed to stream events from text: {str(e)}")
+        yield _sse('error', {
+            'group_id': group.id,
+            'event_count': count,
+            'message': str(e),
+            'code': 'EVENT_CREATION_ERROR'
+        })
+
+
+@csrf_exempt
+@require_POST
+async def create_from_text_stream(request):
+    """
+    Create event(s) from natural language text, streaming them over SSE.
+
+    Emits a `group` frame, one `event` frame per saved event as the model
+    generates it, then `done` (or `error`).
+    """
+    try:
+        data = _request_data(request)
+    except (ValueError, UnicodeDecodeError):
+        return _error('Invalid JSON body', 'INVALID_BODY')
+
+    text = str(data.get('text', '')).strip()
+    use_llm = _parse_bool(data.get('use_llm', True))
+
+    if not text:
+        return _error('Text is required', 'MISSING_TEXT')
+
+    try:
+        group = await events_service.acreate_pending_group(use_llm)
+    except Exception as e:
+        logger.error(f"Unexpected error in create_from_text_stream: {str(e)}")
+        return _error(
+            'An unexpected error occurred',
+            'INTERNAL_ERROR',
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    response = StreamingHttpResponse(
+        _stream_created_events(group, text, use_llm),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # Stop proxies from buffering the stream
+    return response
+
+
+@csrf_exempt
+async def events_group_detail(request, pk):
+    """Get a single events group with all related data"""
+    if request.method != 'GET':
+        return await sync_to_async(events_group_detail_sync)(request, pk=str(pk))
+
+    try:
+        group = await events_service.aget_events_group(pk)
+
+        return _success(EventsGroupSerializer(group).data)
+
+    except EventsGroupNotFound:
+        return _error(
+            f'Events group {pk} not found',
+            'GROUP_NOT_FOUND',
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+
+    except Exception as e:
+        logger.error(f"Error retrieving events group {pk}: {str(e)}")
+        return _error(
+            'Failed to retrieve events group',
+            'RETRIEVAL_ERROR',
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@require_GET
+async def events_group_status(request, pk):
+    """Get group processing status."""
+    try:
+        group = await events_service.aget_events_group(pk)
+        job = group.job if hasattr(group, 'job') else None
+
+        return _success({
+            'processing_complete': group.processing_complete,
+            'processing_error': group.processing_error,
+            'job_status': job.status if job else None,
+            'events': EventSerializer(group.events.all(), many=True).data
+        })
+    except EventsServiceError as e:
+        logger.error(f"Failed to retrieve group status: {str(e)}")
+        return _error_response(str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+
+@require_GET
+async def global_search(request):
+    """Global search endpoint for events and attendees."""
+    try:
+        query = request.GET.get('q', '')
+        if not query or len(query) < 2:  # Minimum 2 characters for search
+            return _success([])
+
+        if get_search_index().available:
+            return _success(await sync_to_async(indexed_search_results)(query))
+
+        events_qs, attendees_qs = search_querysets(query)
+        events = [event async for event in events_qs]
+        attendees = [attendee async for attendee in attendees_qs]
+
+        return _success(format_search_results(events, attendees))
+
+    except Exception as e:
+        logger.error(f"Search error: {str(e)}")
+        return _error_response('Failed to perform search', status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@require_GET
+async def autocomplete(request):
+    """Typeahead suggestions from the in-process prefix index."""
+    try:
+        query = request.GET.get('q', '')
+        config = get_autocomplete_config()
+        try:
+            limit = int(request.GET.get('limit', config['default_limit']))
+        except ValueError:
+            return _error_response('limit must be an integer')
+        limit = max(1, min(limit, config['max_limit']))
+
+        if not query.strip() or not config['enabled']:
+            return _success({'query': query, 'suggestions': []})
+
+        index = get_autocomplete_index()
+        if not index.is_built:
+            await sync_to_async(index.build)()
+        elif not index.is_fresh:
+            # This request is served from the current index while the rebuild runs
+            index.refresh_in_background()
+
+        return _success({'query': query, 'suggestions': index.suggest(query, limit)})
+
+    except Exception as e:
+        logger.error(f"Autocomplete error: {str(e)}")
+        return _error_response('Failed to load suggestions', status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@require_GET
+async def llm_status(request):
+    """Circuit breaker state, concurrency limit, latency and rate limits per LLM provider"""
+    try:
+        latency = get_latency_tracker().stats()
+        providers = {}
+        for provider in get_router_config()['providers'] + ['ollama']:
+            providers[provider] = {
+                **get_provider_guard(provider).status(),
+                'latency': latency.get(provider),
+            }
+        return _success({
+            'providers': providers,
+            'rate_limits': rate_limiter_status(),
+            'coalesced_requests': get_request_coalescer().coalesced,
+        })
+
+    except Exception as e:
+        logger.error(f"Failed to get LLM provider status: {str(e)}")
+        return _error_response(str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@require_GET
+async def check_ollama_status(request):
+    """Check Ollama server connectivity"""
+    try:
+        base_url = request.GET.get('base_url', 'http://localhost:11434')
+        is_connected = await OllamaService(base_url=base_url).check_connectivity()
+        return _success({'is_connected': is_connected})
+
+    except Exception as e:
+        logger.error(f"Failed to check Ollama status: {str(e)}")
+        return _error_response(str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@require_GET
+async def get_ollama_models(request):
+    """Get available Ollama models"""
+    try:
+        base_url = request.GET.get('base_url', 'http://localhost:11434')
+        models = await OllamaService(base_url=base_url).get_available_models()
+        return _success({'models': models})
+
+    except Exception as e:
+        logger.error(f"Failed to get Ollama models: {str(e)}")
+        return _error_response(str(e), status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,154 @@
+# events/api/pagination.py
+import base64
+import json
+from collections import OrderedDict
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination on the queryset's sort field with an id tiebreak
+
+    Each page is fetched with a `WHERE (field, id) > (last value, last id)`
+    condition instead of an OFFSET, so deep pages cost the same as the
+    first one when (field, id) is indexed. The total count is only computed
+    when the client asks for it with `count=true`.
+
+    The view must order its queryset by exactly one of `keyset_fields`
+    (optionally descending); `id` is appended as the tiebreak.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    count_query_param = 'count'
+    max_page_size = 200
+    keyset_fields = ('start_datetime', 'created_at', 'title')
+
+    def __init__(self, page_size=None):
+        self.page_size = page_size or settings.REST_FRAMEWORK.get('PAGE_SIZE', 20)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self._get_page_size(request)
+        self.field, self.descending = self._get_ordering(queryset)
+        cursor = self._decode_cursor(queryset.model, request.query_params.get(self.cursor_query_param))
+
+        # COUNT(*) scans every matching row, so it is opt-in
+        self.count = queryset.count() if request.query_params.get(self.count_query_param) == 'true' else None
+
+        reverse = bool(cursor and cursor.get('r'))
+
+        # Walk backwards for a previous page, then restore display order
+        descending = self.descending != reverse
+        prefix = '-' if descending else ''
+        queryset = queryset.order_by(f'{prefix}{self.field}', f'{prefix}id')
+        if cursor:
+            queryset = queryset.filter(self._after(cursor['v'], cursor['id'], descending))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.page = rows
+        self.has_next = has_more if not reverse else bool(cursor)
+        self.has_previous = bool(cursor) if not reverse else has_more
+        return rows
+
+    def get_paginated_response(self, data):
+        response = OrderedDict()
+        if self.count is not None:
+            response['count'] = self.count
+        response['next'] = self.get_next_link()
+        response['previous'] = self.get_previous_link()
+        response['results'] = data
+        return Response(response)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def _link(self, row, reverse):
+        cursor = {'v': self._value(row), 'id': str(row.pk)}
+        if reverse:
+            cursor['r'] = 1
+        encoded = base64.urlsafe_b64encode(json.dumps(cursor).encode('utf-8')).decode('ascii')
+        url = remove_query_param(self.base_url, 'page')
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def _value(self, row):
+        value = getattr(row, self.field)
+        return value.isoformat() if hasattr(value, 'isoformat') else value
+
+    def _after(self, value, row_id, descending):
+        lookup = 'lt' if descending else 'gt'
+        return (
+            Q(**{f'{self.field}__{lookup}': value}) |
+            Q(**{self.field: value, f'id__{lookup}': row_id})
+        )
+
+    def _get_ordering(self, queryset):
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        field = ordering[0] if len(ordering) == 1 and isinstance(ordering[0], str) else None
+        if field is None or field.lstrip('-') not in self.keyset_fields:
+            raise ValidationError({
+                'sort': f"Cursor pagination supports sorting by {', '.join(self.keyset_fields)}"
+            })
+        return field.lstrip('-'), field.startswith('-')
+
+    def _get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def _decode_cursor(self, model, encoded):
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            cursor['v'] = model._meta.get_field(self.field).to_python(cursor['v'])
+            cursor['id'] = model._meta.pk.to_python(cursor['id'])
+            return cursor
+        except (TypeError, ValueError, KeyError, UnicodeError, DjangoValidationError):
+            raise ValidationError({self.cursor_query_param: 'Invalid cursor'})
+
+
+class EventsPagination(PageNumberPagination):
+    """
+    Page-number pagination unless the client opts in to keyset pagination
+
+    Requests with a `cursor` parameter, or `pagination=cursor` for the
+    first page, are paginated by KeysetPagination; everything else keeps
+    the page/count response the history view relies on.
+    """
+
+    def __init__(self):
+        self.keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if 'cursor' in params or params.get('pagination') == 'cursor':
+            self.keyset = KeysetPagination()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
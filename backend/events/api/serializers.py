@@ -1,6 +1,8 @@
 # events/api/serializers.py
 from rest_framework import serializers
 from events.models import Event, Attendee, EventNote, EventsGroup
+from events.services.recurrence import RecurrenceError, get_recurrence_config, normalize_rrule, occurrences
+from django.utils import timezone
 from datetime import datetime, timedelta
 
 class AttendeeSerializer(serializers.ModelSerializer):
@@ -26,6 +28,7 @@ class EventNoteSerializer(serializers.ModelSerializer):
 class EventSerializer(serializers.ModelSerializer):
     attendees = AttendeeSerializer(many=True, required=False)
     notes = EventNoteSerializer(many=False, required=False, read_only=True)
+    occurrences = serializers.SerializerMethodField()
     
     class Meta:
         model = Event
@@ -33,7 +36,31 @@ class EventSerializer(serializers.ModelSerializer):
             'id', 'group', 'title', 'start_datetime', 'end_datetime',
             'location', 'venue', 'attendees', 'notes', 'created_at', 'updated_at', 
             'original_text', 'processing_complete', 'processing_error',
-            'suggestions'
+            'suggestions', 'rrule', 'recurrence_end', 'occurrences'
+        ]
+        read_only_fields = ['recurrence_end']
+
+    def validate_rrule(self, value):
+        try:
+            return normalize_rrule(value)
+        except RecurrenceError as e:
+            raise serializers.ValidationError(str(e))
+
+    def get_occurrences(self, obj):
+        """
+        Occurrences of a recurring event inside the `occurrence_window`
+        context, (start, end), defaulting to the next list_window_days days
+        """
+        if not obj.rrule:
+            return None
+        window = self.context.get('occurrence_window')
+        if window is None:
+            now = timezone.now()
+            window = (now, now + timedelta(days=get_recurrence_config()['list_window_days']))
+        field = serializers.DateTimeField()
+        return [
+            {'start_datetime': field.to_representation(start), 'end_datetime': field.to_representation(end)}
+            for start, end in occurrences(obj.rrule, obj.start_datetime, obj.end_datetime, *window)
         ]
 
     def validate(self, data):
@@ -5,10 +5,8 @@ from .views import (
     EventViewSet,
     EventsGroupViewSet,
     llm_config_view,
-    global_search,
-    get_ollama_models,
-    check_ollama_status,
 )
+from . import async_views
 
 # Create versioned routers
 v1_router = DefaultRouter()
@@ -20,9 +18,27 @@ v1_patterns = [
 
     # Create from text endpoint
     path('groups/create-from-text/', 
-         EventsGroupViewSet.as_view({'post': 'create_from_text'}),
+         async_views.create_from_text,
          name='events-create-from-text'),
 
+    # Batch create from text endpoint
+    path('groups/create-from-texts/', 
+         async_views.create_from_texts,
+         name='events-create-from-texts'),
+
+    # Streaming (SSE) variant of create from text
+    path('groups/create-from-text/stream/', 
+         async_views.create_from_text_stream,
+         name='events-create-from-text-stream'),
+
+    # Async group detail/status endpoints (take precedence over the router)
+    path('groups/<uuid:pk>/', 
+         async_views.events_group_detail,
+         name='events-group-detail-async'),
+    path('groups/<uuid:pk>/status/', 
+         async_views.events_group_status,
+         name='events-group-status-async'),
+
     # Router URLs
     path('', include(v1_router.urls)),
     
@@ -30,11 +46,15 @@ v1_patterns = [
     path('llm-config/', llm_config_view, name='llm-config'),
     
     # Search endpoint - only need one pattern
-    path('search/', global_search, name='global-search'),
+    path('search/', async_views.global_search, name='global-search'),
+    path('autocomplete/', async_views.autocomplete, name='autocomplete'),
+
+    # LLM provider health (circuit breakers, concurrency limits, latency)
+    path('llm/status/', async_views.llm_status, name='llm-status'),
 
     # Ollama endpoints
-    path('ollama/models/', get_ollama_models, name='ollama-models'),
-    path('ollama/status/', check_ollama_status, name='ollama-status'),
+    path('ollama/models/', async_views.get_ollama_models, name='ollama-models'),
+    path('ollama/status/', async_views.check_ollama_status, name='ollama-status'),
     
 ]
 
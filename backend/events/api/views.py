@@ -16,15 +16,21 @@ from .serializers import (
     EventsGroupSerializer
 )
 from ..services.events_service import EventsService, EventsServiceError
+from ..services.registry import get_events_service
+from ..services.search_index import get_search_index
+from ..services.parse_cache import get_parse_cache
+from ..services.conflicts import find_conflicts
+from ..services.free_busy import compute_free_busy
+from ..services.recurrence import get_recurrence_config
+from ..services.time_range import RangeQueryError, COMPACT_FIELDS, compact_events, parse_range
 from ..services.llm_config import LLMConfig
 from .utils import error_response, success_response
+from .pagination import EventsPagination
 from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
-from django.utils.decorators import method_decorator
-from django.views.decorators.csrf import csrf_exempt
-from ..services.ollama_service import OllamaService
 from rest_framework.renderers import JSONRenderer
-from asgiref.sync import async_to_sync
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.core.handlers.asgi import ASGIRequest
+from asgiref.sync import sync_to_async
 from calendars.services.ics_service import ICSService
 from rest_framework.decorators import renderer_classes,action
 from calendars.renderers import ICSRenderer
@@ -32,6 +38,9 @@ from rest_framework.renderers import JSONRenderer
 
 logger = logging.getLogger(__name__)
 
+# Events read per query (with their notes and attendees) when streaming ICS exports
+ICS_EXPORT_CHUNK_SIZE = 500
+
 class EventsGroupViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing Events Groups.
@@ -40,14 +49,24 @@ class EventsGroupViewSet(viewsets.ModelViewSet):
     """
     serializer_class = EventsGroupSerializer
     queryset = EventsGroup.objects.all()
-    events_service = EventsService()
     parser_classes = (JSONParser, FormParser, MultiPartParser)
+    pagination_class = EventsPagination
+
+    @property
+    def events_service(self) -> EventsService:
+        # Shared per process and built on first request, not at URL import
+        return get_events_service()
+
+    # Actions whose responses nest each group's events, attendees and notes
+    serialized_actions = {'list', 'update', 'partial_update'}
 
     def get_queryset(self):
         """
         Get filtered and sorted queryset for events groups
         """
         queryset = EventsGroup.objects.all()
+        if self.action in self.serialized_actions:
+            queryset = queryset.with_events()
         
         # Apply filters if they exist
         queryset = self._apply_filters(
@@ -94,10 +113,16 @@ class EventsGroupViewSet(viewsets.ModelViewSet):
     def _apply_filters(self, queryset, search_term, status_filter, event_type):
         """Apply filters to events group queryset."""
         if search_term:
-            queryset = queryset.filter(
-                Q(events__title__icontains=search_term) |
-                Q(events__location__icontains=search_term)
-            ).distinct()
+            index = get_search_index()
+            if index.available:
+                queryset = queryset.filter(id__in=Event.objects.filter(
+                    id__in=index.matching_event_ids(search_term)
+                ).values('group_id'))
+            else:
+                queryset = queryset.filter(
+                    Q(events__title__icontains=search_term) |
+                    Q(events__location__icontains=search_term)
+                ).distinct()
 
         if status_filter:
             status_mapping = {
@@ -115,102 +140,16 @@ class EventsGroupViewSet(viewsets.ModelViewSet):
 
         return queryset
 
-    def retrieve(self, request, pk=None):
-        """Get a single events group with all related data"""
-        try:
-            group = self.events_service.get_events_group(pk)
-            
-            # Get related events with attendees and notes
-            events = group.events.all()
-            
-            return Response({
-                'success': True,
-                'data': {
-                    'id': group.id,
-                    'created_at': group.created_at,
-                    'updated_at': group.updated_at,
-                    'use_llm': group.use_llm,
-                    'processing_complete': group.processing_complete,
-                    'processing_error': group.processing_error,
-                    'events': EventSerializer(events, many=True).data
-                }
-            })
-            
-        except EventsGroup.DoesNotExist:
-            return Response({
-                'success': False,
-                'error': {
-                    'message': f'Events group {pk} not found',
-                    'code': 'GROUP_NOT_FOUND'
-                }
-            }, status=status.HTTP_404_NOT_FOUND)
-            
-        except Exception as e:
-            logger.error(f"Error retrieving events group {pk}: {str(e)}")
-            return Response({
-                'success': False,
-                'error': {
-                    'message': 'Failed to retrieve events group',
-                    'code': 'RETRIEVAL_ERROR'
-                }
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    @method_decorator(csrf_exempt)
-    @action(detail=False, methods=['post'])
-    def create_from_text(self, request):
-        """Create event(s) from natural language text."""
-        try:
-            # Validate request data
-            data = request.data
-            text = data.get('text', '').strip()
-            use_llm = data.get('use_llm', True)
-            
-            if not isinstance(use_llm, bool):
-                use_llm = str(use_llm).lower() == 'true'
-                
-            if not text:
-                return Response({
-                    'success': False,
-                    'error': {
-                        'message': 'Text is required',
-                        'code': 'MISSING_TEXT'
-                    }
-                }, status=status.HTTP_400_BAD_REQUEST)
-
-            # Create event group and process text
-            group = self.events_service.create_events_from_text(text, use_llm)
-            first_event = group.events.first()
-            multiple_events = group.events.count() > 1
-
-            return Response({
-                'success': True,
-                'data': {
-                    'group': EventsGroupSerializer(group).data,
-                    'event': EventSerializer(first_event).data if first_event else None,
-                    'multiple_events': multiple_events
-                }
-            }, status=status.HTTP_201_CREATED)
+    @action(detail=True, methods=['get'], url_path='export_ics', url_name='export-ics')
+    def export_ics(self, request, pk=None):
+        """Stream all events in the group as one ICS calendar"""
+        group = self.get_object()
+        return ics_stream_response(
+            request,
+            Event.objects.filter(group=group).order_by('start_datetime', 'id'),
+            f'group-{group.id}.ics'
+        )
 
-        except EventsServiceError as e:
-            logger.error(f"Failed to create event from text: {str(e)}")
-            return Response({
-                'success': False,
-                'error': {
-                    'message': str(e),
-                    'code': 'EVENT_CREATION_ERROR'
-                }
-            }, status=status.HTTP_400_BAD_REQUEST)
-                
-        except Exception as e:
-            logger.error(f"Unexpected error in create_from_text: {str(e)}")
-            return Response({
-                'success': False,
-                'error': {
-                    'message': 'An unexpected error occurred',
-                    'code': 'INTERNAL_ERROR'
-                }
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-                
     def destroy(self, request, *args, **kwargs):
         """
         Delete an events group and all its events.
@@ -233,25 +172,6 @@ class EventsGroupViewSet(viewsets.ModelViewSet):
                 'error': {'message': 'An unexpected error occurred'}
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    @action(detail=True, methods=['get'])
-    def status(self, request, pk=None):
-        """
-        Get group processing status.
-        Handled synchronously via EventsService.
-        """
-        try:
-            group = self.events_service.get_events_group(pk)
-            events = group.events.all()
-            
-            return success_response({
-                'processing_complete': group.processing_complete,
-                'processing_error': group.processing_error,
-                'events': EventSerializer(events, many=True).data
-            })
-        except EventsServiceError as e:
-            logger.error(f"Failed to retrieve group status: {str(e)}")
-            return error_response(str(e), status_code=status.HTTP_400_BAD_REQUEST)
-
 class EventViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing individual events.
@@ -259,6 +179,10 @@ class EventViewSet(viewsets.ModelViewSet):
     """
     serializer_class = EventSerializer
     queryset = Event.objects.all()
+    pagination_class = EventsPagination
+
+    # Actions whose responses nest attendees and notes
+    serialized_actions = {'list', 'retrieve', 'update', 'partial_update', 'status', 'download_ics'}
 
     def get_queryset(self):
         """
@@ -266,6 +190,8 @@ class EventViewSet(viewsets.ModelViewSet):
         Handled synchronously.
         """
         queryset = Event.objects.all()
+        if self.action in self.serialized_actions:
+            queryset = queryset.with_details()
         
         # Apply filters
         queryset = self._apply_filters(
@@ -295,25 +221,35 @@ class EventViewSet(viewsets.ModelViewSet):
 
         # Apply search if provided
         if search_term:
-            queryset = queryset.filter(
-                Q(title__icontains=search_term) |
-                Q(location__icontains=search_term) |
-                Q(venue__icontains=search_term) |
-                Q(attendees__name__icontains=search_term)
-            ).distinct()
-
-        # Apply date filters
+            index = get_search_index()
+            if index.available:
+                queryset = queryset.filter(id__in=index.matching_event_ids(search_term))
+            else:
+                queryset = queryset.filter(
+                    Q(title__icontains=search_term) |
+                    Q(location__icontains=search_term) |
+                    Q(venue__icontains=search_term) |
+                    Q(attendees__name__icontains=search_term)
+                ).distinct()
+
+        # Apply date filters as half-open ranges on the raw column so they
+        # can use the start_datetime indexes ([day start, next day start))
         if date_from:
             try:
-                date_from = datetime.strptime(date_from, '%Y-%m-%d')
-                queryset = queryset.filter(start_datetime__date__gte=date_from)
+                day_start = self._day_start(date_from)
+                # Series that began earlier still have occurrences from day_start on
+                queryset = queryset.filter(
+                    Q(start_datetime__gte=day_start) | Q(recurrence_end__gt=day_start) |
+                    (Q(recurrence_end__isnull=True) & ~Q(rrule=''))
+                )
             except ValueError:
                 logger.warning(f"Invalid date_from format: {date_from}")
 
         if date_to:
             try:
-                date_to = datetime.strptime(date_to, '%Y-%m-%d')
-                queryset = queryset.filter(start_datetime__date__lte=date_to)
+                queryset = queryset.filter(
+                    start_datetime__lt=self._day_start(date_to) + timedelta(days=1)
+                )
             except ValueError:
                 logger.warning(f"Invalid date_to format: {date_to}")
 
@@ -342,6 +278,36 @@ class EventViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def get_serializer_context(self):
+        """Expand recurring events over the date_from/date_to window when one is given"""
+        context = super().get_serializer_context()
+        window = self._occurrence_window(
+            self.request.query_params.get('date_from'),
+            self.request.query_params.get('date_to')
+        )
+        if window:
+            context['occurrence_window'] = window
+        return context
+
+    def _occurrence_window(self, date_from, date_to):
+        if not date_from and not date_to:
+            return None
+        try:
+            start = self._day_start(date_from) if date_from else timezone.now()
+            end = (
+                self._day_start(date_to) + timedelta(days=1) if date_to
+                else start + timedelta(days=get_recurrence_config()['list_window_days'])
+            )
+        except ValueError:
+            return None
+        return start, end
+
+    @staticmethod
+    def _day_start(value):
+        """Midnight at the start of a YYYY-MM-DD date in the current timezone"""
+        day = datetime.strptime(value, '%Y-%m-%d')
+        return timezone.make_aware(day) if settings.USE_TZ else day
+
     def _apply_sorting(self, queryset, sort_field, sort_order):
         """Apply sorting to queryset synchronously."""
         valid_sort_fields = {
@@ -350,7 +316,8 @@ class EventViewSet(viewsets.ModelViewSet):
             'created_at': 'created_at',
             'location': 'location',
             'status': 'processing_complete',
-            'date': 'start_datetime__date'
+            # Same day order as start_datetime__date, but can use the index
+            'date': 'start_datetime'
         }
 
         if sort_field in valid_sort_fields:
@@ -363,6 +330,93 @@ class EventViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    @action(detail=False, methods=['get'], url_path='range', url_name='range')
+    def in_range(self, request):
+        """
+        Every event overlapping [start, end), for agenda and calendar views
+
+        Rows are arrays in `fields` order rather than serialized events, so
+        a month or year view stays small and needs a single query.
+        """
+        try:
+            start, end = parse_range(request.query_params.get('start'), request.query_params.get('end'))
+        except RangeQueryError as e:
+            return error_response(str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        queryset = Event.objects.all()
+        group_id = request.query_params.get('group')
+        if group_id:
+            queryset = queryset.filter(group_id=group_id)
+
+        events, truncated = compact_events(queryset.order_by('start_datetime', 'end_datetime'), start, end)
+        return Response({
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'fields': COMPACT_FIELDS,
+            'events': events,
+            'truncated': truncated,
+        })
+
+    @action(detail=False, methods=['get'])
+    def conflicts(self, request):
+        """Every pair of overlapping events within [start, end)"""
+        try:
+            start, end = parse_range(request.query_params.get('start'), request.query_params.get('end'))
+        except RangeQueryError as e:
+            return error_response(str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        queryset = Event.objects.all()
+        group_id = request.query_params.get('group')
+        if group_id:
+            queryset = queryset.filter(group_id=group_id)
+
+        conflicts, truncated = find_conflicts(start, end, queryset)
+        return Response({
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'count': len(conflicts),
+            'conflicts': conflicts,
+            'truncated': truncated,
+        })
+
+    @action(detail=False, methods=['get'], url_path='free-busy', url_name='free-busy')
+    def free_busy(self, request):
+        """
+        Merged busy blocks and free slots within [start, end)
+
+        Optional `attendee` (name or email) limits busy time to that person's
+        events; `min_length` is the shortest free slot to report, in minutes,
+        and cannot exceed the window.
+        """
+        try:
+            start, end = parse_range(request.query_params.get('start'), request.query_params.get('end'))
+        except RangeQueryError as e:
+            return error_response(str(e), status_code=status.HTTP_400_BAD_REQUEST)
+
+        min_length = request.query_params.get('min_length')
+        if min_length is not None:
+            # No free slot can be longer than the window itself
+            max_minutes = int((end - start).total_seconds() // 60)
+            try:
+                min_length = int(min_length)
+            except ValueError:
+                return error_response("'min_length' must be a number of minutes", status_code=status.HTTP_400_BAD_REQUEST)
+            if not 0 <= min_length <= max_minutes:
+                return error_response(
+                    f"'min_length' must be between 0 and {max_minutes} minutes",
+                    status_code=status.HTTP_400_BAD_REQUEST
+                )
+            min_length = timedelta(minutes=min_length)
+
+        attendee = request.query_params.get('attendee', '').strip() or None
+        result = compute_free_busy(start, end, attendee=attendee, min_length=min_length)
+        return Response({
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'attendee': attendee,
+            **result,
+        })
+
     @action(detail=True, methods=['post'])
     def add_note(self, request, pk=None):
         """Add note to event synchronously."""
@@ -428,6 +482,14 @@ class EventViewSet(viewsets.ModelViewSet):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
         
+    @action(detail=False, methods=['get'], url_path='export_ics', url_name='export-ics')
+    def export_ics(self, request):
+        """
+        Stream every event matching the list filters (group, search,
+        date_from/date_to, status, ...) as one ICS calendar
+        """
+        return ics_stream_response(request, self.get_queryset(), 'events.ics')
+
     @action(
         detail=True,
         methods=['get'],
@@ -437,38 +499,7 @@ class EventViewSet(viewsets.ModelViewSet):
     def download_ics(self, request, pk=None):
         try:
             event = self.get_object()
-            
-            # Build description with both notes and suggestions
-            description = []
-            
-            # Add notes if they exist
-            if hasattr(event, 'notes') and event.notes.content:
-                description.append("Notes:")
-                description.append(event.notes.content)
-                description.append("\n")
-                
-            # Add suggestions if they exist
-            if event.suggestions:
-                description.append("Suggestions:")
-                # Handle both string and list formats of suggestions
-                if isinstance(event.suggestions, str):
-                    suggestions = event.suggestions.split('\n')
-                else:
-                    suggestions = event.suggestions
-                    
-                description.extend([f"- {suggestion.strip()}" for suggestion in suggestions])
-                
-            # Join all parts with newlines
-            full_description = "\n".join(description)
-            
-            event_data = {
-                'title': event.title,
-                'start_datetime': event.start_datetime,
-                'end_datetime': event.end_datetime,
-                'description': full_description,
-                'location': event.location,
-                'attendees': [{'email': attendee.email} for attendee in event.attendees.all()],
-            }
+            event_data = ics_event_data(event)
             
             ics_content = ICSService.create_ics_event(event_data)
             
@@ -488,6 +519,66 @@ class EventViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+def ics_event_data(event: Event) -> dict:
+    """ICSService event data for an event, with notes and suggestions as the description"""
+    # Build description with both notes and suggestions
+    description = []
+    
+    # Add notes if they exist
+    if hasattr(event, 'notes') and event.notes.content:
+        description.append("Notes:")
+        description.append(event.notes.content)
+        description.append("\n")
+        
+    # Add suggestions if they exist
+    if event.suggestions:
+        description.append("Suggestions:")
+        # Handle both string and list formats of suggestions
+        if isinstance(event.suggestions, str):
+            suggestions = event.suggestions.split('\n')
+        else:
+            suggestions = event.suggestions
+            
+        description.extend([f"- {suggestion.strip()}" for suggestion in suggestions])
+        
+    return {
+        'id': event.id,
+        'title': event.title,
+        'start_datetime': event.start_datetime,
+        'end_datetime': event.end_datetime,
+        'description': "\n".join(description),
+        'location': event.location,
+        'attendees': [{'email': attendee.email} for attendee in event.attendees.all()],
+        'rrule': event.rrule,
+    }
+
+
+def ics_stream_response(request, queryset, filename: str) -> StreamingHttpResponse:
+    """
+    Stream events as an ICS calendar without loading them all at once
+
+    Events are read with a chunked iterator that prefetches notes and
+    attendees per chunk, and written out in batches of VEVENTs. Under ASGI
+    the chunks are produced in the sync thread one at a time, because
+    Django would otherwise read a synchronous iterator to the end before
+    sending anything.
+    """
+    events = queryset.with_details().iterator(chunk_size=ICS_EXPORT_CHUNK_SIZE)
+    chunks = ICSService.stream_calendar(ics_event_data(event) for event in events)
+    if isinstance(getattr(request, '_request', request), ASGIRequest):
+        chunks = _iterate_in_thread(chunks)
+
+    response = StreamingHttpResponse(chunks, content_type='text/calendar; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+async def _iterate_in_thread(iterator):
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    done = object()
+    while (chunk := await next_chunk(iterator, done)) is not done:
+        yield chunk
+
 @api_view(['GET'])
 def llm_config_view(request):
     """Return LLM configuration settings synchronously."""
@@ -495,122 +586,98 @@ def llm_config_view(request):
         config = LLMConfig()
         return success_response({
             'provider': config.provider,
-            'config': config.config
+            'config': config.config,
+            'parse_cache': get_parse_cache().stats()
         })
     except Exception as e:
         logger.error(f"Failed to retrieve LLM config: {str(e)}")
         return error_response('Failed to retrieve LLM config', status_code=500)
 
-@api_view(['GET'])
-def global_search(request):
+def indexed_search_results(query):
     """
-    Global search endpoint for events and attendees.
-    Handled synchronously.
+    Ranked global search results from the full-text index
+    
+    Events come first, best match first, with a snippet of the matching
+    text; attendees whose names or emails match follow.
     """
-    try:
-        query = request.query_params.get('q', '')
-        if not query or len(query) < 2:  # Minimum 2 characters for search
-            return success_response([])
-
-        # Regular synchronous queries
-        events = Event.objects.filter(
-            Q(title__icontains=query) |
-            Q(location__icontains=query) |
-            Q(venue__icontains=query)
-        ).values(
-            'id', 
-            'title', 
-            'location', 
-            'original_text', 
-            'notes__content'
-        )[:5]
-        
-        attendees = Attendee.objects.filter(
-            Q(name__icontains=query) |
-            Q(email__icontains=query)
-        ).select_related('event').values(
-            'id',
-            'name',
-            'email',
-            'event__id',
-            'event__title'
-        )[:5]
-        
-        results = []
-        
-        # Format event results
-        for event in events:
-            snippet = (
-                event.get('notes__content', '')[:100] if event.get('notes__content')
-                else event.get('original_text', '')[:100] if event.get('original_text')
-                else ''
-            )
-            results.append({
-                'id': f'event_{event["id"]}',
-                'type': 'event',
-                'title': event['title'],
-                'url': f'/events/{event["id"]}',
-                'snippet': snippet
-            })
-        
-        # Format attendee results
-        for attendee in attendees:
-            results.append({
-                'id': f'attendee_{attendee["id"]}',
-                'type': 'attendee',
-                'title': attendee['name'],
-                'url': f'/events/{attendee["event__id"]}',
-                'snippet': f'Attendee of {attendee["event__title"]}'
-            })
-        
-        return success_response(results)
-        
-    except Exception as e:
-        logger.error(f"Search error: {str(e)}")
-        return error_response(
-            'Failed to perform search',
-            status_code=500
-        )
-
-@api_view(['GET'])
-@renderer_classes([JSONRenderer])
-def check_ollama_status(request):
-    """Check Ollama server connectivity"""
-    try:
-        base_url = request.GET.get('base_url', 'http://localhost:11434')
-        ollama_service = OllamaService(base_url=base_url)
-        
-        # Use sync_to_async to call the async method
-        is_connected = async_to_sync(ollama_service.check_connectivity)()
-        
-        return success_response({
-            'is_connected': is_connected
+    index = get_search_index()
+    results = [
+        {
+            'id': f'event_{hit["event_id"]}',
+            'type': 'event',
+            'title': hit['title'],
+            'url': f'/events/{hit["event_id"]}',
+            'snippet': hit['snippet'],
+            'rank': hit['rank']
+        }
+        for hit in index.search(query)
+    ]
+    
+    for attendee in index.search_attendees(query):
+        results.append({
+            'id': f'attendee_{attendee.id}',
+            'type': 'attendee',
+            'title': attendee.name,
+            'url': f'/events/{attendee.event_id}',
+            'snippet': f'Attendee of {attendee.event.title}'
         })
-        
-    except Exception as e:
-        logger.error(f"Failed to check Ollama status: {str(e)}")
-        return error_response(
-            str(e),
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+    
+    return results
+
+def search_querysets(query):
+    """Build the event and attendee querysets used by global search without an index"""
+    events = Event.objects.filter(
+        Q(title__icontains=query) |
+        Q(location__icontains=query) |
+        Q(venue__icontains=query)
+    ).values(
+        'id', 
+        'title', 
+        'location', 
+        'original_text', 
+        'notes__content'
+    )[:5]
+    
+    attendees = Attendee.objects.filter(
+        Q(name__icontains=query) |
+        Q(email__icontains=query)
+    ).select_related('event').values(
+        'id',
+        'name',
+        'email',
+        'event__id',
+        'event__title'
+    )[:5]
+    
+    return events, attendees
+
+def format_search_results(events, attendees):
+    """Format event and attendee rows into global search results"""
+    results = []
+    
+    # Format event results
+    for event in events:
+        snippet = (
+            event.get('notes__content', '')[:100] if event.get('notes__content')
+            else event.get('original_text', '')[:100] if event.get('original_text')
+            else ''
         )
-
-@api_view(['GET'])
-@renderer_classes([JSONRenderer])
-def get_ollama_models(request):
-    """Get available Ollama models"""
-    try:
-        base_url = request.GET.get('base_url', 'http://localhost:11434')
-        ollama_service = OllamaService(base_url=base_url)
-        
-        # Use sync_to_async to call the async method
-        models = async_to_sync(ollama_service.get_available_models)()
-        
-        return success_response({
-            'models': models
+        results.append({
+            'id': f'event_{event["id"]}',
+            'type': 'event',
+            'title': event['title'],
+            'url': f'/events/{event["id"]}',
+            'snippet': snippet
         })
-    except Exception as e:
-        logger.error(f"Failed to get Ollama models: {str(e)}")
-        return error_response(
-            str(e),
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+    
+    # Format attendee results
+    for attendee in attendees:
+        results.append({
+            'id': f'attendee_{attendee["id"]}',
+            'type': 'attendee',
+            'title': attendee['name'],
+            'url': f'/events/{attendee["event__id"]}',
+            'snippet': f'Attendee of {attendee["event__title"]}'
+        })
+    
+    return results
@@ -0,0 +1,76 @@
+# events/management/commands/benchmark_nlp.py
+import time
+from django.core.management.base import BaseCommand, CommandError
+from events.services.nlp_service import NLPService, get_nlp_config
+
+SAMPLE_INPUTS = [
+    "Lunch with Sarah tomorrow at noon in Cafe X",
+    "Team standup at 9:30am on Monday in the Conference Room",
+    "Dentist appointment on Friday at 3pm",
+    "Call with the Berlin office tomorrow from 10am to 11am",
+    "Dinner with Alex and Jordan at Luigi Restaurant on Saturday at 7pm",
+    "Quarterly review meeting next Tuesday at 2pm in Building 4",
+    "Coffee with Priya at 8am tomorrow at Blue Bottle",
+    "Project kickoff on March 3 at 10am with the design team",
+    "Gym session tonight at 6pm",
+    "Interview with Maria Lopez on Thursday at 11:00am in Room 204",
+    "Flight to Chicago on 2025-07-14 at 6:45am",
+    "Parent-teacher conference on Wednesday at 4pm at Lincoln Elementary",
+    "Book club at the library on Sunday at 5pm",
+    "Pick up dry cleaning tomorrow at 5:30pm",
+    "Board meeting on the 12th at 9am in the Main Hall",
+    "Brunch with Sam and Taylor on Sunday at 11am at The Corner Cafe",
+]
+
+
+class Command(BaseCommand):
+    help = "Benchmark NLPService throughput (docs/second), one at a time versus nlp.pipe batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=50,
+            help="Times the sample corpus is repeated"
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help="nlp.pipe batch size (defaults to NLP_CONFIG['batch_size'])"
+        )
+        parser.add_argument(
+            '--n-process',
+            type=int,
+            default=None,
+            help="nlp.pipe worker processes (defaults to NLP_CONFIG['n_process'])"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            service = NLPService(batch_size=options['batch_size'], n_process=options['n_process'])
+        except OSError as e:
+            raise CommandError(f"Could not load spaCy model '{get_nlp_config()['model']}': {str(e)}")
+
+        texts = SAMPLE_INPUTS * max(1, options['repeat'])
+        self.stdout.write(
+            f"Parsing {len(texts)} texts (batch_size={service.batch_size}, n_process={service.n_process})"
+        )
+
+        # Load lazily initialised state (vectors, dateparser locales) outside the timings
+        service.parse_events_batch(SAMPLE_INPUTS)
+
+        started = time.perf_counter()
+        for text in texts:
+            service.parse_event(text)
+        single_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        service.parse_events_batch(texts)
+        batch_elapsed = time.perf_counter() - started
+
+        single_rate = len(texts) / single_elapsed
+        batch_rate = len(texts) / batch_elapsed
+        self.stdout.write(f"parse_event:        {single_rate:10.1f} docs/s ({single_elapsed:.2f}s)")
+        self.stdout.write(f"parse_events_batch: {batch_rate:10.1f} docs/s ({batch_elapsed:.2f}s)")
+        self.stdout.write(self.style.SUCCESS(f"Speed-up: {batch_rate / single_rate:.2f}x"))
@@ -0,0 +1,70 @@
+# events/management/commands/benchmark_startup.py
+import json
+import os
+import statistics
+import subprocess
+import sys
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+HEAVY_MODULES = ['spacy', 'openai', 'anthropic', 'dateparser']
+
+# Runs in a fresh interpreter so every import is cold
+IMPORT_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+import config.urls
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    'seconds': elapsed,
+    'loaded': [name for name in %r if name in sys.modules],
+}))
+"""
+
+
+class Command(BaseCommand):
+    help = "Benchmark cold import time of config.urls in fresh interpreters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=5,
+            help="Number of fresh interpreters to time"
+        )
+
+    def handle(self, *args, **options):
+        env = {
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'),
+        }
+        script = IMPORT_SCRIPT % (HEAVY_MODULES,)
+        config_dir = os.path.dirname(os.path.abspath(sys.modules[settings.SETTINGS_MODULE].__file__))
+
+        timings = []
+        loaded = []
+        for _ in range(max(1, options['runs'])):
+            result = subprocess.run(
+                [sys.executable, '-c', script],
+                cwd=os.path.dirname(config_dir),
+                env=env,
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                raise CommandError(f"Import of config.urls failed:\n{result.stderr}")
+            sample = json.loads(result.stdout.strip().splitlines()[-1])
+            timings.append(sample['seconds'])
+            loaded = sample['loaded']
+
+        self.stdout.write(
+            f"Cold import of config.urls over {len(timings)} runs: "
+            f"median {statistics.median(timings) * 1000:.0f}ms, "
+            f"min {min(timings) * 1000:.0f}ms, max {max(timings) * 1000:.0f}ms"
+        )
+        if loaded:
+            self.stdout.write(self.style.WARNING(f"Heavy modules imported eagerly: {', '.join(loaded)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS("No heavy modules imported at startup"))
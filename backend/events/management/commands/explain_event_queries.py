@@ -0,0 +1,100 @@
+# events/management/commands/explain_event_queries.py
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+from events.api.views import EventViewSet
+from events.models import Event, EventsGroup
+
+LOCATIONS = ['Room 101', 'Room 204', 'Main Hall', 'Cafe X', 'Library', None]
+
+
+class _Rollback(Exception):
+    pass
+
+
+def event_query_shapes(group_id=None):
+    """
+    The filter/sort combinations EventViewSet issues, built through the
+    viewset's own _apply_filters/_apply_sorting
+
+    Returns:
+        List of (name, queryset) pairs
+    """
+    view = EventViewSet()
+    today = timezone.localdate().isoformat()
+
+    def build(group=None, date_from=None, date_to=None, status_filter=None, sort='start_datetime', order='desc'):
+        queryset = view._apply_filters(
+            Event.objects.all(), group, None, date_from, date_to, None, status_filter
+        )
+        return view._apply_sorting(queryset, sort, order)
+
+    shapes = [
+        ('list by start_datetime', build()),
+        ('list by created_at', build(sort='created_at')),
+        ('list by title', build(sort='title', order='asc')),
+        ('list by location', build(sort='location', order='asc')),
+        ('date range', build(date_from=today, date_to=today)),
+        ('pending by start_datetime', build(status_filter='pending')),
+    ]
+    if group_id is not None:
+        shapes.append(('group by start_datetime', build(group=str(group_id))))
+    return shapes
+
+
+def seed_events(count, batch_size=5000):
+    """Bulk insert count events spread over two years across 1000 groups"""
+    groups = EventsGroup.objects.bulk_create([EventsGroup() for _ in range(max(1, min(1000, count // 10)))])
+    start = timezone.now() - timedelta(days=365)
+    minutes = 2 * 365 * 24 * 60
+    for offset in range(0, count, batch_size):
+        Event.objects.bulk_create([
+            Event(
+                group=groups[index % len(groups)],
+                title=f'Meeting {index % 997}',
+                start_datetime=start + timedelta(minutes=(index * 7919) % minutes),
+                location=LOCATIONS[index % len(LOCATIONS)],
+                processing_complete=index % 10 != 0,
+            )
+            for index in range(offset, min(offset + batch_size, count))
+        ], batch_size=batch_size)
+    return groups[0]
+
+
+def explain(queryset, limit=20):
+    """The database's query plan for the first page of a queryset"""
+    return queryset[:limit].explain()
+
+
+class Command(BaseCommand):
+    help = "Seed events inside a rolled-back transaction and print query plans for the event list filters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1_000_000,
+            help="Number of events to seed (rolled back afterwards)"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                started = time.perf_counter()
+                group = seed_events(options['rows'])
+                if connection.vendor in ('sqlite', 'postgresql'):
+                    with connection.cursor() as cursor:
+                        cursor.execute('ANALYZE')
+                self.stdout.write(f"Seeded {options['rows']} events in {time.perf_counter() - started:.1f}s")
+
+                for name, queryset in event_query_shapes(group.id):
+                    started = time.perf_counter()
+                    list(queryset[:20])
+                    elapsed = (time.perf_counter() - started) * 1000
+                    self.stdout.write(self.style.MIGRATE_HEADING(f"{name} ({elapsed:.1f}ms)"))
+                    self.stdout.write(explain(queryset))
+                raise _Rollback()
+        except _Rollback:
+            self.stdout.write("Rolled back seeded rows")
@@ -0,0 +1,230 @@
+# events/management/commands/measure_prompt_cache.py
+import asyncio
+import math
+import time
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from events.management.commands.benchmark_nlp import SAMPLE_INPUTS
+from events.services.llm_config import LLMConfig
+from events.services.llm_service import LLMService, LLMServiceError
+from events.services.loop_pools import close_loop_pools
+from events.services.prompts import ANTHROPIC_SYSTEM_PROMPT, OPENAI_SYSTEM_PROMPT, parse_request_text
+from events.services.rate_limit import estimate_tokens
+from events.services.registry import get_ollama_service
+
+# The prompt as it was sent before the instructions moved into a cacheable
+# system prefix: everything inline in the user message, with the date first
+INLINE_PROMPT = """Please parse the following text into one or more events and return the result as JSON.
+
+    Today is {date} ({weekday}).
+
+    The text may contain multiple events. Please analyze and identify if multiple events are described.
+
+    If an event repeats (e.g. "every Monday", "daily for two weeks"), return it once, dated at its first occurrence, with a "recurrence" rule instead of one event per occurrence.
+
+    Return your response as a JSON object with the following structure:
+    {{
+        "is_multi_event": boolean,  # True if multiple events detected
+        "events": [  # Array of events (even for single event)
+            {{
+                "title": string (required),
+                "start_date": "YYYY-MM-DD" (required),
+                "start_time": "HH:MM" 24-hour format (required),
+                "end_date": "YYYY-MM-DD" (if not provided, use start_date),
+                "end_time": "HH:MM" 24-hour format (if not provided, start_time + 1 hour),
+                "location": string (optional),
+                "venue": string (optional),
+                "attendees": [
+                    {{
+                        "name": string,
+                        "email": string (optional)
+                    }}
+                ],
+                "notes": string (optional - special instructions/reminders),
+                "recurrence": string (optional - RFC 5545 RRULE such as "FREQ=WEEKLY;BYDAY=MO;UNTIL=20250630" if the event repeats),
+                "suggestions": array of strings (1-2 helpful suggestions) (required)
+            }}
+        ]
+    }}
+
+    Text to parse: {text}
+
+    Remember to return only valid JSON matching the above structure."""
+
+LAYOUTS = ['inline', 'split']
+
+# Not part of the corpus, so the timed calls all see the same warm state
+WARMUP_TEXT = "Warm-up call at 9am tomorrow"
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure prompt tokens, cached prompt tokens and latency of the event-parsing prompt, "
+        "inlined in the user message (before) versus split into a cacheable static prefix (after)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--provider',
+            choices=['openai', 'anthropic', 'ollama'],
+            default=None,
+            help="Provider to call (defaults to the provider in llm_config.json)"
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=1,
+            help="Times the sample corpus is repeated"
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help="Only estimate prompt sizes from the text, without calling the provider"
+        )
+
+    def handle(self, *args, **options):
+        provider = options['provider'] or LLMConfig().provider
+        try:
+            service = get_ollama_service() if provider == 'ollama' else LLMService(provider=provider)
+        except LLMServiceError as e:
+            raise CommandError(str(e))
+
+        texts = SAMPLE_INPUTS * max(1, options['repeat'])
+        if options['dry_run']:
+            self._estimate(provider, service, texts)
+            return
+
+        self.stdout.write(f"Calling {provider}/{service.model} with {len(texts)} texts per layout")
+        results = asyncio.run(self._measure(provider, service, texts))
+        for layout in LAYOUTS:
+            self._report(provider, layout, results[layout])
+
+    def _request(self, provider, service, layout, text):
+        """Request arguments for text in the given layout"""
+        today = datetime.now().date()
+        if layout == 'split':
+            request_text = parse_request_text(text, today)
+            if provider == 'openai':
+                return service._openai_request(request_text)
+            if provider == 'anthropic':
+                return service._anthropic_request(request_text)
+            return service._generate_request(request_text, stream=False)
+
+        prompt = INLINE_PROMPT.format(date=today.strftime('%Y-%m-%d'), weekday=today.strftime('%A'), text=text)
+        if provider == 'openai':
+            return {
+                'model': service.model,
+                'messages': [
+                    {"role": "system", "content": OPENAI_SYSTEM_PROMPT},
+                    {"role": "user", "content": f"Return JSON. {prompt}"}
+                ],
+                'temperature': 0.1,
+                'response_format': { "type": "json_object" }
+            }
+        if provider == 'anthropic':
+            return {
+                'model': service.model,
+                'max_tokens': 1000,
+                'temperature': 0.1,
+                'system': ANTHROPIC_SYSTEM_PROMPT,
+                'messages': [{"role": "user", "content": f"Return the following as JSON. {prompt}"}]
+            }
+        return {"model": service.model, "prompt": prompt, "stream": False, "format": "json"}
+
+    def _estimate(self, provider, service, texts):
+        """Estimated prompt tokens per call, and how many of them come before anything that varies"""
+        self.stdout.write(f"Estimated prompt tokens for {provider}/{service.model} ({len(texts)} texts)")
+        for layout in LAYOUTS:
+            sizes = []
+            prefixes = []
+            for text in texts:
+                prompt = self._prompt_text(self._request(provider, service, layout, text))
+                sizes.append(estimate_tokens(prompt, output_tokens=0))
+                # Everything before the date is identical from call to call
+                prefixes.append(estimate_tokens(prompt[:prompt.index('Today is')], output_tokens=0))
+            self.stdout.write(
+                f"{layout:>6}: {sum(sizes) / len(sizes):7.0f} tokens/call, "
+                f"{min(prefixes)} of them a static prefix, {sum(sizes)} in total"
+            )
+
+    @staticmethod
+    def _prompt_text(request):
+        if 'messages' in request:
+            system = request.get('system', '')
+            if isinstance(system, list):
+                system = ''.join(block['text'] for block in system)
+            return system + ''.join(message['content'] for message in request['messages'])
+        return request.get('system', '') + request['prompt']
+
+    async def _measure(self, provider, service, texts):
+        try:
+            results = {}
+            for layout in LAYOUTS:
+                # Loads the model (Ollama) and writes the prefix to the cache, outside the timings
+                await self._call(provider, service, self._request(provider, service, layout, WARMUP_TEXT))
+                samples = []
+                for text in texts:
+                    samples.append(
+                        await self._call(provider, service, self._request(provider, service, layout, text))
+                    )
+                results[layout] = samples
+            return results
+        except Exception as e:
+            raise CommandError(f"{provider} call failed: {str(e)}")
+        finally:
+            await close_loop_pools()
+
+    async def _call(self, provider, service, request):
+        """
+        One call straight to the provider, bypassing the parse cache and coalescing
+
+        Returns:
+            Dict of latency (seconds), prompt_tokens and cached_tokens; for
+            Ollama, prompt_tokens counts only the tokens it had to evaluate
+        """
+        started = time.perf_counter()
+        if provider == 'openai':
+            response = await service.client.chat.completions.create(**request)
+            usage = response.usage
+            details = getattr(usage, 'prompt_tokens_details', None)
+            prompt_tokens = usage.prompt_tokens
+            cached_tokens = getattr(details, 'cached_tokens', None) or 0
+        elif provider == 'anthropic':
+            response = await service.client.messages.create(**request)
+            usage = response.usage
+            cached_tokens = getattr(usage, 'cache_read_input_tokens', None) or 0
+            prompt_tokens = (
+                usage.input_tokens + cached_tokens + (getattr(usage, 'cache_creation_input_tokens', None) or 0)
+            )
+        else:
+            session = service.session_pool.get_session()
+            async with session.post(f"{service.base_url}/api/generate", json=request) as response:
+                if response.status != 200:
+                    raise LLMServiceError(f"Ollama API returned status {response.status}")
+                result = await response.json()
+            prompt_tokens = result.get('prompt_eval_count', 0)
+            cached_tokens = 0
+        return {
+            'latency': time.perf_counter() - started,
+            'prompt_tokens': prompt_tokens,
+            'cached_tokens': cached_tokens,
+        }
+
+    def _report(self, provider, layout, samples):
+        latencies = [sample['latency'] for sample in samples]
+        prompt_tokens = sum(sample['prompt_tokens'] for sample in samples)
+        cached_tokens = sum(sample['cached_tokens'] for sample in samples)
+        tokens_label = 'evaluated prompt tokens' if provider == 'ollama' else 'prompt tokens'
+        line = (
+            f"{layout:>6}: {prompt_tokens / len(samples):7.0f} {tokens_label}/call, "
+            f"p50 {_percentile(latencies, 0.5) * 1000:.0f}ms, p90 {_percentile(latencies, 0.9) * 1000:.0f}ms"
+        )
+        if provider != 'ollama':
+            share = cached_tokens / prompt_tokens if prompt_tokens else 0.0
+            line += f", {cached_tokens / len(samples):.0f} cached/call ({share:.0%})"
+        self.stdout.write(line)
@@ -0,0 +1,21 @@
+# events/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand, CommandError
+from events.services.search_index import SearchIndex, SearchIndexError
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text event search index from the event tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--database',
+            default='default',
+            help="Database alias whose index is rebuilt"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            SearchIndex(using=options['database']).rebuild()
+        except SearchIndexError as e:
+            raise CommandError(str(e))
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt"))
@@ -0,0 +1,42 @@
+# events/management/commands/run_event_workers.py
+import asyncio
+import signal
+from django.core.management.base import BaseCommand
+from events.services.job_queue import JobWorkerPool
+from events.services.loop_pools import close_loop_pools
+
+
+class Command(BaseCommand):
+    help = "Run background workers that parse queued create-from-text jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help="Number of concurrent workers (defaults to EVENTS_JOB_QUEUE['workers'])"
+        )
+        parser.add_argument(
+            '--drain',
+            action='store_true',
+            help="Exit once the queue is empty instead of polling forever"
+        )
+
+    def handle(self, *args, **options):
+        pool = JobWorkerPool(workers=options['workers'])
+        asyncio.run(self._run(pool, options['drain']))
+        self.stdout.write(self.style.SUCCESS("Event workers stopped"))
+
+    async def _run(self, pool: JobWorkerPool, drain: bool):
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, pool.stop)
+            except NotImplementedError:
+                # Signal handlers are not available on Windows event loops
+                pass
+        try:
+            await pool.run(drain=drain)
+        finally:
+            # The pools are bound to this loop, which ends with the command
+            await close_loop_pools()
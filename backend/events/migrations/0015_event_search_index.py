@@ -0,0 +1,35 @@
+# Generated by Django 5.1.3 on 2026-10-16 12:00
+
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    from events.services.search_index import get_backend
+
+    backend = get_backend(schema_editor.connection)
+    if backend is None:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        backend.create_table(cursor)
+        backend.refresh(cursor)
+
+
+def drop_search_index(apps, schema_editor):
+    from events.services.search_index import get_backend
+
+    backend = get_backend(schema_editor.connection)
+    if backend is None:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        backend.drop_table(cursor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0014_parsecacheentry'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.3 on 2026-10-16 23:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0015_event_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_datetime', 'id'], name='events_even_start_d_9bec45_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['created_at', 'id'], name='events_even_created_cdb609_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['title', 'id'], name='events_even_title_070597_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventsgroup',
+            index=models.Index(fields=['created_at', 'id'], name='events_even_created_875bc2_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-16 23:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0016_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['group', 'start_datetime'], name='events_even_group_i_e66a47_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['processing_complete', 'start_datetime'], name='events_even_process_ff56b8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['location'], name='events_even_locatio_0ae1f4_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.3 on 2026-10-17 00:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0019_event_recurrence'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('rrule__gt', '')), fields=['start_datetime'], name='event_series_start_idx'),
+        ),
+    ]
@@ -3,6 +3,18 @@ from django.db import models
 import uuid
 from typing import List, Dict, Optional
 
+class EventsGroupQuerySet(models.QuerySet):
+    def with_events(self) -> 'EventsGroupQuerySet':
+        """Prefetch events with their notes and attendees, as EventsGroupSerializer nests them"""
+        return self.prefetch_related(
+            models.Prefetch('events', queryset=Event.objects.with_details())
+        )
+
+class EventQuerySet(models.QuerySet):
+    def with_details(self) -> 'EventQuerySet':
+        """Load notes (joined) and attendees (one extra query), as EventSerializer nests them"""
+        return self.select_related('notes').prefetch_related('attendees')
+
 class EventsGroup(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -11,11 +23,17 @@ class EventsGroup(models.Model):
     processing_complete = models.BooleanField(default=False)    
     processing_error = models.TextField(blank=True)
 
+    objects = EventsGroupQuerySet.as_manager()
+
     def __str__(self):
         return f"Events Group {self.id} - {self.created_at}"
     
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # Keyset pagination: (sort field, id) matches the cursor condition
+            models.Index(fields=['created_at', 'id']),
+        ]
     
     async def get_events(self) -> List['Event']:
         """Get all events for this group"""
@@ -53,6 +71,10 @@ class Event(models.Model):
     venue = models.CharField(max_length=255, blank=True, null=True)
     suggestions = models.TextField(blank=True, null=True)  # Suggestions for the event.
 
+    # Recurrence: an RFC 5545 RRULE expanded lazily (see services/recurrence.py)
+    rrule = models.CharField(max_length=255, blank=True, default='')
+    recurrence_end = models.DateTimeField(blank=True, null=True)  # End of the last occurrence; null if endless
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -60,11 +82,40 @@ class Event(models.Model):
     processing_complete = models.BooleanField(default=False)
     processing_error = models.TextField(blank=True)
 
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         ordering = ['start_datetime']
+        indexes = [
+            # Keyset pagination: (sort field, id) matches the cursor condition
+            models.Index(fields=['start_datetime', 'id']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['title', 'id']),
+            # Filter + sort shapes used by EventViewSet
+            models.Index(fields=['group', 'start_datetime']),
+            models.Index(fields=['processing_complete', 'start_datetime']),
+            models.Index(fields=['location']),
+            # Overlap queries for calendar ranges (see services/time_range.py)
+            models.Index(fields=['start_datetime', 'end_datetime']),
+            # Only rows with a rule, so series lookups stay small however much history there is
+            models.Index(fields=['start_datetime'], condition=models.Q(rrule__gt=''), name='event_series_start_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} on {self.start_datetime.date()} at {self.start_datetime.time()}"
+
+    def save(self, *args, **kwargs):
+        self.update_recurrence_end()
+        super().save(*args, **kwargs)
+
+    def update_recurrence_end(self) -> None:
+        """Recompute recurrence_end from the rule (bulk_create callers must call this)"""
+        from .services.recurrence import series_end
+        self.recurrence_end = series_end(self.rrule, self.start_datetime, self.end_datetime) if self.rrule else None
+
+    @property
+    def is_recurring(self) -> bool:
+        return bool(self.rrule)
     
     async def get_attendees(self) -> List['Attendee']:
         """Get all attendees for this event"""
@@ -89,3 +140,52 @@ class EventNote(models.Model):
 
     def __str__(self):
         return f"Note for {self.event.title} - {self.created_at}"
+
+
+class ProcessingJob(models.Model):
+    """Queued text-to-events parsing work for an EventsGroup"""
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    group = models.OneToOneField(EventsGroup, related_name='job', on_delete=models.CASCADE)
+    text = models.TextField()
+    use_llm = models.BooleanField(default=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Job {self.id} ({self.status}) for group {self.group_id}"
+
+
+class ParseCacheEntry(models.Model):
+    """Persistent tier of the LLM parse-result cache"""
+    key = models.CharField(max_length=64, primary_key=True)  # SHA-256 of the cache key parts
+    provider = models.CharField(max_length=50)
+    model = models.CharField(max_length=100)
+    result = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+    last_accessed = models.DateTimeField(db_index=True)
+    hit_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"Parse cache {self.key[:12]} ({self.provider}/{self.model})"
@@ -0,0 +1,271 @@
+# events/services/autocomplete.py
+from typing import Dict, Any, List, Optional, Tuple
+from bisect import bisect_left, insort
+from django.conf import settings
+from django.db import connections
+from ..models import Event, Attendee
+from .parse_cache import normalize_text
+import heapq
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AUTOCOMPLETE_CONFIG = {
+    'enabled': True,
+    'default_limit': 8,
+    'max_limit': 25,
+    'max_age': 300,
+}
+
+# Suggestion types and the model fields they come from
+EVENT_FIELDS = {'title': 'title', 'location': 'location', 'venue': 'venue'}
+ATTENDEE_FIELDS = {'attendee': 'name', 'email': 'email'}
+
+
+def get_autocomplete_config() -> Dict[str, Any]:
+    """Get autocomplete configuration merged with defaults"""
+    return {**DEFAULT_AUTOCOMPLETE_CONFIG, **getattr(settings, 'AUTOCOMPLETE', {})}
+
+
+def normalize_term(value: str) -> str:
+    return normalize_text(value).casefold()
+
+
+class PrefixIndex:
+    """
+    In-process typeahead index over event titles, locations, venues and
+    attendee names/emails
+
+    Each distinct (type, text) pair is one suggestion, counted once per
+    event or attendee that uses it and stamped with the most recent
+    timestamp seen. Suggestions are reachable from the start of the text
+    and from the start of every later word, through a sorted array of
+    (key, suggestion) pairs searched with bisect.
+
+    The index is built from the database on first use and then updated
+    incrementally from model signals. Other processes' writes are picked
+    up by rebuilding once the index is older than `max_age` seconds; the
+    rebuild runs in the background and lookups keep using the current
+    index until the new one is swapped in.
+    """
+
+    def __init__(self, max_age: Optional[float] = None):
+        config = get_autocomplete_config()
+        self.max_age = max_age if max_age is not None else config['max_age']
+
+        self._keys: List[Tuple[str, Tuple[str, str]]] = []
+        self._suggestions: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._sources: Dict[Tuple[str, Any], List[Tuple[str, str]]] = {}
+        self._built_at: Optional[float] = None
+        # Changes seen while a rebuild reads the database, replayed onto its result
+        self._pending: Optional[List[Tuple[Tuple[str, Any], List[Tuple[str, str]], float]]] = None
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    @property
+    def is_fresh(self) -> bool:
+        """True if the index is built and younger than max_age"""
+        built_at = self._built_at
+        return built_at is not None and (not self.max_age or time.monotonic() - built_at < self.max_age)
+
+    def build(self) -> None:
+        """(Re)build the index from the database, serving the current one until it is done"""
+        with self._build_lock:
+            self._build()
+
+    def refresh_in_background(self) -> bool:
+        """Start a rebuild on a background thread; False if one is already running"""
+        if not self._build_lock.acquire(blocking=False):
+            return False
+        threading.Thread(target=self._background_build, name='autocomplete-rebuild', daemon=True).start()
+        return True
+
+    def _background_build(self) -> None:
+        try:
+            self._build()
+        except Exception as e:
+            logger.error(f"Failed to rebuild autocomplete index: {str(e)}")
+        finally:
+            self._build_lock.release()
+            # This thread's database connection is not reused
+            connections.close_all()
+
+    def _build(self) -> None:
+        started = time.perf_counter()
+        with self._lock:
+            self._pending = []
+        try:
+            events, attendees = self._load()
+            fresh = PrefixIndex(max_age=self.max_age)
+            for row in events:
+                fresh._add_source(('event', row['id']), self._event_terms(row), _timestamp(row['updated_at']))
+            for row in attendees:
+                fresh._add_source(('attendee', row['id']), self._attendee_terms(row), _timestamp(row['event__updated_at']))
+            fresh._keys.sort()
+
+            with self._lock:
+                self._keys, self._suggestions, self._sources = fresh._keys, fresh._suggestions, fresh._sources
+                self._built_at = time.monotonic()
+                for source, terms, seen in self._pending:
+                    self._apply(source, terms, seen)
+        finally:
+            with self._lock:
+                self._pending = None
+
+        logger.info(
+            f"Built autocomplete index with {len(self._suggestions)} suggestions "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+
+    def _load(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        events = list(Event.objects.values('id', 'title', 'location', 'venue', 'updated_at'))
+        attendees = list(Attendee.objects.values('id', 'name', 'email', 'event__updated_at'))
+        return events, attendees
+
+    def suggest(self, prefix: str, limit: int = 8) -> List[Dict[str, Any]]:
+        """
+        Top suggestions starting with prefix (at the start of any word)
+
+        Ranked by how many events/attendees use the text, then by recency.
+        Call build() first; an unbuilt index returns nothing.
+        """
+        prefix = normalize_term(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        with self._lock:
+            # Every key starting with prefix sorts in [prefix, successor) and is ranked
+            start = bisect_left(self._keys, (prefix,))
+            end = bisect_left(self._keys, (prefix[:-1] + chr(ord(prefix[-1]) + 1),), start)
+            matches = {self._keys[position][1] for position in range(start, end)}
+
+            best = heapq.nlargest(
+                limit,
+                (self._suggestions[suggestion_id] for suggestion_id in matches),
+                key=lambda suggestion: (suggestion['count'], suggestion['last_seen'])
+            )
+            return [
+                {'text': suggestion['text'], 'type': suggestion['type'], 'count': suggestion['count']}
+                for suggestion in best
+            ]
+
+    def index_event(self, event: Event) -> None:
+        """Add or update an event's title, location and venue"""
+        self._replace_source(
+            ('event', event.pk),
+            self._event_terms({field: getattr(event, field) for field in EVENT_FIELDS.values()}),
+            _timestamp(event.updated_at)
+        )
+
+    def index_attendee(self, attendee: Attendee) -> None:
+        """Add or update an attendee's name and email"""
+        self._replace_source(
+            ('attendee', attendee.pk),
+            self._attendee_terms({'name': attendee.name, 'email': attendee.email}),
+            time.time()
+        )
+
+    def index_created(self, events: List[Event], attendees: List[Attendee]) -> None:
+        """Index rows written with bulk_create, which sends no signals"""
+        for event in events:
+            self.index_event(event)
+        for attendee in attendees:
+            # Backends that can't return bulk-inserted ids are caught up by the next rebuild
+            if attendee.pk is not None:
+                self.index_attendee(attendee)
+
+    def remove_event(self, event_id: Any) -> None:
+        self._replace_source(('event', event_id), [], 0.0)
+
+    def remove_attendee(self, attendee_id: Any) -> None:
+        self._replace_source(('attendee', attendee_id), [], 0.0)
+
+    def _event_terms(self, row: Dict[str, Any]) -> List[Tuple[str, str]]:
+        return [(kind, row[field]) for kind, field in EVENT_FIELDS.items() if row.get(field)]
+
+    def _attendee_terms(self, row: Dict[str, Any]) -> List[Tuple[str, str]]:
+        return [(kind, row[field]) for kind, field in ATTENDEE_FIELDS.items() if row.get(field)]
+
+    def _replace_source(self, source: Tuple[str, Any], terms: List[Tuple[str, str]], seen: float) -> None:
+        with self._lock:
+            # A rebuild may have read the database before this change
+            if self._pending is not None:
+                self._pending.append((source, terms, seen))
+            # Unbuilt indexes pick the change up from the database when built
+            if self._built_at is None:
+                return
+            self._apply(source, terms, seen)
+
+    def _apply(self, source: Tuple[str, Any], terms: List[Tuple[str, str]], seen: float) -> None:
+        for suggestion_id in self._sources.pop(source, []):
+            self._release(suggestion_id)
+        self._add_source(source, terms, seen, keep_sorted=True)
+
+    def _add_source(
+        self,
+        source: Tuple[str, Any],
+        terms: List[Tuple[str, str]],
+        seen: float,
+        keep_sorted: bool = False
+    ) -> None:
+        contributions = []
+        for kind, text in terms:
+            text = normalize_text(str(text))
+            if not text:
+                continue
+            suggestion_id = (kind, text.casefold())
+            suggestion = self._suggestions.get(suggestion_id)
+            if suggestion is None:
+                suggestion = {'text': text, 'type': kind, 'count': 0, 'last_seen': 0.0}
+                self._suggestions[suggestion_id] = suggestion
+                for key in _prefix_keys(suggestion_id[1]):
+                    if keep_sorted:
+                        insort(self._keys, (key, suggestion_id))
+                    else:
+                        self._keys.append((key, suggestion_id))
+            suggestion['count'] += 1
+            suggestion['last_seen'] = max(suggestion['last_seen'], seen)
+            contributions.append(suggestion_id)
+        if contributions:
+            self._sources[source] = contributions
+
+    def _release(self, suggestion_id: Tuple[str, str]) -> None:
+        suggestion = self._suggestions[suggestion_id]
+        suggestion['count'] -= 1
+        if suggestion['count'] > 0:
+            return
+        del self._suggestions[suggestion_id]
+        for key in _prefix_keys(suggestion_id[1]):
+            position = bisect_left(self._keys, (key, suggestion_id))
+            if position < len(self._keys) and self._keys[position] == (key, suggestion_id):
+                del self._keys[position]
+
+
+def _prefix_keys(term: str) -> List[str]:
+    """The term itself plus its tail from each later word, so any word can be typed first"""
+    words = term.split(' ')
+    return list(dict.fromkeys(' '.join(words[index:]) for index in range(len(words))))
+
+
+def _timestamp(value) -> float:
+    return value.timestamp() if value else 0.0
+
+
+_autocomplete_index: Optional[PrefixIndex] = None
+_autocomplete_index_lock = threading.Lock()
+
+
+def get_autocomplete_index() -> PrefixIndex:
+    """Get the process-wide autocomplete index"""
+    global _autocomplete_index
+    if _autocomplete_index is None:
+        with _autocomplete_index_lock:
+            if _autocomplete_index is None:
+                _autocomplete_index = PrefixIndex()
+    return _autocomplete_index
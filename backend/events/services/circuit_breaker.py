@@ -0,0 +1,311 @@
+# events/services/circuit_breaker.py
+from typing import Dict, Any, Optional, Tuple
+from collections import deque
+from contextlib import asynccontextmanager
+from django.conf import settings
+from .concurrency import get_concurrency_config
+import asyncio
+import logging
+import threading
+import time
+import weakref
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CIRCUIT_BREAKER_CONFIG = {
+    'enabled': True,
+    'window_size': 20,
+    'min_calls': 10,
+    'failure_rate': 0.5,
+    'slow_call_seconds': 20,
+    'open_seconds': 30,
+    'half_open_calls': 1,
+    'min_limit': 1,
+    'max_limit': 64,
+    'backoff_ratio': 0.5,
+    'queue_timeout': 10,
+}
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def get_circuit_breaker_config() -> Dict[str, Any]:
+    """Get circuit breaker and adaptive limit configuration merged with defaults"""
+    return {**DEFAULT_CIRCUIT_BREAKER_CONFIG, **getattr(settings, 'LLM_CIRCUIT_BREAKER', {})}
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker over a provider's recent calls
+
+    Closed: calls go through and their outcomes fill a sliding window; once
+    it holds min_calls and at least failure_rate of them failed (errors or
+    calls slower than slow_call_seconds), the breaker opens. Open: calls are
+    rejected at once for open_seconds. Half-open: up to half_open_calls
+    probes go through; a success closes the breaker, a failure reopens it.
+    """
+
+    def __init__(self, provider: str, config: Dict[str, Any]):
+        self.provider = provider
+        self.config = config
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        # Bumped on every state change; calls carry the generation they were admitted in
+        self.generation = 0
+        self._outcomes: deque = deque(maxlen=config['window_size'])
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> Optional[Tuple[int, bool]]:
+        """
+        Admit a call if it may start now; a half-open breaker admits limited probes
+
+        Returns:
+            Ticket of (generation, is_probe) to pass to record() or release(),
+            or None if the call is rejected
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.config['open_seconds']:
+                    return None
+                self._set_state(HALF_OPEN)
+                self._probes = 0
+                logger.info(f"Circuit for {self.provider} half-open, probing")
+            if self.state == HALF_OPEN:
+                if self._probes >= self.config['half_open_calls']:
+                    return None
+                self._probes += 1
+                return self.generation, True
+            return self.generation, False
+
+    def record(self, success: bool, ticket: Tuple[int, bool]) -> None:
+        """
+        Record the outcome of an admitted call
+
+        Outcomes of calls admitted before the last state change are ignored:
+        a slow call started while closed says nothing about the probes.
+        """
+        generation, probe = ticket
+        with self._lock:
+            if generation != self.generation:
+                return
+            if probe:
+                self._probes = max(0, self._probes - 1)
+                if success:
+                    self._set_state(CLOSED)
+                    self._outcomes.clear()
+                    logger.info(f"Circuit for {self.provider} closed")
+                else:
+                    self._open()
+                return
+
+            self._outcomes.append(success)
+            if len(self._outcomes) >= self.config['min_calls']:
+                if self.failure_rate >= self.config['failure_rate']:
+                    self._open()
+
+    def release(self, ticket: Tuple[int, bool]) -> None:
+        """Give back a probe whose call ended without an outcome (e.g. cancelled)"""
+        generation, probe = ticket
+        with self._lock:
+            if probe and generation == self.generation:
+                self._probes = max(0, self._probes - 1)
+
+    @property
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Seconds until an open breaker admits a probe"""
+        if self.state != OPEN:
+            return None
+        return max(0.0, self.config['open_seconds'] - (time.monotonic() - self.opened_at))
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        self.generation += 1
+
+    def _open(self) -> None:
+        self._set_state(OPEN)
+        self.opened_at = time.monotonic()
+        self._outcomes.clear()
+        logger.warning(f"Circuit for {self.provider} opened for {self.config['open_seconds']}s")
+
+
+class AdaptiveLimit:
+    """
+    AIMD concurrency limit for one provider
+
+    Each fast success raises the limit by 1/limit (about one per round of
+    calls); each failure or slow call multiplies it by backoff_ratio. Calls
+    over the limit wait up to queue_timeout for a slot. Waiting uses an
+    asyncio.Condition, which is bound to one event loop, so one is kept per
+    running loop; the limit itself is shared.
+    """
+
+    def __init__(self, provider: str, config: Dict[str, Any], initial: int):
+        self.provider = provider
+        self.config = config
+        self.limit = float(min(max(initial, config['min_limit']), config['max_limit']))
+        self.in_flight = 0
+        self._conditions: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Condition]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._conditions:
+                self._conditions[loop] = asyncio.Condition()
+            return self._conditions[loop]
+
+    def _try_acquire(self) -> bool:
+        with self._lock:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting up to queue_timeout; False if none freed up"""
+        if self._try_acquire():
+            return True
+        condition = self._condition()
+        async with condition:
+            try:
+                await asyncio.wait_for(
+                    condition.wait_for(self._try_acquire), timeout=self.config['queue_timeout']
+                )
+                return True
+            except asyncio.TimeoutError:
+                return False
+
+    async def release(self, success: Optional[bool], slow: bool = False) -> None:
+        """Free a slot and adapt the limit (success None leaves it unchanged)"""
+        with self._lock:
+            self.in_flight -= 1
+            if success is not None:
+                if success and not slow:
+                    self.limit = min(self.config['max_limit'], self.limit + 1 / self.limit)
+                else:
+                    self.limit = max(self.config['min_limit'], self.limit * self.config['backoff_ratio'])
+        condition = self._condition()
+        async with condition:
+            condition.notify_all()
+
+
+class CallTiming:
+    """
+    Timing of one guarded call, yielded by ProviderGuard.call
+
+    Streams mark their first token, and are then judged slow on the time to
+    that token rather than on how long the whole generation took.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.first_token_at: Optional[float] = None
+
+    def mark_first_token(self) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.monotonic()
+
+    def elapsed(self) -> float:
+        """Seconds to the first token if one was marked, else to now"""
+        return (self.first_token_at or time.monotonic()) - self.started
+
+
+class ProviderGuard:
+    """Circuit breaker plus adaptive concurrency limit wrapped around a provider's calls"""
+
+    def __init__(self, provider: str, config: Optional[Dict[str, Any]] = None):
+        self.provider = provider
+        self.config = {**get_circuit_breaker_config(), **(config or {})}
+        self.breaker = CircuitBreaker(provider, self.config)
+        self.limit = AdaptiveLimit(
+            provider, self.config, get_concurrency_config().get(provider, self.config['min_limit'])
+        )
+
+    @asynccontextmanager
+    async def call(self):
+        """
+        Run one provider call under the breaker and the limit
+
+        Yields a CallTiming; streamed calls should mark their first token on
+        it so a long but healthy generation is not counted as slow.
+
+        Raises:
+            ProviderUnavailableError: At once while the breaker is open, or
+                when no slot frees up within queue_timeout
+        """
+        # Imported here: llm_service imports this module
+        from .llm_service import ProviderUnavailableError
+
+        if not self.config['enabled']:
+            yield CallTiming()
+            return
+
+        ticket = self.breaker.allow()
+        if ticket is None:
+            raise ProviderUnavailableError(
+                f"{self.provider} is unavailable (circuit open, retry in {self.breaker.retry_after or 0:.0f}s)"
+            )
+        if not await self.limit.acquire():
+            self.breaker.release(ticket)
+            raise ProviderUnavailableError(
+                f"{self.provider} is overloaded ({self.limit.in_flight} calls in flight)"
+            )
+
+        timing = CallTiming()
+        success = None
+        try:
+            yield timing
+            success = True
+        except asyncio.CancelledError:
+            # Hedged calls are cancelled when another provider wins; that says nothing about this one
+            raise
+        except Exception:
+            success = False
+            raise
+        finally:
+            slow = timing.elapsed() > self.config['slow_call_seconds']
+            if success is None:
+                self.breaker.release(ticket)
+            else:
+                self.breaker.record(success and not slow, ticket)
+            await self.limit.release(success, slow)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.config['enabled'],
+            'state': self.breaker.state,
+            'failure_rate': round(self.breaker.failure_rate, 3),
+            'retry_after': self.breaker.retry_after,
+            'limit': int(self.limit.limit),
+            'in_flight': self.limit.in_flight,
+        }
+
+
+_guards: Dict[str, ProviderGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_provider_guard(provider: str) -> ProviderGuard:
+    """Get the process-wide guard for provider"""
+    with _guards_lock:
+        if provider not in _guards:
+            _guards[provider] = ProviderGuard(provider)
+        return _guards[provider]
+
+
+def provider_guard_status() -> Dict[str, Dict[str, Any]]:
+    """Breaker state and concurrency limit of every provider called so far"""
+    with _guards_lock:
+        guards = dict(_guards)
+    return {provider: guard.status() for provider, guard in guards.items()}
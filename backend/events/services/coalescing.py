@@ -0,0 +1,86 @@
+# events/services/coalescing.py
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import asyncio
+import logging
+import threading
+import weakref
+
+logger = logging.getLogger(__name__)
+
+
+class _InFlightCall:
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    """
+    Runs one call per key at a time and shares its result with every caller
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it runs wait on the same task instead of starting their own. A
+    caller that is cancelled (e.g. a losing hedge) only stops waiting; the
+    call itself is cancelled once nobody is waiting for it. Tasks are bound
+    to their event loop, so in-flight calls are tracked per running loop.
+    """
+
+    def __init__(self):
+        self._in_flight: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, _InFlightCall]]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def _calls(self) -> Dict[Hashable, _InFlightCall]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            return self._in_flight.setdefault(loop, {})
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await call() for key, or the call already running for it
+
+        Returns:
+            Tuple of (result, shared); shared is True when the result came
+            from another caller's call
+        """
+        calls = self._calls()
+        entry = calls.get(key)
+        shared = entry is not None
+        if shared:
+            self.coalesced += 1
+            logger.info(f"Coalesced duplicate in-flight request ({len(calls)} keys in flight)")
+        else:
+            entry = calls[key] = _InFlightCall(asyncio.ensure_future(call()))
+            entry.task.add_done_callback(lambda _: calls.pop(key, None) if calls.get(key) is entry else None)
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task), shared
+        except asyncio.CancelledError:
+            if entry.waiters == 1 and not entry.task.done():
+                entry.task.cancel()
+            raise
+        finally:
+            entry.waiters -= 1
+
+    def in_flight(self) -> int:
+        """Keys with a call running on the current event loop"""
+        return len(self._calls())
+
+
+_coalescer: Optional[RequestCoalescer] = None
+_coalescer_lock = threading.Lock()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Get the process-wide request coalescer"""
+    global _coalescer
+    if _coalescer is None:
+        with _coalescer_lock:
+            if _coalescer is None:
+                _coalescer = RequestCoalescer()
+    return _coalescer
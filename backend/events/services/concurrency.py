@@ -0,0 +1,60 @@
+# events/services/concurrency.py
+from typing import Dict, Optional
+from django.conf import settings
+import asyncio
+import threading
+import weakref
+
+DEFAULT_PROVIDER_CONCURRENCY = {
+    'openai': 8,
+    'anthropic': 4,
+    'ollama': 2,
+}
+
+
+def get_concurrency_config() -> Dict[str, int]:
+    """Get per-provider concurrency limits merged with defaults"""
+    return {**DEFAULT_PROVIDER_CONCURRENCY, **getattr(settings, 'LLM_CONCURRENCY', {})}
+
+
+class ProviderLimiter:
+    """
+    Per-provider semaphores bounding concurrent LLM calls
+
+    asyncio primitives are bound to one event loop, so a separate set of
+    semaphores is kept per running loop. Under ASGI that is a single,
+    process-wide limit per provider.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        self.limits = limits if limits is not None else get_concurrency_config()
+        self._semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def limit_for(self, provider: str) -> int:
+        return max(1, self.limits.get(provider, 1))
+
+    def semaphore(self, provider: str) -> asyncio.Semaphore:
+        """Get the semaphore for provider on the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            if provider not in semaphores:
+                semaphores[provider] = asyncio.Semaphore(self.limit_for(provider))
+            return semaphores[provider]
+
+
+_provider_limiter: Optional[ProviderLimiter] = None
+_provider_limiter_lock = threading.Lock()
+
+
+def get_provider_limiter() -> ProviderLimiter:
+    """Get the process-wide provider limiter"""
+    global _provider_limiter
+    if _provider_limiter is None:
+        with _provider_limiter_lock:
+            if _provider_limiter is None:
+                _provider_limiter = ProviderLimiter()
+    return _provider_limiter
@@ -0,0 +1,190 @@
+# events/services/conflicts.py
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.utils import timezone
+from ..models import Event
+from .recurrence import expand_rows, get_recurrence_config
+from .time_range import overlapping
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFLICT_CONFIG = {
+    'enabled': True,
+    'max_conflicts': 1000,
+}
+
+# Event columns loaded for a sweep
+INTERVAL_COLUMNS = ('id', 'title', 'start_datetime', 'end_datetime', 'rrule')
+
+
+def get_conflict_config() -> Dict[str, Any]:
+    """Get conflict detection configuration merged with defaults"""
+    return {**DEFAULT_CONFLICT_CONFIG, **getattr(settings, 'CONFLICT_DETECTION', {})}
+
+
+def sweep_overlaps(
+    starts: Sequence[float],
+    ends: Sequence[float],
+    only: Optional[Iterable[int]] = None,
+    limit: Optional[int] = None
+) -> Tuple[List[Tuple[int, int]], bool]:
+    """
+    Pairs of overlapping [start, end) intervals, found with a vectorized sweep line
+
+    Intervals are sorted by start (longer first on ties). Interval i then
+    overlaps exactly the intervals after it that start before it ends, a
+    contiguous run found with one binary search per interval, so the whole
+    sweep is a sort, a searchsorted and array arithmetic: O(n log n + k) for
+    k reported pairs. Zero-length intervals (events without an end) overlap
+    the intervals that contain their instant.
+
+    Args:
+        starts: Interval starts, e.g. POSIX timestamps
+        ends: Interval ends (clamped to be no earlier than the start)
+        only: If given, report only pairs involving one of these indexes
+        limit: Stop after this many pairs
+
+    Returns:
+        ((i, j), ...) index pairs with i sorted first, and whether the
+        limit cut the result short
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.maximum(np.asarray(ends, dtype=float), starts)
+    if not len(starts):
+        return [], False
+
+    order = np.lexsort((-ends, starts))
+    sorted_starts = starts[order]
+    # Intervals i+1 .. last[i]-1 start before interval i ends
+    last = np.searchsorted(sorted_starts, ends[order], side='left')
+    positions = np.arange(len(order))
+
+    truncated = False
+    if only is None:
+        counts = np.maximum(last - positions - 1, 0)
+        totals = np.cumsum(counts)
+        if limit and totals[-1] > limit:
+            # Materialise only the first `limit` pairs
+            cut = int(np.searchsorted(totals, limit, side='left'))
+            counts[cut] -= totals[cut] - limit
+            counts[cut + 1:] = 0
+            truncated = True
+        firsts = np.repeat(positions, counts)
+        offsets = np.arange(len(firsts)) - np.repeat(np.cumsum(counts) - counts, counts)
+        seconds = firsts + 1 + offsets
+    else:
+        # A chosen interval pairs with the run after it and with earlier
+        # intervals reaching past its start; pairs of two chosen intervals
+        # are taken from the earlier one's run only
+        rank = np.empty_like(order)
+        rank[order] = positions
+        chosen = np.unique(rank[np.fromiter(only, dtype=int)])
+        firsts_parts, seconds_parts = [], []
+        for position in chosen.tolist():
+            later = np.arange(position + 1, max(last[position], position + 1))
+            earlier = np.nonzero(last[:position] > position)[0]
+            earlier = earlier[~np.isin(earlier, chosen)]
+            firsts_parts += [np.full(len(later), position), earlier]
+            seconds_parts += [later, np.full(len(earlier), position)]
+        firsts = np.concatenate(firsts_parts) if firsts_parts else positions[:0]
+        seconds = np.concatenate(seconds_parts) if seconds_parts else positions[:0]
+        if limit and len(firsts) > limit:
+            firsts, seconds, truncated = firsts[:limit], seconds[:limit], True
+
+    return list(zip(order[firsts].tolist(), order[seconds].tolist())), truncated
+
+
+def find_conflicts(
+    start: datetime,
+    end: datetime,
+    queryset=None,
+    limit: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Every pair of overlapping events within [start, end)
+
+    Returns:
+        (conflicts, truncated)
+    """
+    if queryset is None:
+        queryset = Event.objects.all()
+    if limit is None:
+        limit = get_conflict_config()['max_conflicts']
+    rows, capped = expand_rows(list(overlapping(queryset, start, end).values_list(*INTERVAL_COLUMNS)), start, end)
+    pairs, truncated = sweep_overlaps(*_intervals(rows), limit=limit)
+    return [_describe(rows[first], rows[second]) for first, second in pairs], truncated or capped
+
+
+def find_conflicts_for_events(event_ids: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Conflicts between the given events and each other or any stored event
+
+    Only events overlapping the span of the given events are loaded, so the
+    check costs one indexed range query plus a sweep over that window.
+    """
+    if not get_conflict_config()['enabled']:
+        return []
+
+    event_ids = {str(event_id) for event_id in event_ids}
+    new_rows = list(Event.objects.filter(id__in=event_ids).values_list(*INTERVAL_COLUMNS, 'recurrence_end'))
+    if not new_rows:
+        return []
+
+    # New series are checked up to conflict_horizon_days ahead
+    horizon = timedelta(days=get_recurrence_config()['conflict_horizon_days'])
+    window_start = min(row[2] for row in new_rows)
+    window_end = max(_horizon_end(row, horizon) for row in new_rows)
+    # Closed at the end so events starting at a new instant are loaded; the sweep drops non-overlaps
+    window_end += timedelta(microseconds=1)
+    new_rows, _ = expand_rows([row[:5] for row in new_rows], window_start, window_end)
+    existing = overlapping(Event.objects.exclude(id__in=event_ids), window_start, window_end)
+    existing_rows, _ = expand_rows(list(existing.values_list(*INTERVAL_COLUMNS)), window_start, window_end)
+    rows = new_rows + existing_rows
+
+    pairs, _ = sweep_overlaps(
+        *_intervals(rows),
+        only=set(range(len(new_rows))),
+        limit=get_conflict_config()['max_conflicts']
+    )
+    conflicts = []
+    for first, second in pairs:
+        # Report from the new event's side
+        if first >= len(new_rows):
+            first, second = second, first
+        conflicts.append(_describe(rows[first], rows[second]))
+    return conflicts
+
+
+def _horizon_end(row, horizon: timedelta) -> datetime:
+    """End of a new event, or of its series within the horizon"""
+    if not row[4]:
+        return _end(row)
+    return min(row[5], row[2] + horizon) if row[5] else row[2] + horizon
+
+
+def _end(row) -> datetime:
+    return row[3] if row[3] and row[3] > row[2] else row[2]
+
+
+def _intervals(rows) -> Tuple[List[float], List[float]]:
+    return [row[2].timestamp() for row in rows], [_end(row).timestamp() for row in rows]
+
+
+def _describe(event, other) -> Dict[str, Any]:
+    overlap_start = max(event[2], other[2])
+    overlap_end = min(_end(event), _end(other))
+    return {
+        'event_id': str(event[0]),
+        'event_title': event[1],
+        'conflicting_event_id': str(other[0]),
+        'conflicting_event_title': other[1],
+        'overlap_start': _iso(overlap_start),
+        'overlap_end': _iso(max(overlap_start, overlap_end)),
+    }
+
+
+def _iso(value: datetime) -> str:
+    return (timezone.localtime(value) if timezone.is_aware(value) else value).isoformat()
@@ -1,36 +1,104 @@
 # events/services/events_service.py
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, AsyncIterator, Tuple
 from django.db import transaction
 from django.utils import timezone
 from django.conf import settings
-from ..models import Event, EventsGroup, Attendee, EventNote
-from .llm_service import LLMService, LLMServiceError
-from .ollama_service import OllamaService
+from ..models import Event, EventsGroup, Attendee, EventNote, ProcessingJob
+from .llm_service import LLMServiceError, ProviderUnavailableError
+from .registry import get_llm_service, get_ollama_service, get_nlp_service
+from .concurrency import get_provider_limiter
+from .provider_router import ProviderRouter
+from .search_index import get_search_index
+from .autocomplete import get_autocomplete_index
+from .loop_pools import run_sync
+from functools import partial
 import logging
 import asyncio
-from asgiref.sync import async_to_sync
+from asgiref.sync import sync_to_async
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FAST_PATH_CONFIG = {
+    'enabled': True,
+    'confidence_threshold': 0.8,
+    'fallback_threshold': 0.3,
+}
+
+
+def get_fast_path_config() -> Dict[str, Any]:
+    """Get rule-based fast path configuration merged with defaults"""
+    return {**DEFAULT_FAST_PATH_CONFIG, **getattr(settings, 'NLP_FAST_PATH', {})}
+
 class EventsServiceError(Exception):
     """Custom exception for events service errors"""
     pass
 
+class EventsGroupNotFound(EventsServiceError):
+    """Raised when a requested events group does not exist"""
+    pass
+
 class EventsService:
     """Service for managing events and event groups"""
     
-    def __init__(self):
-        self.llm_service = LLMService()
-        self.ollama_service = OllamaService(
-            base_url=getattr(settings, 'OLLAMA_CONFIG', {}).get('base_url', 'http://localhost:11434'),
-            model=getattr(settings, 'OLLAMA_CONFIG', {}).get('default_model', 'llama3.2:1b')
-        )
+    def __init__(self, llm_service=None, ollama_service=None):
+        # Resolved from the process-wide registry on first use unless injected
+        self._llm_service = llm_service
+        self._ollama_service = ollama_service
+        self._nlp_service = None
+        self._nlp_unavailable = False
+        self._router = None
+
+    @property
+    def llm_service(self):
+        """Cloud LLM service, shared across the process"""
+        if self._llm_service is None:
+            self._llm_service = get_llm_service()
+        return self._llm_service
+
+    @property
+    def ollama_service(self):
+        """Local Ollama service, shared across the process"""
+        if self._ollama_service is None:
+            self._ollama_service = get_ollama_service()
+        return self._ollama_service
+
+    @property
+    def router(self):
+        """
+        ProviderRouter over this service's LLM and Ollama services
+        
+        The configured cloud provider is tried first, with failover and
+        hedging to the others in PROVIDER_ROUTER['providers'].
+        """
+        if self._router is None:
+            self._router = ProviderRouter({
+                self.llm_service.provider: lambda: self.llm_service,
+                'ollama': lambda: self.ollama_service,
+            })
+        return self._router
+
+    @property
+    def nlp_service(self):
+        """
+        Rule-based NLPService used as the fast path, loaded on first use
+        
+        Returns None when spaCy or its English model is not installed, in
+        which case every text goes to the LLM.
+        """
+        if self._nlp_service is None and not self._nlp_unavailable:
+            self._nlp_service = get_nlp_service()
+            self._nlp_unavailable = self._nlp_service is None
+        return self._nlp_service
 
-    @transaction.atomic
     def create_events_from_text(self, text: str, use_llm: bool = True) -> EventsGroup:
         """
         Create multiple events from natural language text using either cloud LLM or local Ollama
         
+        Synchronous wrapper around acreate_events_from_text for callers
+        without an event loop. No transaction is held around the parse, so a
+        failure still leaves the group with its processing_error recorded,
+        and client pools opened for the call are closed with its loop.
+        
         Args:
             text: Natural language text to parse
             use_llm: If True, use cloud LLM (OpenAI/Anthropic), if False use local Ollama
@@ -41,60 +109,402 @@ class EventsService:
         Raises:
             EventsServiceError: If event creation fails
         """
+        return run_sync(self.acreate_events_from_text, text, use_llm)
+
+    async def acreate_events_from_text(self, text: str, use_llm: bool = True) -> EventsGroup:
+        """
+        Async variant of create_events_from_text for async views
+        
+        The LLM call is awaited on the running event loop and no database
+        transaction is held while waiting for it. On failure the group is
+        kept with its processing_error set, as with queued processing.
+        
+        Args:
+            text: Natural language text to parse
+            use_llm: If True, use cloud LLM (OpenAI/Anthropic), if False use local Ollama
+            
+        Returns:
+            EventsGroup: Created events group
+            
+        Raises:
+            EventsServiceError: If event creation fails
+        """
+        if not text or not text.strip():
+            raise EventsServiceError("Text input cannot be empty")
+
+        group = await self.acreate_pending_group(use_llm)
+        logger.info(f"Processing text with {'cloud LLM' if use_llm else 'local Ollama'} for group {group.id}")
+        
+        await self.process_events_group(group, text, use_llm)
+        return group
+
+    async def acreate_pending_group(self, use_llm: bool = True) -> EventsGroup:
+        """Create an events group that is still waiting for its events"""
+        return await EventsGroup.objects.acreate(
+            use_llm=use_llm,
+            processing_complete=False
+        )
+
+    async def astream_events_from_text(
+        self, 
+        group: EventsGroup, 
+        text: str, 
+        use_llm: bool = True
+    ) -> AsyncIterator[Event]:
+        """
+        Parse text with a streaming model call, persisting each event as it arrives
+        
+        Events are saved one at a time so they can be shown before the model
+        finishes. If parsing fails part way, or the consumer stops early (a
+        client disconnecting), events already yielded are kept and the error
+        is recorded on the group.
+        
+        Args:
+            group: Pending EventsGroup to attach events to
+            text: Natural language text to parse
+            use_llm: If True, use cloud LLM (OpenAI/Anthropic), if False use local Ollama
+            
+        Yields:
+            Each created Event
+            
+        Raises:
+            EventsServiceError: If parsing or persistence fails
+        """
+        if not text or not text.strip():
+            raise EventsServiceError("Text input cannot be empty")
+
+        created_count = 0
+        
         try:
-            # Input validation
-            if not text or not text.strip():
-                raise EventsServiceError("Text input cannot be empty")
-
-            # Create event group
-            group = EventsGroup.objects.create(
-                use_llm=use_llm,
-                processing_complete=False
-            )
+            fast_events = await self._parse_fast_path(text)
+            if fast_events is not None:
+                source = self._iterate(fast_events)
+            elif use_llm:
+                router = self.router
+                source = router.stream_events(text, providers=router.order(self.llm_service.provider))
+            else:
+                source = self.ollama_service.stream_events(text)
+            
+            async for event_data in source:
+                event_data['original_text'] = text
+                event = await sync_to_async(self._create_single_event)(event_data, group)
+                created_count += 1
+                yield event
+            
+            if not created_count:
+                raise EventsServiceError("No events were parsed from the text")
             
-            try:
-                # Choose service based on use_llm flag
-                if use_llm:
-                    logger.info(f"Processing text with cloud LLM for group {group.id}")
-                    service = self.llm_service
-                else:
-                    logger.info(f"Processing text with local Ollama for group {group.id}")
-                    service = self.ollama_service
-                
-                # Parse events using selected service
-                parsed_events = async_to_sync(service.parse_events)(text, group)
-                
-                if not parsed_events:
-                    raise EventsServiceError("No events were parsed from the text")
-                
-                # Store original text and process events
-                for event_data in parsed_events:
-                    event_data['original_text'] = text
-                
-                # Create events from parsed data
-                created_events = self._create_events_from_parsed_data(parsed_events, group)
-                
-                # Update group status
-                group.processing_complete = True
-                group.save()
-                
-                logger.info(f"Successfully created {len(created_events)} events for group {group.id}")
-                
-                return group
-                
-            except (LLMServiceError) as e:
-                error_msg = f"{'LLM' if use_llm else 'Ollama'} processing failed: {str(e)}"
-                self._handle_processing_error(group, error_msg)
-                raise EventsServiceError(error_msg)
-                
-            except Exception as e:
-                error_msg = f"Unexpected error during event processing: {str(e)}"
-                self._handle_processing_error(group, error_msg)
-                raise EventsServiceError(error_msg)
+            group.processing_complete = True
+            await group.asave()
+            logger.info(f"Successfully streamed {created_count} events for group {group.id}")
+            
+        except LLMServiceError as e:
+            error_msg = f"{'LLM' if use_llm else 'Ollama'} processing failed: {str(e)}"
+            await sync_to_async(self._handle_processing_error)(group, error_msg)
+            raise EventsServiceError(error_msg)
+            
+        except Exception as e:
+            error_msg = f"Unexpected error during event processing: {str(e)}"
+            await sync_to_async(self._handle_processing_error)(group, error_msg)
+            raise EventsServiceError(error_msg)
+        
+        except (asyncio.CancelledError, GeneratorExit):
+            # The client disconnected: keep the events saved so far and close the group
+            error_msg = f"Stream interrupted after {created_count} event(s); the rest of the text was not processed"
+            await asyncio.shield(sync_to_async(self._handle_processing_error)(group, error_msg))
+            raise
+
+    async def acreate_events_from_texts(
+        self, 
+        texts: List[str], 
+        use_llm: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Create one events group per text, parsing the texts concurrently
+        
+        Texts first go through the rule-based parser together in one
+        nlp.pipe batch; only those it is not confident about call the
+        provider. Calls to the provider are bounded by its semaphore from
+        ProviderLimiter, so throughput follows the configured provider
+        limits rather than the size of the batch. A failing text does not
+        affect the others.
+        
+        Args:
+            texts: Natural language texts to parse
+            use_llm: If True, use cloud LLM (OpenAI/Anthropic), if False use local Ollama
+            
+        Returns:
+            One result per text, in input order, with index, success,
+            group_id, event_count and error keys
+        """
+        provider = self.llm_service.provider if use_llm else 'ollama'
+        semaphore = get_provider_limiter().semaphore(provider)
+        
+        fast_results = await self._parse_fast_path_batch(texts)
+        
+        logger.info(f"Processing batch of {len(texts)} texts with {provider}")
+        return await asyncio.gather(*(
+            self._acreate_batch_item(index, text, use_llm, semaphore, fast_events)
+            for index, (text, fast_events) in enumerate(zip(texts, fast_results))
+        ))
+
+    async def _acreate_batch_item(
+        self, 
+        index: int, 
+        text: str, 
+        use_llm: bool, 
+        semaphore: asyncio.Semaphore,
+        fast_events: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Process one text of a batch and report its outcome"""
+        result = {
+            'index': index,
+            'success': False,
+            'group_id': None,
+            'event_count': 0,
+            'error': None
+        }
+        
+        if not isinstance(text, str) or not text.strip():
+            result['error'] = "Text input cannot be empty"
+            return result
+        
+        try:
+            group = await self.acreate_pending_group(use_llm)
+            result['group_id'] = group.id
+            
+            if fast_events is not None:
+                events = await self.process_events_group(group, text, use_llm, parsed_events=fast_events)
+            else:
+                async with semaphore:
+                    events = await self.process_events_group(group, text, use_llm)
+            
+            result['success'] = True
+            result['event_count'] = len(events)
+            
+        except EventsServiceError as e:
+            result['error'] = str(e)
+        except Exception as e:
+            logger.error(f"Unexpected error in batch item {index}: {str(e)}")
+            result['error'] = f"Unexpected error: {str(e)}"
+        
+        return result
+
+    def enqueue_events_from_text(self, text: str, use_llm: bool = True) -> EventsGroup:
+        """
+        Create a pending events group and queue the text for background parsing
+        
+        The returned group has processing_complete=False until a worker from
+        JobWorkerPool picks up the job and persists the parsed events.
+        
+        Args:
+            text: Natural language text to parse
+            use_llm: If True, use cloud LLM (OpenAI/Anthropic), if False use local Ollama
+            
+        Returns:
+            EventsGroup: Created (still processing) events group
+            
+        Raises:
+            EventsServiceError: If the job cannot be queued
+        """
+        if not text or not text.strip():
+            raise EventsServiceError("Text input cannot be empty")
+
+        try:
+            with transaction.atomic():
+                group = EventsGroup.objects.create(
+                    use_llm=use_llm,
+                    processing_complete=False
+                )
+                ProcessingJob.objects.create(group=group, text=text, use_llm=use_llm)
+
+            logger.info(f"Queued text processing job for group {group.id}")
+            return group
 
         except Exception as e:
-            logger.error(f"Failed to create events from text: {str(e)}")
-            raise EventsServiceError(f"Event creation failed: {str(e)}")
+            logger.error(f"Failed to queue events from text: {str(e)}")
+            raise EventsServiceError(f"Failed to queue event creation: {str(e)}")
+
+    async def process_events_group(
+        self, 
+        group: EventsGroup, 
+        text: str, 
+        use_llm: bool = True,
+        parsed_events: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Event]:
+        """
+        Parse text for an existing events group and persist the results
+        
+        Used by background workers. The LLM call runs outside any database
+        transaction; only the final writes are atomic.
+        
+        Args:
+            group: Pending EventsGroup created by enqueue_events_from_text
+            text: Natural language text to parse
+            use_llm: If True, use cloud LLM (OpenAI/Anthropic), if False use local Ollama
+            parsed_events: Events already parsed from text (e.g. by a batched
+                rule-based parse); parsing is skipped when given
+            
+        Returns:
+            List of created Event objects
+            
+        Raises:
+            EventsServiceError: If parsing or persistence fails
+        """
+        try:
+            if parsed_events is None:
+                parsed_events = await self._parse_text(text, group, use_llm)
+            
+            if not parsed_events:
+                raise EventsServiceError("No events were parsed from the text")
+            
+            return await sync_to_async(self._save_parsed_events)(group, text, parsed_events)
+            
+        except LLMServiceError as e:
+            error_msg = f"{'LLM' if use_llm else 'Ollama'} processing failed: {str(e)}"
+            await sync_to_async(self._handle_processing_error)(group, error_msg)
+            raise EventsServiceError(error_msg)
+            
+        except Exception as e:
+            error_msg = f"Unexpected error during event processing: {str(e)}"
+            await sync_to_async(self._handle_processing_error)(group, error_msg)
+            raise EventsServiceError(error_msg)
+
+    @transaction.atomic
+    def _save_parsed_events(
+        self, 
+        group: EventsGroup, 
+        text: str, 
+        parsed_events: List[Dict[str, Any]]
+    ) -> List[Event]:
+        """Persist parsed events for a group and mark the group as complete"""
+        # Store original text and process events
+        for event_data in parsed_events:
+            event_data['original_text'] = text
+        
+        # Create events from parsed data
+        created_events = self._create_events_from_parsed_data(parsed_events, group)
+        
+        # Update group status
+        group.processing_complete = True
+        group.save()
+        
+        logger.info(f"Successfully created {len(created_events)} events for group {group.id}")
+        
+        return created_events
+
+    async def _parse_text(self, text: str, group: EventsGroup, use_llm: bool) -> List[Dict[str, Any]]:
+        """
+        Tiered parse: the rule-based parser first, then the selected service
+        
+        Text is only sent to the cloud LLM or Ollama when the rule-based
+        parse is not confident enough (ambiguous or multi-event input).
+        """
+        parsed_events = await self._parse_fast_path(text)
+        if parsed_events is not None:
+            logger.info(f"Parsed text with rule-based parser for group {group.id}")
+            return parsed_events
+        
+        try:
+            if use_llm:
+                logger.info(f"Processing text with cloud LLM for group {group.id}")
+                router = self.router
+                return await router.parse_events(text, group, providers=router.order(self.llm_service.provider))
+            
+            logger.info(f"Processing text with local Ollama for group {group.id}")
+            return await self.ollama_service.parse_events(text, group)
+            
+        except ProviderUnavailableError as e:
+            # Circuits are open or saturated: answer from the rule-based parser rather than fail
+            parsed_events = await self._parse_fast_path(text, get_fast_path_config()['fallback_threshold'])
+            if parsed_events is None:
+                raise
+            logger.warning(f"Parsed text with rule-based parser for group {group.id}: {str(e)}")
+            return parsed_events
+
+    async def _parse_fast_path(self, text: str, threshold: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse text with NLPService if its confidence clears the threshold
+        
+        Args:
+            text: Natural language text to parse
+            threshold: Minimum confidence (defaults to NLP_FAST_PATH['confidence_threshold'])
+        
+        Returns:
+            Parsed events, or None if the text should go to an LLM
+        """
+        config = get_fast_path_config()
+        if not config['enabled']:
+            return None
+        
+        nlp_service = self.nlp_service
+        if nlp_service is None:
+            return None
+        
+        if threshold is None:
+            threshold = config['confidence_threshold']
+        
+        try:
+            # spaCy is CPU-bound; keep it off the event loop
+            event_data, confidence = await sync_to_async(
+                nlp_service.parse_with_confidence, thread_sensitive=False
+            )(text)
+        except Exception as e:
+            logger.warning(f"Rule-based parse failed, escalating to LLM: {str(e)}")
+            return None
+        
+        if confidence < threshold:
+            logger.info(
+                f"Rule-based parse confidence {confidence:.2f} is below "
+                f"{threshold:.2f}, escalating to LLM"
+            )
+            return None
+        
+        return [event_data]
+
+    async def _parse_fast_path_batch(self, texts: List[Any]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Batched _parse_fast_path over a list of texts using nlp.pipe
+        
+        Returns:
+            One entry per text: parsed events, or None if that text should go
+            to an LLM (including non-string or empty entries)
+        """
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(texts)
+        config = get_fast_path_config()
+        if not config['enabled']:
+            return results
+        
+        nlp_service = self.nlp_service
+        if nlp_service is None:
+            return results
+        
+        indexes = [index for index, text in enumerate(texts) if isinstance(text, str) and text.strip()]
+        if not indexes:
+            return results
+        
+        try:
+            scored = await sync_to_async(
+                nlp_service.parse_batch_with_confidence, thread_sensitive=False
+            )([texts[index] for index in indexes])
+        except Exception as e:
+            logger.warning(f"Batched rule-based parse failed, escalating to LLM: {str(e)}")
+            return results
+        
+        for index, (event_data, confidence) in zip(indexes, scored):
+            if confidence >= config['confidence_threshold']:
+                results[index] = [event_data]
+        
+        logger.info(
+            f"Rule-based parser handled {sum(1 for result in results if result is not None)} "
+            f"of {len(texts)} texts"
+        )
+        return results
+
+    @staticmethod
+    async def _iterate(items: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        for item in items:
+            yield item
 
     def _handle_processing_error(self, group: EventsGroup, error_msg: str):
         """Handle processing errors by updating group status"""
@@ -111,6 +521,11 @@ class EventsService:
         """
         Create events and related objects from parsed data
         
+        All rows are built in memory first and then written with one
+        bulk_create per model inside a single transaction, so the number of
+        queries does not grow with the number of events or attendees.
+        Either every event is created or none are.
+        
         Args:
             parsed_events: List of parsed event data dictionaries
             group: Parent EventsGroup
@@ -122,18 +537,32 @@ class EventsService:
             EventsServiceError: If event creation fails
         """
         try:
-            created_events = []
+            events = []
+            notes = []
+            attendees = []
             for event_data in parsed_events:
                 try:
-                    event = self._create_single_event(event_data, group)
-                    created_events.append(event)
+                    event, note, event_attendees = self._build_event_rows(event_data, group)
                 except Exception as e:
                     logger.error(
                         f"Failed to create event in group {group.id}: {str(e)}\n"
                         f"Event data: {event_data}"
                     )
                     raise
-            return created_events
+                events.append(event)
+                if note:
+                    notes.append(note)
+                attendees.extend(event_attendees)
+
+            with transaction.atomic():
+                Event.objects.bulk_create(events)
+                EventNote.objects.bulk_create(notes)
+                Attendee.objects.bulk_create(attendees)
+                # bulk_create skips the signals that keep the search indexes in sync
+                get_search_index().refresh_events(event.id for event in events)
+                transaction.on_commit(partial(get_autocomplete_index().index_created, events, attendees))
+
+            return events
             
         except Exception as e:
             logger.error(f"Failed to create events from parsed data: {str(e)}")
@@ -156,32 +585,15 @@ class EventsService:
             Created Event object
         """
         try:
-            # Validate required fields
-            required_fields = ['title', 'start_datetime']
-            for field in required_fields:
-                if field not in event_data:
-                    raise EventsServiceError(f"Missing required field: {field}")
-
-            # Create the event with default values for optional fields
-            event = Event.objects.create(
-                group=group,
-                title=event_data['title'],
-                start_datetime=event_data['start_datetime'],
-                end_datetime=event_data.get('end_datetime'),
-                location=event_data.get('location', ''),
-                venue=event_data.get('venue', ''),
-                suggestions=event_data.get('suggestions', ''),
-                original_text=event_data.get('original_text', ''),
-                processing_complete=True
-            )
-
-            # Create initial note if provided
-            if notes := event_data.get('notes'):
-                self._create_event_note(event, notes)
-
-            # Create attendees if present
-            if attendees := event_data.get('attendees'):
-                self._create_attendees(event, attendees)
+            event, note, attendees = self._build_event_rows(event_data, group)
+            
+            event.save(force_insert=True)
+            if note:
+                note.save(force_insert=True)
+            if attendees:
+                Attendee.objects.bulk_create(attendees)
+                get_search_index().refresh_events([event.id])
+                transaction.on_commit(partial(get_autocomplete_index().index_created, [], attendees))
 
             return event
 
@@ -189,47 +601,63 @@ class EventsService:
             logger.error(f"Failed to create single event: {str(e)}")
             raise EventsServiceError(f"Failed to create event: {str(e)}")
 
-    def _create_event_note(
+    def _build_event_rows(
         self, 
-        event: Event, 
-        note_content: str
-    ) -> Optional[EventNote]:
-        """Create a note for an event"""
-        try:
-            if not note_content:
-                return None
-                
-            return EventNote.objects.create(
+        event_data: Dict[str, Any], 
+        group: EventsGroup
+    ) -> Tuple[Event, Optional[EventNote], List[Attendee]]:
+        """
+        Build unsaved Event, EventNote and Attendee rows from parsed data
+        
+        Args:
+            event_data: Dictionary containing event data
+            group: Parent EventsGroup
+            
+        Returns:
+            Tuple of (event, note or None, attendees)
+            
+        Raises:
+            EventsServiceError: If required fields are missing
+        """
+        # Validate required fields
+        required_fields = ['title', 'start_datetime']
+        for field in required_fields:
+            if field not in event_data:
+                raise EventsServiceError(f"Missing required field: {field}")
+
+        # Build the event with default values for optional fields
+        event = Event(
+            group=group,
+            title=event_data['title'],
+            start_datetime=event_data['start_datetime'],
+            end_datetime=event_data.get('end_datetime'),
+            location=event_data.get('location', ''),
+            venue=event_data.get('venue', ''),
+            suggestions=event_data.get('suggestions', ''),
+            original_text=event_data.get('original_text', ''),
+            rrule=event_data.get('rrule') or '',
+            processing_complete=True
+        )
+        # bulk_create skips save(), which keeps this in step with the rule
+        event.update_recurrence_end()
+
+        # Initial note if provided
+        note = None
+        if content := event_data.get('notes'):
+            note = EventNote(event=event, content=content)
+
+        # Attendees if present, skipping entries without a name
+        attendees = [
+            Attendee(
                 event=event,
-                content=note_content
+                name=attendee_data['name'],
+                email=attendee_data.get('email', '')
             )
-        except Exception as e:
-            logger.error(f"Failed to create event note: {str(e)}")
-            raise EventsServiceError(f"Failed to create event note: {str(e)}")
+            for attendee_data in event_data.get('attendees') or []
+            if attendee_data.get('name')
+        ]
 
-    def _create_attendees(
-        self, 
-        event: Event, 
-        attendees_data: List[Dict[str, str]]
-    ) -> List[Attendee]:
-        """Create attendees for an event"""
-        try:
-            created_attendees = []
-            for attendee_data in attendees_data:
-                if not attendee_data.get('name'):
-                    continue
-                    
-                attendee = Attendee.objects.create(
-                    event=event,
-                    name=attendee_data['name'],
-                    email=attendee_data.get('email', '')
-                )
-                created_attendees.append(attendee)
-            return created_attendees
-            
-        except Exception as e:
-            logger.error(f"Failed to create attendees: {str(e)}")
-            raise EventsServiceError(f"Failed to create attendees: {str(e)}")
+        return event, note, attendees
 
     def get_events_group(self, group_id: str) -> EventsGroup:
         """
@@ -245,15 +673,28 @@ class EventsService:
             EventsServiceError: If group not found or retrieval fails
         """
         try:
-            group = EventsGroup.objects.prefetch_related(
-                'events__attendees',
-                'events__notes'
-            ).get(id=group_id)
+            group = EventsGroup.objects.select_related('job').with_events().get(id=group_id)
             
             return group
             
         except EventsGroup.DoesNotExist:
-            raise EventsServiceError(f"Events group {group_id} not found")
+            raise EventsGroupNotFound(f"Events group {group_id} not found")
+        except Exception as e:
+            logger.error(f"Error retrieving events group {group_id}: {str(e)}")
+            raise EventsServiceError(f"Failed to retrieve events group: {str(e)}")
+
+    async def aget_events_group(self, group_id: str) -> EventsGroup:
+        """
+        Async variant of get_events_group
+        
+        Raises:
+            EventsServiceError: If group not found or retrieval fails
+        """
+        try:
+            return await EventsGroup.objects.select_related('job').with_events().aget(id=group_id)
+            
+        except EventsGroup.DoesNotExist:
+            raise EventsGroupNotFound(f"Events group {group_id} not found")
         except Exception as e:
             logger.error(f"Error retrieving events group {group_id}: {str(e)}")
             raise EventsServiceError(f"Failed to retrieve events group: {str(e)}")
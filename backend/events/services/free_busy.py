@@ -0,0 +1,131 @@
+# events/services/free_busy.py
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from ..models import Event, Attendee
+from .recurrence import expand_rows
+from .time_range import overlapping
+import numpy as np
+
+DEFAULT_FREE_BUSY_CONFIG = {
+    'default_duration': 60,
+    'min_slot': 30,
+}
+
+
+def get_free_busy_config() -> Dict[str, Any]:
+    """Get free/busy configuration merged with defaults"""
+    return {**DEFAULT_FREE_BUSY_CONFIG, **getattr(settings, 'FREE_BUSY', {})}
+
+
+def merge_intervals(starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Union of [start, end) intervals as sorted, disjoint blocks
+
+    After sorting by start, a running maximum of the ends says how far the
+    current block reaches; an interval opens a new block exactly when it
+    starts after that reach. Touching intervals merge into one block.
+    """
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    if not len(starts):
+        return starts, ends
+
+    order = np.argsort(starts, kind='stable')
+    starts, ends = starts[order], ends[order]
+    reach = np.maximum.accumulate(ends)
+
+    opens = np.empty(len(starts), dtype=bool)
+    opens[0] = True
+    opens[1:] = starts[1:] > reach[:-1]
+    first = np.flatnonzero(opens)
+    last = np.append(first[1:] - 1, len(starts) - 1)
+    return starts[first], reach[last]
+
+
+def free_slots(
+    block_starts: np.ndarray,
+    block_ends: np.ndarray,
+    window_start: float,
+    window_end: float,
+    min_length: float = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Gaps of at least min_length between merged busy blocks inside the window"""
+    gap_starts = np.concatenate(([window_start], block_ends))
+    gap_ends = np.concatenate((block_starts, [window_end]))
+    lengths = gap_ends - gap_starts
+    keep = (lengths > 0) & (lengths >= min_length)
+    return gap_starts[keep], gap_ends[keep]
+
+
+def compute_free_busy(
+    start: datetime,
+    end: datetime,
+    attendee: Optional[str] = None,
+    min_length: Optional[timedelta] = None,
+    queryset=None
+) -> Dict[str, List[List[str]]]:
+    """
+    Busy blocks and free slots for [start, end)
+
+    Events overlapping the window are loaded as (start, end) columns only,
+    merged in one vectorized pass and clipped to the window. Events without
+    an end count as busy for FREE_BUSY['default_duration'] minutes.
+
+    Args:
+        start: Window start (aware)
+        end: Window end (aware)
+        attendee: Only count events with an attendee of this name or email
+        min_length: Shortest free slot to report (defaults to FREE_BUSY['min_slot'] minutes)
+        queryset: Events to consider (defaults to all events)
+
+    Returns:
+        {'busy': [[start, end], ...], 'free': [[start, end], ...]} as ISO strings
+    """
+    config = get_free_busy_config()
+    default_duration = timedelta(minutes=config['default_duration'])
+    if min_length is None:
+        min_length = timedelta(minutes=config['min_slot'])
+
+    if queryset is None:
+        queryset = Event.objects.all()
+    if attendee:
+        queryset = queryset.filter(id__in=Attendee.objects.filter(
+            Q(name__iexact=attendee) | Q(email__iexact=attendee)
+        ).values('event_id'))
+
+    # Open-ended events that started up to default_duration before the window still cover it
+    rows, _ = expand_rows(
+        list(overlapping(queryset, start - default_duration, end).values_list('start_datetime', 'end_datetime', 'rrule')),
+        start - default_duration, end, start_index=0, end_index=1
+    )
+    starts, ends = [], []
+    for event_start, event_end, _ in rows:
+        if not event_end or event_end <= event_start:
+            event_end = event_start + default_duration
+        starts.append(event_start.timestamp())
+        ends.append(event_end.timestamp())
+
+    window_start, window_end = start.timestamp(), end.timestamp()
+    busy_starts, busy_ends = merge_intervals(
+        np.clip(np.array(starts, dtype=float), window_start, window_end),
+        np.clip(np.array(ends, dtype=float), window_start, window_end)
+    )
+    free_starts, free_ends = free_slots(
+        busy_starts, busy_ends, window_start, window_end, min_length.total_seconds()
+    )
+    return {
+        'busy': _pairs(busy_starts, busy_ends),
+        'free': _pairs(free_starts, free_ends),
+    }
+
+
+def _pairs(starts: np.ndarray, ends: np.ndarray) -> List[List[str]]:
+    # Looked up once; timezone.localtime per value dominates large responses
+    zone = timezone.get_current_timezone() if settings.USE_TZ else None
+    return [
+        [datetime.fromtimestamp(start, tz=zone).isoformat(), datetime.fromtimestamp(end, tz=zone).isoformat()]
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
@@ -0,0 +1,98 @@
+# events/services/http_session.py
+from typing import Dict, Any, Optional
+from django.conf import settings
+import aiohttp
+import asyncio
+import logging
+import threading
+import weakref
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_CONFIG = {
+    'pool_size': 100,
+    'pool_size_per_host': 10,
+    'keepalive_timeout': 30,
+    'connect_timeout': 5,
+    'timeout': 30,
+}
+
+
+class SessionPool:
+    """
+    Lazily created aiohttp session shared by every caller on an event loop
+
+    aiohttp sessions are bound to the loop they were created on, so one
+    session (and connection pool) is kept per running loop. Under ASGI that
+    means a single keep-alive pool for the whole process.
+    """
+
+    def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.config = {**DEFAULT_HTTP_CONFIG, **(config or {})}
+        self._sessions: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _build_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.config['pool_size'],
+            limit_per_host=self.config['pool_size_per_host'],
+            keepalive_timeout=self.config['keepalive_timeout'],
+            ttl_dns_cache=300
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self.config['timeout'],
+            connect=self.config['connect_timeout'],
+            sock_read=self.config['timeout']
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Get the session for the running event loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                session = self._build_session()
+                self._sessions[loop] = session
+                logger.debug(f"Opened {self.name} HTTP session pool")
+            return session
+
+    async def close(self) -> None:
+        """Close the session bound to the running event loop, if any"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+            logger.debug(f"Closed {self.name} HTTP session pool")
+
+
+_pools: Dict[str, SessionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_session_pool(name: str, config: Optional[Dict[str, Any]] = None) -> SessionPool:
+    """Get the process-wide session pool registered under name"""
+    with _pools_lock:
+        if name not in _pools:
+            _pools[name] = SessionPool(name, config)
+        return _pools[name]
+
+
+def get_ollama_session_pool() -> SessionPool:
+    """Get the session pool used for Ollama, configured from settings.OLLAMA_CONFIG"""
+    return get_session_pool('ollama', getattr(settings, 'OLLAMA_CONFIG', {}))
+
+
+async def close_session_pools() -> None:
+    """Close every pooled session bound to the running event loop"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        try:
+            await pool.close()
+        except Exception as e:
+            logger.error(f"Failed to close {pool.name} HTTP session pool: {str(e)}")
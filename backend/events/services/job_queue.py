@@ -0,0 +1,182 @@
+# events/services/job_queue.py
+from typing import Optional
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, F
+from django.utils import timezone
+from ..models import ProcessingJob
+from .events_service import EventsService
+from .registry import get_events_service
+import logging
+import asyncio
+from asgiref.sync import sync_to_async
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_CONFIG = {
+    'workers': 4,
+    'poll_interval': 1.0,
+    'lease_timeout': 300,
+    'max_attempts': 3,
+    'enqueue_by_default': False,
+}
+
+
+def get_queue_config() -> dict:
+    """Get job queue configuration merged with defaults"""
+    return {**DEFAULT_QUEUE_CONFIG, **getattr(settings, 'EVENTS_JOB_QUEUE', {})}
+
+
+class JobQueueError(Exception):
+    """Custom exception for job queue errors"""
+    pass
+
+class JobQueue:
+    """Database-backed queue of ProcessingJob rows"""
+
+    def __init__(self, lease_timeout: Optional[int] = None, max_attempts: Optional[int] = None):
+        config = get_queue_config()
+        self.lease_timeout = lease_timeout if lease_timeout is not None else config['lease_timeout']
+        self.max_attempts = max_attempts if max_attempts is not None else config['max_attempts']
+
+    def _claimable(self) -> Q:
+        """Pending jobs, plus running jobs whose lease has expired with attempts left"""
+        stale_before = timezone.now() - timedelta(seconds=self.lease_timeout)
+        return Q(status=ProcessingJob.STATUS_PENDING) | Q(
+            status=ProcessingJob.STATUS_RUNNING,
+            started_at__lt=stale_before,
+            attempts__lt=self.max_attempts
+        )
+
+    def claim_next(self) -> Optional[ProcessingJob]:
+        """
+        Claim the oldest available job
+
+        The claim is a conditional UPDATE, so concurrent workers (in this
+        process or another) never run the same job twice.
+
+        Returns:
+            The claimed job with its group loaded, or None if the queue is empty
+        """
+        condition = self._claimable()
+        candidates = ProcessingJob.objects.filter(condition).order_by(
+            'created_at'
+        ).values_list('id', flat=True)[:10]
+
+        for job_id in candidates:
+            claimed = ProcessingJob.objects.filter(condition, id=job_id).update(
+                status=ProcessingJob.STATUS_RUNNING,
+                started_at=timezone.now(),
+                attempts=F('attempts') + 1
+            )
+            if claimed:
+                return ProcessingJob.objects.select_related('group').get(id=job_id)
+
+        return None
+
+    def mark_done(self, job: ProcessingJob) -> None:
+        """Mark a job as successfully processed"""
+        job.status = ProcessingJob.STATUS_DONE
+        job.error = ''
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'error', 'finished_at'])
+
+    def mark_failed(self, job: ProcessingJob, error: str) -> None:
+        """Mark a job as failed; the group already carries the processing error"""
+        job.status = ProcessingJob.STATUS_FAILED
+        job.error = error
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'error', 'finished_at'])
+
+    @transaction.atomic
+    def expire_stale(self) -> int:
+        """
+        Fail abandoned jobs that have used up all their attempts
+
+        Returns:
+            Number of jobs marked as failed
+        """
+        stale_before = timezone.now() - timedelta(seconds=self.lease_timeout)
+        expired = ProcessingJob.objects.select_related('group').filter(
+            status=ProcessingJob.STATUS_RUNNING,
+            started_at__lt=stale_before,
+            attempts__gte=self.max_attempts
+        )
+
+        count = 0
+        for job in expired:
+            error_msg = f"Processing abandoned after {job.attempts} attempts"
+            self.mark_failed(job, error_msg)
+            job.group.processing_error = error_msg
+            job.group.processing_complete = True
+            job.group.save()
+            count += 1
+
+        if count:
+            logger.warning(f"Expired {count} abandoned processing jobs")
+        return count
+
+
+class JobWorkerPool:
+    """Pool of asyncio workers that drain the processing job queue"""
+
+    def __init__(
+        self,
+        events_service: Optional[EventsService] = None,
+        queue: Optional[JobQueue] = None,
+        workers: Optional[int] = None,
+        poll_interval: Optional[float] = None
+    ):
+        config = get_queue_config()
+        self.events_service = events_service or get_events_service()
+        self.queue = queue or JobQueue()
+        self.workers = workers if workers is not None else config['workers']
+        self.poll_interval = poll_interval if poll_interval is not None else config['poll_interval']
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Ask workers to exit once their current job is finished"""
+        self._stopping.set()
+
+    async def run(self, drain: bool = False) -> None:
+        """
+        Run the worker pool
+
+        Args:
+            drain: If True, return once the queue is empty instead of polling forever
+        """
+        if self.workers < 1:
+            raise JobQueueError("Worker pool needs at least one worker")
+
+        logger.info(f"Starting {self.workers} event processing workers")
+        await asyncio.gather(*(
+            self._worker(worker_id, drain) for worker_id in range(self.workers)
+        ))
+
+    async def _worker(self, worker_id: int, drain: bool) -> None:
+        """Claim and process jobs until stopped"""
+        while not self._stopping.is_set():
+            job = await sync_to_async(self.queue.claim_next)()
+
+            if job is None:
+                if drain:
+                    return
+                await sync_to_async(self.queue.expire_stale)()
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            logger.info(f"Worker {worker_id} processing job {job.id} for group {job.group_id}")
+            await self.process_job(job)
+
+    async def process_job(self, job: ProcessingJob) -> None:
+        """Run a single claimed job and record its outcome"""
+        try:
+            await self.events_service.process_events_group(job.group, job.text, job.use_llm)
+            await sync_to_async(self.queue.mark_done)(job)
+        except Exception as e:
+            logger.error(f"Processing job {job.id} failed: {str(e)}")
+            await sync_to_async(self.queue.mark_failed)(job, str(e))
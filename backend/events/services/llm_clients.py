@@ -0,0 +1,122 @@
+# events/services/llm_clients.py
+from typing import Dict, Any, Optional, Tuple
+from django.conf import settings
+import asyncio
+import logging
+import threading
+import weakref
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LLM_CLIENT_CONFIG = {
+    'timeout': 60,
+    'connect_timeout': 5,
+    'max_retries': 2,
+    'pool_size': 100,
+    'pool_size_per_host': 20,
+    'keepalive_timeout': 30,
+}
+
+SUPPORTED_PROVIDERS = ('openai', 'anthropic')
+
+
+def get_llm_client_config() -> Dict[str, Any]:
+    """Get cloud LLM client configuration merged with defaults"""
+    return {**DEFAULT_LLM_CLIENT_CONFIG, **getattr(settings, 'LLM_CLIENT', {})}
+
+
+class LLMClientPool:
+    """
+    Lazily created async SDK clients shared by every caller on an event loop
+
+    Both providers get the same httpx connection pool limits and timeouts,
+    so a parse costs one keep-alive connection instead of a new client and
+    TLS handshake per service. httpx connections are bound to the loop
+    they were opened on, so clients are kept per running loop, like
+    SessionPool does for aiohttp.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        self.config = {**get_llm_client_config(), **(config or {})}
+        self._clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple, Any]]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _build_http_client(self):
+        import httpx
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.config['pool_size'],
+                max_keepalive_connections=self.config['pool_size_per_host'],
+                keepalive_expiry=self.config['keepalive_timeout']
+            ),
+            timeout=httpx.Timeout(self.config['timeout'], connect=self.config['connect_timeout'])
+        )
+
+    def _build_client(self, provider: str, provider_config: Dict[str, Any]):
+        kwargs = {
+            'api_key': provider_config['api_key'],
+            'max_retries': self.config['max_retries'],
+            'timeout': self.config['timeout'],
+            'http_client': self._build_http_client(),
+        }
+        if provider_config.get('base_url'):
+            kwargs['base_url'] = provider_config['base_url']
+
+        if provider == 'openai':
+            from openai import AsyncOpenAI
+            return AsyncOpenAI(**kwargs)
+        from anthropic import AsyncAnthropic
+        return AsyncAnthropic(**kwargs)
+
+    def get_client(self, provider: str, provider_config: Dict[str, Any]):
+        """Get the client for provider on the running event loop, creating it on first use"""
+        if provider not in SUPPORTED_PROVIDERS:
+            raise ValueError(f"Unsupported provider: {provider}")
+
+        loop = asyncio.get_running_loop()
+        key = (provider, provider_config.get('api_key'), provider_config.get('base_url'))
+        with self._lock:
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None or client.is_closed():
+                client = self._build_client(provider, provider_config)
+                clients[key] = client
+                logger.debug(f"Opened {provider} client pool")
+            return client
+
+    async def close(self) -> None:
+        """Close the clients bound to the running event loop, if any"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.pop(loop, {})
+        for (provider, _, _), client in clients.items():
+            if not client.is_closed():
+                await client.close()
+                logger.debug(f"Closed {provider} client pool")
+
+
+_llm_client_pool: Optional[LLMClientPool] = None
+_llm_client_pool_lock = threading.Lock()
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """Get the process-wide LLM client pool"""
+    global _llm_client_pool
+    if _llm_client_pool is None:
+        with _llm_client_pool_lock:
+            if _llm_client_pool is None:
+                _llm_client_pool = LLMClientPool()
+    return _llm_client_pool
+
+
+async def close_llm_clients() -> None:
+    """Close the pooled LLM clients bound to the running event loop"""
+    if _llm_client_pool is None:
+        return
+    try:
+        await _llm_client_pool.close()
+    except Exception as e:
+        logger.error(f"Failed to close LLM client pools: {str(e)}")
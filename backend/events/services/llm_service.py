@@ -1,12 +1,21 @@
 # events/services/llm_service.py
-from openai import AsyncOpenAI
-import anthropic
 import json
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from datetime import datetime, timedelta, date
+from typing import Dict, Any, Optional, List, AsyncIterator
 from zoneinfo import ZoneInfo
 import pytz
 from .llm_config import LLMConfig
+from .llm_clients import get_llm_client_pool
+from .circuit_breaker import get_provider_guard
+from .coalescing import get_request_coalescer
+from .rate_limit import estimate_tokens, get_rate_limiter
+from .parse_cache import ParseCache, get_parse_cache
+from .prompts import (
+    ANTHROPIC_SYSTEM_PROMPT, OPENAI_SYSTEM_PROMPT, PARSE_INSTRUCTIONS,
+    format_parse_prompt, parse_request_text
+)
+from .stream_parser import EventsStreamParser
+from .recurrence import RecurrenceError, normalize_rrule
 from django.conf import settings
 import logging
 from events.models import EventsGroup
@@ -18,70 +27,49 @@ class LLMServiceError(Exception):
     """Custom exception for LLM processing errors"""
     pass
 
+class ProviderUnavailableError(LLMServiceError):
+    """Raised without calling a provider whose circuit is open or that is saturated"""
+    pass
+
+class ProviderRateLimitedError(ProviderUnavailableError):
+    """Raised when a provider's rate limit (client-side or a 429) leaves no room for the call"""
+    pass
+
 class LLMService:
     """Service for processing natural language using LLM APIs"""
     
-    def __init__(self):
+    def __init__(self, provider: Optional[str] = None):
         self.config = LLMConfig()
+        # Defaults to the provider selected in llm_config.json
+        self.provider = provider or self.config.provider
+        self.cache = get_parse_cache()
         self._initialize_client()
 
     def _initialize_client(self):
-        """Initialize the appropriate LLM client based on configuration"""
-        provider = self.config.config['provider']
+        """Check the provider's SDK is available and read its model"""
+        provider = self.provider
         
         try:
+            # SDKs are imported here so importing this module stays cheap
             if provider == 'openai':
-                openai_api_key = self.config.get_provider_config('openai')['api_key']
-                self.client = AsyncOpenAI(api_key=openai_api_key)
-                self.model = self.config.get_provider_config('openai')['model']
+                import openai  # noqa: F401
             elif provider == 'anthropic':
-                api_key = self.config.get_provider_config('anthropic')['api_key']
-                self.client = anthropic.Anthropic(api_key=api_key)
-                self.model = self.config.get_provider_config('anthropic')['model']
+                import anthropic  # noqa: F401
             else:
                 raise LLMServiceError(f"Unsupported provider: {provider}")
+            self.provider_config = self.config.get_provider_config(provider)
+            self.model = self.provider_config['model']
         except Exception as e:
             raise LLMServiceError(f"Failed to initialize LLM client: {str(e)}")
 
-    def _format_prompt(self, text: str) -> str:
-        """Format the input text into a detailed prompt supporting multiple event parsing"""
-        today = datetime.now()
-        weekday = today.strftime('%A')
-        
-        return f"""Please parse the following text into one or more events and return the result as JSON.
-
-    Today is {today.strftime('%Y-%m-%d')} ({weekday}). 
-
-    The text may contain multiple events. Please analyze and identify if multiple events are described.
-
-    Return your response as a JSON object with the following structure:
-    {{
-        "is_multi_event": boolean,  # True if multiple events detected
-        "events": [  # Array of events (even for single event)
-            {{
-                "title": string (required),
-                "start_date": "YYYY-MM-DD" (required),
-                "start_time": "HH:MM" 24-hour format (required),
-                "end_date": "YYYY-MM-DD" (if not provided, use start_date),
-                "end_time": "HH:MM" 24-hour format (if not provided, start_time + 1 hour),
-                "location": string (optional),
-                "venue": string (optional),
-                "attendees": [
-                    {{
-                        "name": string,
-                        "email": string (optional)
-                    }}
-                ],
-                "notes": string (optional - special instructions/reminders),
-                "suggestions": array of strings (1-2 helpful suggestions) (required)
-            }}
-        ]
-    }}
-
-    Text to parse: {text}
-
-    Remember to return only valid JSON matching the above structure."""
+    @property
+    def client(self):
+        """Async SDK client for the provider, shared by every service on the running loop"""
+        return get_llm_client_pool().get_client(self.provider, self.provider_config)
 
+    def _format_prompt(self, text: str, today: Optional[date] = None) -> str:
+        """Format the input text into a detailed prompt supporting multiple event parsing"""
+        return format_parse_prompt(text, today)
 
     def _validate_dates(self, event: Dict[str, Any]) -> None:
         """Validate dates are in the future and properly ordered"""
@@ -121,13 +109,24 @@ class LLMService:
             List of parsed event dictionaries
         """
         try:
-            provider = self.config.config['provider']
-            prompt = self._format_prompt(text)
+            provider = self.provider
+            today = datetime.now().date()
             
-            if provider == 'openai':
-                result = await self._process_with_openai(prompt)
-            else:  # anthropic
-                result = await self._process_with_anthropic(prompt)
+            # Identical text for the same provider, model and day parses identically
+            cache_key = ParseCache.make_key(text, provider, self.model, today)
+            result = await self.cache.aget(cache_key)
+            cache_hit = result is not None
+            shared = False
+            
+            if cache_hit:
+                logger.info(f"Parse cache hit for {provider}/{self.model}")
+            else:
+                request_text = parse_request_text(text, today)
+                
+                # Concurrent parses of the same text share one provider call
+                result, shared = await get_request_coalescer().run(
+                    cache_key, lambda: self._call_provider(request_text)
+                )
             
             # Validate the overall structure
             if not isinstance(result, dict):
@@ -135,22 +134,73 @@ class LLMService:
             if 'events' not in result or not isinstance(result['events'], list):
                 raise LLMServiceError("Response missing events array")
             
-            parsed_events = []
-            for event_data in result['events']:
-                # Validate each event
-                self._validate_single_event(event_data)
-                self._validate_dates(event_data)
-                
-                # Format datetime strings
-                formatted_event = self._format_event_data(event_data)
-                parsed_events.append(formatted_event)
+            parsed_events = [
+                self._validate_and_format_event(event_data)
+                for event_data in result['events']
+            ]
+            
+            # Only results that passed validation are worth reusing
+            if not cache_hit and not shared:
+                await self.cache.aset(cache_key, result, provider, self.model)
             
             return parsed_events
 
+        except ProviderUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Failed to parse events with {provider}: {str(e)}")
             raise LLMServiceError(f"Failed to parse events: {str(e)}")
 
+    async def stream_events(self, text: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parse natural language text, yielding each event as soon as the model finishes it
+        
+        Args:
+            text: The natural language text to parse
+        
+        Yields:
+            Parsed event dictionaries, in the same format as parse_events
+        """
+        provider = self.provider
+        today = datetime.now().date()
+        
+        cache_key = ParseCache.make_key(text, provider, self.model, today)
+        cached = await self.cache.aget(cache_key)
+        if cached is not None:
+            logger.info(f"Parse cache hit for {provider}/{self.model}")
+            for event_data in cached['events']:
+                yield self._validate_and_format_event(event_data)
+            return
+        
+        request_text = parse_request_text(text, today)
+        parser = EventsStreamParser()
+        chunks = self._stream_provider(request_text)
+        
+        try:
+            async for chunk in chunks:
+                for event_data in parser.feed(chunk):
+                    yield self._validate_and_format_event(event_data)
+        
+        except LLMServiceError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to stream events with {provider}: {str(e)}")
+            raise LLMServiceError(f"Failed to stream events: {str(e)}")
+        finally:
+            # Ends the provider call (and frees its slot) if the caller stopped early
+            await chunks.aclose()
+        
+        if not parser.complete:
+            raise LLMServiceError("Response stream ended before the JSON was complete")
+        
+        await self.cache.aset(cache_key, {'events': parser.events}, provider, self.model)
+
+    def _validate_and_format_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate a single raw event from the model and format it for persistence"""
+        self._validate_single_event(event_data)
+        self._validate_dates(event_data)
+        return self._format_event_data(event_data)
+
     def _validate_single_event(self, event: Dict[str, Any]) -> None:
         """Validate a single event has all required fields in correct format"""
         required_fields = ['title', 'start_date', 'start_time', 'suggestions']
@@ -184,6 +234,13 @@ class LLMService:
         if not event['suggestions']:
             raise LLMServiceError("At least one suggestion is required")
 
+        # Validate recurrence rule if present
+        if event.get('recurrence'):
+            try:
+                normalize_rrule(event['recurrence'])
+            except RecurrenceError as e:
+                raise LLMServiceError(str(e))
+
         # Validate attendees if present
         if 'attendees' in event:
             if not isinstance(event['attendees'], list):
@@ -234,46 +291,129 @@ class LLMService:
             'venue': event_data.get('venue', ''),
             'notes': event_data.get('notes', ''),
             'suggestions': '\n'.join(event_data.get('suggestions', [])),
-            'attendees': attendees
+            'attendees': attendees,
+            'rrule': normalize_rrule(event_data.get('recurrence'))
+        }
+
+    def _openai_request(self, request_text: str) -> Dict[str, Any]:
+        """
+        Build the chat completion arguments for the event-parsing prompt
+        
+        The instructions go in the system message so every call starts with
+        the same tokens, which OpenAI caches automatically as a prompt prefix.
+        """
+        return {
+            'model': self.model,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": f"{OPENAI_SYSTEM_PROMPT}\n\n{PARSE_INSTRUCTIONS}"
+                },
+                {
+                    "role": "user",
+                    "content": request_text
+                }
+            ],
+            'temperature': 0.1,
+            'response_format': { "type": "json_object" }
+        }
+
+    def _anthropic_request(self, request_text: str) -> Dict[str, Any]:
+        """
+        Build the messages API arguments for the event-parsing prompt
+        
+        The instructions are a system block marked for prompt caching, so
+        later calls read them from the cache instead of reprocessing them.
+        """
+        return {
+            'model': self.model,
+            'max_tokens': 1000,
+            'temperature': 0.1,
+            'system': [{
+                "type": "text",
+                "text": f"{ANTHROPIC_SYSTEM_PROMPT}\n\n{PARSE_INSTRUCTIONS}",
+                "cache_control": {"type": "ephemeral"}
+            }],
+            'messages': [{
+                "role": "user",
+                "content": request_text
+            }]
         }
 
-    async def _process_with_openai(self, prompt: str) -> Dict[str, Any]:
+    async def _call_provider(self, request_text: str) -> Dict[str, Any]:
+        """
+        One provider call under its rate limit, circuit breaker and concurrency limit
+        
+        The rate limit is waited on first, so queued calls do not hold a
+        concurrency slot.
+        """
+        limiter = get_rate_limiter(self.provider, self.model)
+        if limiter is not None:
+            await limiter.acquire(estimate_tokens(PARSE_INSTRUCTIONS + request_text))
+        
+        async with get_provider_guard(self.provider).call():
+            if self.provider == 'openai':
+                return await self._process_with_openai(request_text)
+            return await self._process_with_anthropic(request_text)
+
+    async def _stream_provider(self, request_text: str) -> AsyncIterator[str]:
+        """
+        One streamed provider call under the same limits as _call_provider
+        
+        The concurrency slot is held until the stream ends, and the whole
+        stream counts as one call for the circuit breaker, judged slow on its
+        time to first token.
+        """
+        limiter = get_rate_limiter(self.provider, self.model)
+        if limiter is not None:
+            await limiter.acquire(estimate_tokens(PARSE_INSTRUCTIONS + request_text))
+        
+        async with get_provider_guard(self.provider).call() as timing:
+            if self.provider == 'openai':
+                chunks = self._stream_with_openai(request_text)
+            else:  # anthropic
+                chunks = self._stream_with_anthropic(request_text)
+            try:
+                async for chunk in chunks:
+                    timing.mark_first_token()
+                    yield chunk
+            finally:
+                await chunks.aclose()
+
+    def _rate_limited_error(self, error: Exception) -> Optional[ProviderRateLimitedError]:
+        """ProviderRateLimitedError for an SDK 429, holding back later calls for Retry-After"""
+        if getattr(error, 'status_code', None) != 429:
+            return None
+        
+        retry_after = None
+        response = getattr(error, 'response', None)
+        if response is not None:
+            try:
+                retry_after = float(response.headers.get('retry-after'))
+            except (TypeError, ValueError):
+                pass
+        limiter = get_rate_limiter(self.provider, self.model)
+        if limiter is not None:
+            limiter.penalize(retry_after)
+        return ProviderRateLimitedError(f"{self.provider} rate limit exceeded: {str(error)}")
+
+    async def _process_with_openai(self, request_text: str) -> Dict[str, Any]:
         """Process text using OpenAI API asynchronously"""
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a precise event parser. Always return JSON. Format dates as YYYY-MM-DD and times as HH:MM in 24-hour format."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Return JSON. {prompt}"
-                    }
-                ],
-                temperature=0.1,
-                response_format={ "type": "json_object" }
-            )
+            response = await self.client.chat.completions.create(**self._openai_request(request_text))
             
             return json.loads(response.choices[0].message.content)
                 
         except Exception as e:
+            rate_limited = self._rate_limited_error(e)
+            if rate_limited:
+                raise rate_limited
             raise LLMServiceError(f"OpenAI processing failed: {str(e)}")
 
-    async def _process_with_anthropic(self, prompt: str) -> Dict[str, Any]:
+    async def _process_with_anthropic(self, request_text: str) -> Dict[str, Any]:
         """Process text using Anthropic API asynchronously"""
         try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                temperature=0.1,
-                system="You are a precise event parser. Always return valid JSON following the specified format.",
-                messages=[{
-                    "role": "user",
-                    "content": f"Return the following as JSON. {prompt}"
-                }]
-            )
+            response = await self.client.messages.create(**self._anthropic_request(request_text))
             
             # Extract JSON from response
             content = response.content[0].text
@@ -284,42 +424,67 @@ class LLMService:
             return json.loads(content)
                 
         except Exception as e:
+            rate_limited = self._rate_limited_error(e)
+            if rate_limited:
+                raise rate_limited
             raise LLMServiceError(f"Anthropic processing failed: {str(e)}")
 
-    async def process_with_fallback(self, text: str) -> List[Dict[str, Any]]:
+    async def _stream_with_openai(self, request_text: str) -> AsyncIterator[str]:
+        """Stream response text from the OpenAI API"""
+        try:
+            stream = await self.client.chat.completions.create(
+                **self._openai_request(request_text),
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                    
+        except Exception as e:
+            rate_limited = self._rate_limited_error(e)
+            if rate_limited:
+                raise rate_limited
+            raise LLMServiceError(f"OpenAI streaming failed: {str(e)}")
+
+    async def _stream_with_anthropic(self, request_text: str) -> AsyncIterator[str]:
+        """Stream response text from the Anthropic API"""
+        try:
+            stream = await self.client.messages.create(
+                **self._anthropic_request(request_text),
+                stream=True
+            )
+            async for event in stream:
+                if event.type == 'content_block_delta' and getattr(event.delta, 'text', None):
+                    yield event.delta.text
+                    
+        except Exception as e:
+            rate_limited = self._rate_limited_error(e)
+            if rate_limited:
+                raise rate_limited
+            raise LLMServiceError(f"Anthropic streaming failed: {str(e)}")
+
+    async def process_with_fallback(
+        self, 
+        text: str, 
+        group: Optional[EventsGroup] = None, 
+        budget: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Process text with fallback to alternative provider if primary fails
+        Process text with this service's provider, failing over (and hedging) to the others
+        
+        Goes through the shared ProviderRouter, which holds its own client
+        per provider, so this service's provider and client are never
+        switched in place.
         
         Args:
             text: The natural language text to parse
+            group: The EventsGroup to associate the events with
+            budget: Seconds to wait for any provider (defaults to PROVIDER_ROUTER['budget'])
             
         Returns:
             List of parsed event dictionaries
         """
-        primary_provider = self.config.config['provider']
-        try:
-            return await self.parse_events(text)
-        except LLMServiceError as e:
-            # Log the primary failure
-            logger.warning(f"Primary provider ({primary_provider}) failed: {str(e)}")
-            
-            # Try alternate provider
-            alternate_provider = 'anthropic' if primary_provider == 'openai' else 'openai'
-            try:
-                # Temporarily switch provider
-                self.config.config['provider'] = alternate_provider
-                self._initialize_client()
-                result = await self.parse_events(text)
-                
-                # If successful, log the recovery
-                logger.info(f"Successfully recovered using {alternate_provider}")
-                return result
-                
-            except Exception as fallback_error:
-                raise LLMServiceError(
-                    f"Both providers failed. Primary: {str(e)}, Fallback: {str(fallback_error)}"
-                )
-            finally:
-                # Restore original provider
-                self.config.config['provider'] = primary_provider
-                self._initialize_client()
\ No newline at end of file
+        from .registry import get_provider_router
+        
+        router = get_provider_router()
+        return await router.parse_events(text, group, budget=budget, providers=router.order(self.provider))
@@ -0,0 +1,32 @@
+# events/services/loop_pools.py
+from typing import Any, Awaitable, Callable, TypeVar
+from asgiref.sync import async_to_sync
+from .http_session import close_session_pools
+from .llm_clients import close_llm_clients
+
+T = TypeVar('T')
+
+
+async def close_loop_pools() -> None:
+    """Close the pooled HTTP sessions and LLM clients bound to the running event loop"""
+    await close_session_pools()
+    await close_llm_clients()
+
+
+def run_sync(func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    """
+    Call an async function from sync code on a private event loop
+
+    Pools are kept per loop and only the ASGI lifespan closes the shared
+    ones, so anything opened on this short-lived loop is closed before it
+    finishes. The loop is always a new one (never the caller's ASGI loop),
+    which keeps those shared pools out of reach; thread-sensitive database
+    calls still run on the calling thread.
+    """
+    async def call():
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            await close_loop_pools()
+
+    return async_to_sync(call, force_new_loop=True)()
@@ -6,18 +6,62 @@ from typing import Dict, Any, Optional, List, Tuple
 from zoneinfo import ZoneInfo
 import re
 import uuid
+from django.conf import settings
 from django.utils import timezone  # Import Django's timezone utility
 
+DEFAULT_NLP_CONFIG = {
+    'model': 'en_core_web_sm',
+    # Only NER, the dependency parse and noun_chunks (tagger/attribute_ruler) are used
+    'exclude': ['lemmatizer'],
+    'batch_size': 64,
+    'n_process': 1,
+}
+
+DEFAULT_SUGGESTIONS = ["Remember to confirm attendance", "Set up a reminder"]
+
+TWENTY_FOUR_HOUR_TIME = r'\b(?P<hour>[01]?\d|2[0-3]):(?P<minute>[0-5]\d)\b'
+# Only times _extract_time understands count, or a confident parse gets the default hour
+EXPLICIT_TIME_PATTERN = re.compile(
+    r'\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b|\b(?:[01]?\d|2[0-3]):[0-5]\d\b|\bnoon\b|\bmidnight\b',
+    re.IGNORECASE
+)
+MONTH_NAMES = (
+    r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?'
+    r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)'
+)
+DAY_NUMBER = r'\d{1,2}(?:st|nd|rd|th)?'
+# Month names only count next to a day number: "may" alone is usually the verb
+EXPLICIT_DATE_PATTERN = re.compile(
+    r'\b(?:today|tonight|tomorrow|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b'
+    rf'|\b{MONTH_NAMES}\.?\s+{DAY_NUMBER}\b|\b{DAY_NUMBER}\s+(?:of\s+)?{MONTH_NAMES}\b'
+    r'|\b\d{4}-\d{2}-\d{2}\b|\b\d{1,2}/\d{1,2}(?:/\d{2,4})?\b',
+    re.IGNORECASE
+)
+# Phrasing that usually means several events, or one the rule-based parser can't express
+ESCALATION_PATTERN = re.compile(
+    r'\b(?:every|each|daily|weekly|monthly|biweekly|recurring|and then|after that|followed by)\b',
+    re.IGNORECASE
+)
+
 class NLPServiceError(Exception):
     """Custom exception for NLP processing errors"""
     pass
 
+
+def get_nlp_config() -> Dict[str, Any]:
+    """Get spaCy pipeline configuration merged with defaults"""
+    return {**DEFAULT_NLP_CONFIG, **getattr(settings, 'NLP_CONFIG', {})}
+
 class NLPService:
     """Service for parsing natural language event descriptions using spaCy"""
     
-    def __init__(self):
-        # Load English language model
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(self, batch_size: Optional[int] = None, n_process: Optional[int] = None):
+        config = get_nlp_config()
+        self.batch_size = batch_size or config['batch_size']
+        self.n_process = n_process or config['n_process']
+        
+        # Load English language model without the components we never read
+        self.nlp = spacy.load(config['model'], exclude=config['exclude'])
         
         # Time patterns with named groups
         self.time_patterns = [
@@ -50,36 +94,187 @@ class NLPService:
         }
         """
         try:
-            # Process text with spaCy
-            doc = self.nlp(text)
-            
-            # Extract date and time
-            start_dt, end_dt = self._extract_datetime(doc, text)
-            
-            # Extract location information
-            location, venue = self._extract_location(text)
+            return self._event_from_doc(self.nlp(text))
+        except Exception as e:
+            raise NLPServiceError(f"Failed to parse event text: {str(e)}")
+
+    def parse_events_batch(
+        self, 
+        texts: List[str], 
+        batch_size: Optional[int] = None, 
+        n_process: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse many texts at once with nlp.pipe
+        
+        Much faster than calling parse_event in a loop for bulk imports,
+        since spaCy batches the texts through each pipeline component.
+        
+        Args:
+            texts: Natural language texts to parse
+            batch_size: Texts per spaCy batch (defaults to NLP_CONFIG['batch_size'])
+            n_process: Worker processes for spaCy (defaults to NLP_CONFIG['n_process'])
             
-            # Extract people/attendees
-            attendees = self._extract_attendees(doc)
+        Returns:
+            One parse_event result per text, in input order
             
-            # Generate title and description
-            title = self._generate_title(doc)
-            description = self._generate_description(doc)
+        Raises:
+            NLPServiceError: If parsing fails
+        """
+        try:
+            return [self._event_from_doc(doc) for doc in self._pipe(texts, batch_size, n_process)]
+        except Exception as e:
+            raise NLPServiceError(f"Failed to parse event texts: {str(e)}")
+
+    def parse_batch_with_confidence(
+        self, 
+        texts: List[str], 
+        batch_size: Optional[int] = None, 
+        n_process: Optional[int] = None
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Batched variant of parse_with_confidence using nlp.pipe
+        
+        Returns:
+            One (event data, confidence) tuple per text, in input order
             
-            # Format the response to match the Event model expectations
-            return {
-                'title': title,
-                'description': description,
-                'start_datetime': start_dt.isoformat(),
-                'end_datetime': end_dt.isoformat() if end_dt else None,
-                'location': location or '',  # Ensure non-null
-                'venue': venue or '',  # Ensure non-null
-                'attendees': [{'name': name, 'email': ''} for name in attendees if name]  # Filter empty names
-            }
+        Raises:
+            NLPServiceError: If parsing fails
+        """
+        try:
+            return [self._scored_event_from_doc(doc) for doc in self._pipe(texts, batch_size, n_process)]
+        except Exception as e:
+            raise NLPServiceError(f"Failed to parse event texts: {str(e)}")
+
+    def parse_with_confidence(self, text: str) -> Tuple[Dict[str, Any], float]:
+        """
+        Parse text into a single event together with a confidence score
+        
+        The event is returned in the same format as LLMService.parse_events
+        entries, so it can be persisted by EventsService directly.
+        
+        Returns:
+            Tuple of (event data, confidence between 0.0 and 1.0). Text that
+            looks like several events or a recurring event scores 0.0.
             
+        Raises:
+            NLPServiceError: If parsing fails
+        """
+        try:
+            return self._scored_event_from_doc(self.nlp(text))
         except Exception as e:
             raise NLPServiceError(f"Failed to parse event text: {str(e)}")
 
+    def _pipe(self, texts: List[str], batch_size: Optional[int], n_process: Optional[int]):
+        return self.nlp.pipe(
+            texts,
+            batch_size=batch_size or self.batch_size,
+            n_process=n_process or self.n_process
+        )
+
+    def _event_from_doc(self, doc: spacy.tokens.Doc) -> Dict[str, Any]:
+        """Build the parse_event result for a processed document"""
+        text = doc.text
+        
+        # Extract date and time
+        start_dt, end_dt = self._extract_datetime(doc, text)
+        
+        # Extract location information
+        location, venue = self._extract_location(text)
+        
+        # Extract people/attendees
+        attendees = self._extract_attendees(doc)
+        
+        # Generate title and description
+        title = self._generate_title(doc)
+        description = self._generate_description(doc)
+        
+        # Format the response to match the Event model expectations
+        return {
+            'title': title,
+            'description': description,
+            'start_datetime': start_dt.isoformat(),
+            'end_datetime': end_dt.isoformat() if end_dt else None,
+            'location': location or '',  # Ensure non-null
+            'venue': venue or '',  # Ensure non-null
+            'attendees': [{'name': name, 'email': ''} for name in attendees if name]  # Filter empty names
+        }
+
+    def _scored_event_from_doc(self, doc: spacy.tokens.Doc) -> Tuple[Dict[str, Any], float]:
+        """Build the parse_with_confidence result for a processed document"""
+        text = doc.text
+        
+        start_dt, end_dt = self._extract_datetime(doc, text)
+        location, venue = self._extract_location(text)
+        # Only named entities: the "with ..." patterns are too loose to skip the LLM on
+        attendees = list(dict.fromkeys(
+            ent.text for ent in doc.ents if ent.label_ == 'PERSON'
+        ))
+        title = self._generate_title(doc)
+        
+        confidence = self._score_confidence(text, title, location, venue, attendees)
+        
+        return {
+            'title': title,
+            'start_datetime': start_dt,
+            'end_datetime': end_dt,
+            'location': location or '',
+            'venue': venue or '',
+            'notes': '',
+            'suggestions': '\n'.join(DEFAULT_SUGGESTIONS),
+            'attendees': [{'name': name, 'email': ''} for name in attendees]
+        }, confidence
+
+    def _score_confidence(
+        self, 
+        text: str, 
+        title: str, 
+        location: str, 
+        venue: str, 
+        attendees: List[str]
+    ) -> float:
+        """
+        Score how far a rule-based parse can be trusted
+        
+        An explicit time and date carry most of the weight since they are
+        what the extraction falls back to guessing. Anything suggesting more
+        than one event scores 0.0 so it always goes to the LLM.
+        """
+        time_mentions = EXPLICIT_TIME_PATTERN.findall(text)
+        date_mentions = {match.lower() for match in EXPLICIT_DATE_PATTERN.findall(text)}
+        
+        if (
+            ESCALATION_PATTERN.search(text)
+            or len(time_mentions) > 2
+            or len(date_mentions) > 1
+            or len([line for line in re.split(r'[\n;]+', text) if line.strip()]) > 1
+        ):
+            return 0.0
+        
+        score = 0.0
+        if time_mentions:
+            score += 0.35
+        if date_mentions:
+            score += 0.3
+        if title and title != 'New Event':
+            score += 0.15
+        
+        place = venue or location
+        if place:
+            # A place that swallowed a time or date means the patterns misfired
+            if EXPLICIT_TIME_PATTERN.search(place) or EXPLICIT_DATE_PATTERN.search(place):
+                score -= 0.2
+            else:
+                score += 0.1
+        if attendees:
+            score += 0.1
+        
+        # Long descriptions tend to carry details the rules don't capture
+        if len(text.split()) > 30:
+            score -= 0.3
+        
+        return round(max(0.0, min(1.0, score)), 2)
+
     def _extract_datetime(self, doc: spacy.tokens.Doc, text: str) -> Tuple[datetime, Optional[datetime]]:
         """Extract start and end datetime information"""
         # First try to find explicit date mentions using spaCy's entity recognition
@@ -163,6 +358,12 @@ class NLPService:
                     except:
                         continue
         
+        # Named times
+        if re.search(r'\bnoon\b', text):
+            return time(12, 0), None
+        if re.search(r'\bmidnight\b', text):
+            return time(0, 0), None
+        
         # Check for common time formats
         time_matches = re.findall(r'\b(\d{1,2})(?::(\d{2}))?\s*(am|pm|AM|PM)\b', text)
         if time_matches:
@@ -179,6 +380,11 @@ class NLPService:
                 return time(hour, minute), None
             except:
                 pass
+
+        # 24-hour times such as 15:30
+        match = re.search(TWENTY_FOUR_HOUR_TIME, text)
+        if match:
+            return time(int(match.group('hour')), int(match.group('minute'))), None
         
         # Default to current hour if no time found
         return default_time, None
@@ -214,14 +420,13 @@ class NLPService:
 
     def _extract_location(self, text: str) -> Tuple[str, str]:
         """Extract location and venue information"""
-        text = text.lower()
         location = ''
         venue = ''
         
         # First check for venue
         venue_words = ['room', 'office', 'building', 'hall', 'cafe', 'restaurant', 'hotel']
         for pattern in [
-            rf'(?:at|in)\s+(?:the\s+)?([^\.]+?(?:{"|".join(venue_words)}))',
+            rf'(?:at|in)\s+(?:the\s+)?((?:(?!\b(?:at|in|on)\b)[^\.])+?(?:{"|".join(venue_words)}))',
             r'venue:\s*([^\.]+)'
         ]:
             match = re.search(pattern, text, re.IGNORECASE)
@@ -232,13 +437,18 @@ class NLPService:
         # Then check for general location if no venue found
         if not venue:
             location_patterns = [
-                r'(?:at|in)\s+([^\.]+?)(?:\s+on|\s+at|\s*$)',
+                r'(?:at|in)\s+([^\.]+?)(?=\s+on\b|\s+at\b|\s+in\b|\s*$)',
                 r'location:\s*([^\.]+)'
             ]
             for pattern in location_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    location = match.group(1).strip()
+                for match in re.finditer(pattern, text, re.IGNORECASE):
+                    candidate = match.group(1).strip()
+                    # "at noon" / "at 3pm" is a time, not a place
+                    if EXPLICIT_TIME_PATTERN.fullmatch(candidate):
+                        continue
+                    location = candidate
+                    break
+                if location:
                     break
         
         return location, venue
@@ -1,31 +1,43 @@
 # events/services/ollama_service.py
 import aiohttp
+import asyncio
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, AsyncIterator
 from datetime import datetime
 import logging
-from .llm_service import LLMServiceError
-from datetime import timedelta
+from .llm_service import LLMServiceError, ProviderUnavailableError
+from .circuit_breaker import get_provider_guard
+from .coalescing import get_request_coalescer
+from .rate_limit import estimate_tokens, get_rate_limiter
+from .parse_cache import ParseCache, get_parse_cache
+from .prompts import PARSE_INSTRUCTIONS, format_parse_prompt, parse_request_text
+from .http_session import get_ollama_session_pool
+from .stream_parser import EventsStreamParser
+from .recurrence import RecurrenceError, normalize_rrule
+from datetime import timedelta, date
 
 logger = logging.getLogger(__name__)
 
 class OllamaService:
     """Service for processing natural language using Ollama local LLM"""
     
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "qwen2"):
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "qwen2", keep_alive: str = "30m"):
         self.base_url = base_url
         self.model = model
+        self.keep_alive = keep_alive
+        self.cache = get_parse_cache()
+        self.session_pool = get_ollama_session_pool()
 
     async def check_connectivity(self) -> bool:
         """Check if the service can connect to the Ollama server"""
         try:
-            async with aiohttp.ClientSession() as session:
-                timeout = aiohttp.ClientTimeout(total=5)
-                async with session.get(
-                    f"{self.base_url}/api/tags",
-                    timeout=timeout
-                ) as response:
-                    return response.status == 200
+            session = self.session_pool.get_session()
+            timeout = aiohttp.ClientTimeout(total=5)
+            async with session.get(
+                f"{self.base_url}/api/tags",
+                timeout=timeout
+            ) as response:
+                return response.status == 200
         except aiohttp.ClientError as e:
             logger.error(f"Ollama connectivity check failed: {str(e)}")
             return False
@@ -36,12 +48,12 @@ class OllamaService:
     async def get_available_models(self) -> List[str]:
         """Get list of available Ollama models"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.base_url}/api/tags") as response:
-                    if response.status != 200:
-                        return []
-                    data = await response.json()
-                    return [model['name'] for model in data.get('models', [])]
+            session = self.session_pool.get_session()
+            async with session.get(f"{self.base_url}/api/tags") as response:
+                if response.status != 200:
+                    return []
+                data = await response.json()
+                return [model['name'] for model in data.get('models', [])]
         except Exception as e:
             logger.error(f"Failed to get available models: {str(e)}")
             return []
@@ -111,54 +123,37 @@ class OllamaService:
                     'venue': event.get('venue', ''),
                     'notes': event.get('notes', ''),
                     'suggestions': '\n'.join(suggestions),
-                    'attendees': attendees
+                    'attendees': attendees,
+                    'rrule': normalize_rrule(event.get('recurrence'))
                 }
                 
                 formatted_events.append(formatted_event)
                 
-            except (ValueError, KeyError) as e:
+            except (ValueError, KeyError, RecurrenceError) as e:
                 raise LLMServiceError(f"Error formatting event data: {str(e)}")
                 
         return formatted_events
 
-    def _format_prompt(self, text: str) -> str:
+    def _format_prompt(self, text: str, today: Optional[date] = None) -> str:
         """Format the input text into a detailed prompt supporting multiple event parsing"""
-        today = datetime.now()
-        weekday = today.strftime('%A')
-        
-        return f"""Please parse the following text into one or more events and return the result as JSON.
-
-    Today is {today.strftime('%Y-%m-%d')} ({weekday}). 
-
-    The text may contain multiple events. Please analyze and identify if multiple events are described.
-
-    Return your response as a JSON object with the following structure:
-    {{
-        "is_multi_event": boolean,  # True if multiple events detected
-        "events": [  # Array of events (even for single event)
-            {{
-                "title": string (required),
-                "start_date": "YYYY-MM-DD" (required),
-                "start_time": "HH:MM" 24-hour format (required),
-                "end_date": "YYYY-MM-DD" (if not provided, use start_date),
-                "end_time": "HH:MM" 24-hour format (if not provided, start_time + 1 hour),
-                "location": string (optional),
-                "venue": string (optional),
-                "attendees": [
-                    {{
-                        "name": string,
-                        "email": string (optional)
-                    }}
-                ],
-                "notes": string (optional - special instructions/reminders),
-                "suggestions": array of strings (1-2 helpful suggestions) (required)
-            }}
-        ]
-    }}
-
-    Text to parse: {text}
+        return format_parse_prompt(text, today)
 
-    Remember to return only valid JSON matching the above structure without any additional text or explanations."""
+    def _generate_request(self, request_text: str, stream: bool) -> Dict[str, Any]:
+        """
+        Build the /api/generate body for the event-parsing prompt
+        
+        The instructions go in the system prompt so every call starts with
+        the same tokens; while keep_alive holds the model loaded, Ollama
+        reuses their KV cache instead of evaluating them again.
+        """
+        return {
+            "model": self.model,
+            "system": PARSE_INSTRUCTIONS,
+            "prompt": request_text,
+            "stream": stream,
+            "format": "json",
+            "keep_alive": self.keep_alive
+        }
 
     async def parse_events(self, text: str, group) -> List[Dict[str, Any]]:
         """
@@ -172,45 +167,173 @@ class OllamaService:
             List of parsed event dictionaries
         """
         try:
-            prompt = self._format_prompt(text)
+            today = datetime.now().date()
+            
+            # Identical text for the same model and day parses identically
+            cache_key = ParseCache.make_key(text, 'ollama', self.model, today)
+            cached_data = await self.cache.aget(cache_key)
+            if cached_data is not None:
+                logger.info(f"Parse cache hit for ollama/{self.model}")
+                return self._format_events_data(cached_data['events'])
+            
+            request_text = parse_request_text(text, today)
+            
+            # Concurrent parses of the same text share one call to the server
+            parsed_data, shared = await get_request_coalescer().run(
+                cache_key, lambda: self._generate(request_text)
+            )
+            
+            # Format events data
+            formatted_events = self._format_events_data(parsed_data['events'])
+            
+            # Only results that passed validation are worth reusing
+            if not shared:
+                await self.cache.aset(cache_key, parsed_data, 'ollama', self.model)
             
-            async with aiohttp.ClientSession() as session:
+            return formatted_events
+                    
+        except ProviderUnavailableError:
+            raise
+        except aiohttp.ClientError as e:
+            raise LLMServiceError(f"Failed to connect to Ollama service: {str(e)}")
+        except asyncio.TimeoutError:
+            raise LLMServiceError(
+                f"Ollama request timed out after {self.session_pool.config['timeout']} seconds"
+            )
+        except Exception as e:
+            raise LLMServiceError(f"Ollama processing failed: {str(e)}")
+
+    async def _generate(self, request_text: str) -> Dict[str, Any]:
+        """
+        One /api/generate call under the rate limit, circuit breaker and concurrency limit
+        
+        Returns:
+            The response parsed as JSON, with an events array
+        """
+        limiter = get_rate_limiter('ollama', self.model)
+        if limiter is not None:
+            await limiter.acquire(estimate_tokens(PARSE_INSTRUCTIONS + request_text))
+        
+        async with get_provider_guard('ollama').call():
+            session = self.session_pool.get_session()
+            async with session.post(
+                f"{self.base_url}/api/generate",
+                json=self._generate_request(request_text, stream=False)
+            ) as response:
+                if response.status != 200:
+                    raise LLMServiceError(f"Ollama API returned status {response.status}")
+            
+                result = await response.json()
+                response_text = result.get('response', '')
+            
+                # Clean up response text to ensure valid JSON
+                json_str = response_text.strip()
+                if json_str.startswith('```json'):
+                    json_str = json_str.split('```json')[1].split('```')[0]
+            
+                try:
+                    parsed_data = json.loads(json_str)
+                except json.JSONDecodeError as e:
+                    raise LLMServiceError(f"Failed to parse Ollama response as JSON: {str(e)}")
+            
+                # Validate response structure
+                if not isinstance(parsed_data, dict) or 'events' not in parsed_data:
+                    raise LLMServiceError("Invalid response format from Ollama")
+            
+                if not isinstance(parsed_data['events'], list):
+                    raise LLMServiceError("Events must be an array")
+        
+        return parsed_data
+
+    async def _stream_generate(self, request_text: str) -> AsyncIterator[str]:
+        """
+        One streamed /api/generate call under the same limits as _generate
+        
+        The concurrency slot is held until the stream ends, and the whole
+        stream counts as one call for the circuit breaker, judged slow on its
+        time to first token.
+        """
+        limiter = get_rate_limiter('ollama', self.model)
+        if limiter is not None:
+            await limiter.acquire(estimate_tokens(PARSE_INSTRUCTIONS + request_text))
+        
+        # Long generations are fine as long as tokens keep arriving
+        config = self.session_pool.config
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=config['connect_timeout'],
+            sock_read=config['timeout']
+        )
+        
+        async with get_provider_guard('ollama').call() as timing:
+            try:
+                session = self.session_pool.get_session()
                 async with session.post(
                     f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "format": "json"
-                    }
+                    json=self._generate_request(request_text, stream=True),
+                    timeout=timeout
                 ) as response:
                     if response.status != 200:
                         raise LLMServiceError(f"Ollama API returned status {response.status}")
                     
-                    result = await response.json()
-                    response_text = result.get('response', '')
-                    
-                    # Clean up response text to ensure valid JSON
-                    json_str = response_text.strip()
-                    if json_str.startswith('```json'):
-                        json_str = json_str.split('```json')[1].split('```')[0]
-                    
-                    try:
-                        parsed_data = json.loads(json_str)
-                    except json.JSONDecodeError as e:
-                        raise LLMServiceError(f"Failed to parse Ollama response as JSON: {str(e)}")
-                    
-                    # Validate response structure
-                    if not isinstance(parsed_data, dict) or 'events' not in parsed_data:
-                        raise LLMServiceError("Invalid response format from Ollama")
-                    
-                    if not isinstance(parsed_data['events'], list):
-                        raise LLMServiceError("Events must be an array")
-                    
-                    # Format events data
-                    return self._format_events_data(parsed_data['events'])
+                    # Ollama streams one JSON object per line
+                    async for line in response.content:
+                        if not line.strip():
+                            continue
                         
-        except aiohttp.ClientError as e:
-            raise LLMServiceError(f"Failed to connect to Ollama service: {str(e)}")
+                        message = json.loads(line)
+                        if message.get('error'):
+                            raise LLMServiceError(f"Ollama returned an error: {message['error']}")
+                        
+                        timing.mark_first_token()
+                        yield message.get('response', '')
+                        
+                        if message.get('done'):
+                            break
+                            
+            except aiohttp.ClientError as e:
+                raise LLMServiceError(f"Failed to connect to Ollama service: {str(e)}")
+            except asyncio.TimeoutError:
+                raise LLMServiceError(f"Ollama stream stalled for more than {config['timeout']} seconds")
+
+    async def stream_events(self, text: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Parse natural language text, yielding each event as soon as the model finishes it
+        
+        Args:
+            text: The natural language text to parse
+        
+        Yields:
+            Parsed event dictionaries, in the same format as parse_events
+        """
+        today = datetime.now().date()
+        
+        cache_key = ParseCache.make_key(text, 'ollama', self.model, today)
+        cached_data = await self.cache.aget(cache_key)
+        if cached_data is not None:
+            logger.info(f"Parse cache hit for ollama/{self.model}")
+            for event in self._format_events_data(cached_data['events']):
+                yield event
+            return
+        
+        request_text = parse_request_text(text, today)
+        parser = EventsStreamParser()
+        chunks = self._stream_generate(request_text)
+        
+        try:
+            async for chunk in chunks:
+                for event_data in parser.feed(chunk):
+                    yield self._format_events_data([event_data])[0]
+                        
+        except LLMServiceError:
+            raise
         except Exception as e:
-            raise LLMServiceError(f"Ollama processing failed: {str(e)}")
\ No newline at end of file
+            raise LLMServiceError(f"Ollama streaming failed: {str(e)}")
+        finally:
+            # Ends the request (and frees its slot) if the caller stopped early
+            await chunks.aclose()
+        
+        if not parser.complete:
+            raise LLMServiceError("Ollama stream ended before the JSON was complete")
+        
+        await self.cache.aset(cache_key, {'events': parser.events}, 'ollama', self.model)
@@ -0,0 +1,240 @@
+# events/services/parse_cache.py
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+from datetime import date, timedelta
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from ..models import ParseCacheEntry
+import copy
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from asgiref.sync import sync_to_async
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_CONFIG = {
+    'enabled': True,
+    'memory_max_entries': 512,
+    'db_enabled': True,
+    'db_max_entries': 10000,
+    'db_evict_interval': 100,
+    'ttl': 86400,
+}
+
+
+def get_cache_config() -> Dict[str, Any]:
+    """Get parse cache configuration merged with defaults"""
+    return {**DEFAULT_CACHE_CONFIG, **getattr(settings, 'LLM_PARSE_CACHE', {})}
+
+
+def normalize_text(text: str) -> str:
+    """Normalize input text so trivially different submissions share a cache entry"""
+    text = unicodedata.normalize('NFKC', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class ParseCache:
+    """
+    Two-tier cache of LLM parse results
+
+    Entries are keyed on the normalized input text, provider, model and the
+    reference date used in the prompt. The memory tier is a per-process LRU;
+    the database tier (ParseCacheEntry) survives restarts and is shared
+    between processes. Both tiers expire entries after `ttl` seconds and
+    evict least recently used entries once they exceed their size limit; the
+    database tier is only swept every `db_evict_interval` writes, so it can
+    briefly hold that many entries over its limit.
+    """
+
+    def __init__(
+        self,
+        memory_max_entries: Optional[int] = None,
+        db_max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        enabled: Optional[bool] = None,
+        db_enabled: Optional[bool] = None,
+        db_evict_interval: Optional[int] = None
+    ):
+        config = get_cache_config()
+        self.enabled = config['enabled'] if enabled is None else enabled
+        self.db_enabled = config['db_enabled'] if db_enabled is None else db_enabled
+        self.memory_max_entries = memory_max_entries if memory_max_entries is not None else config['memory_max_entries']
+        self.db_max_entries = db_max_entries if db_max_entries is not None else config['db_max_entries']
+        self.ttl = ttl if ttl is not None else config['ttl']
+        self.db_evict_interval = max(1, db_evict_interval if db_evict_interval is not None else config['db_evict_interval'])
+        self._db_writes = 0
+
+        self._memory: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0,
+            'db_hits': 0,
+            'misses': 0,
+            'sets': 0,
+            'evictions': 0,
+        }
+
+    @staticmethod
+    def make_key(text: str, provider: str, model: str, reference_date: date) -> str:
+        """Build the content address for a parse request"""
+        payload = json.dumps({
+            'text': normalize_text(text),
+            'provider': provider,
+            'model': model,
+            'date': reference_date.isoformat(),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result, checking memory first then the database"""
+        if not self.enabled:
+            return None
+
+        result = self._memory_get(key)
+        if result is not None:
+            self._count('memory_hits')
+            return result
+
+        if self.db_enabled:
+            try:
+                result = self._db_get(key)
+            except Exception as e:
+                logger.warning(f"Failed to read parse cache entry: {str(e)}")
+                result = None
+            if result is not None:
+                self._count('db_hits')
+                self._memory_set(key, result)
+                return result
+
+        self._count('misses')
+        return None
+
+    def set(self, key: str, result: Dict[str, Any], provider: str = '', model: str = '') -> None:
+        """Store a validated parse result in both tiers"""
+        if not self.enabled:
+            return
+
+        self._memory_set(key, result)
+        if self.db_enabled:
+            try:
+                self._db_set(key, result, provider, model)
+            except Exception as e:
+                # The memory tier still holds the result; a DB failure must not fail the parse
+                logger.warning(f"Failed to persist parse cache entry: {str(e)}")
+        self._count('sets')
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get for use inside the LLM services"""
+        return await sync_to_async(self.get)(key)
+
+    async def aset(self, key: str, result: Dict[str, Any], provider: str = '', model: str = '') -> None:
+        """Async variant of set for use inside the LLM services"""
+        await sync_to_async(self.set)(key, result, provider, model)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers and reset the counters"""
+        with self._lock:
+            self._memory.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+        if self.db_enabled:
+            ParseCacheEntry.objects.all().delete()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current tier sizes"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+        lookups = stats['memory_hits'] + stats['db_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['db_hits']) / lookups if lookups else 0.0
+        return stats
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def _memory_get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return copy.deepcopy(result)
+
+    def _memory_set(self, key: str, result: Dict[str, Any]) -> None:
+        if self.memory_max_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = (time.monotonic() + self.ttl, result)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_max_entries:
+                self._memory.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def _db_get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = timezone.now()
+        entry = ParseCacheEntry.objects.filter(key=key, expires_at__gt=now).first()
+        if entry is None:
+            return None
+        ParseCacheEntry.objects.filter(key=key).update(
+            last_accessed=now,
+            hit_count=F('hit_count') + 1
+        )
+        return entry.result
+
+    def _db_set(self, key: str, result: Dict[str, Any], provider: str, model: str) -> None:
+        now = timezone.now()
+        ParseCacheEntry.objects.update_or_create(
+            key=key,
+            defaults={
+                'provider': provider,
+                'model': model,
+                'result': result,
+                'expires_at': now + timedelta(seconds=self.ttl),
+                'last_accessed': now,
+            }
+        )
+        with self._lock:
+            self._db_writes += 1
+            due = self._db_writes >= self.db_evict_interval
+            if due:
+                self._db_writes = 0
+        # Counting the table on every write is the cost; sweep it in batches instead
+        if due:
+            self._db_evict(now)
+
+    def _db_evict(self, now) -> None:
+        """Remove expired entries and trim the table to db_max_entries"""
+        ParseCacheEntry.objects.filter(expires_at__lte=now).delete()
+
+        excess = ParseCacheEntry.objects.count() - self.db_max_entries
+        if excess > 0:
+            stale_keys = list(
+                ParseCacheEntry.objects.order_by('last_accessed').values_list('key', flat=True)[:excess]
+            )
+            ParseCacheEntry.objects.filter(key__in=stale_keys).delete()
+            self._count('evictions', len(stale_keys))
+
+
+_parse_cache: Optional[ParseCache] = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    """Get the process-wide parse cache shared by all LLM services"""
+    global _parse_cache
+    if _parse_cache is None:
+        with _parse_cache_lock:
+            if _parse_cache is None:
+                _parse_cache = ParseCache()
+    return _parse_cache
@@ -0,0 +1,48 @@
+# events/services/prompts.py
+from datetime import date, datetime
+from typing import Optional
+
+OPENAI_SYSTEM_PROMPT = "You are a precise event parser. Always return JSON. Format dates as YYYY-MM-DD and times as HH:MM in 24-hour format."
+ANTHROPIC_SYSTEM_PROMPT = "You are a precise event parser. Always return valid JSON following the specified format."
+
+# Identical on every call and placed before anything that varies, so
+# providers can cache it as a prompt prefix (Anthropic cache_control blocks,
+# OpenAI automatic prefix caching, Ollama's KV cache while the model stays loaded)
+PARSE_INSTRUCTIONS = """Parse the text in the user message into one or more events and return the result as JSON.
+
+The text may contain multiple events. Identify every event it describes. Resolve relative dates ("tomorrow", "next Tuesday") against the date given with the text.
+
+If an event repeats (e.g. "every Monday", "daily for two weeks"), return it once, dated at its first occurrence, with a "recurrence" rule instead of one event per occurrence.
+
+Return a JSON object with this structure:
+{
+  "is_multi_event": boolean,  # True if multiple events detected
+  "events": [  # Array of events (even for single event)
+    {
+      "title": string (required),
+      "start_date": "YYYY-MM-DD" (required),
+      "start_time": "HH:MM" 24-hour format (required),
+      "end_date": "YYYY-MM-DD" (if not provided, use start_date),
+      "end_time": "HH:MM" 24-hour format (if not provided, start_time + 1 hour),
+      "location": string (optional),
+      "venue": string (optional),
+      "attendees": [{"name": string, "email": string (optional)}],
+      "notes": string (optional - special instructions/reminders),
+      "recurrence": string (optional - RFC 5545 RRULE such as "FREQ=WEEKLY;BYDAY=MO;UNTIL=20250630" if the event repeats),
+      "suggestions": array of strings (1-2 helpful suggestions) (required)
+    }
+  ]
+}
+
+Return only valid JSON matching this structure, without any additional text or explanations."""
+
+
+def parse_request_text(text: str, today: Optional[date] = None) -> str:
+    """The per-call part of the parse prompt: today's date and the text"""
+    today = today or datetime.now().date()
+    return f"Today is {today.strftime('%Y-%m-%d')} ({today.strftime('%A')}).\n\nText to parse: {text}"
+
+
+def format_parse_prompt(text: str, today: Optional[date] = None) -> str:
+    """The whole parse prompt as one string, static instructions first"""
+    return f"{PARSE_INSTRUCTIONS}\n\n{parse_request_text(text, today)}"
@@ -0,0 +1,295 @@
+# events/services/provider_router.py
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional
+from collections import deque
+from django.conf import settings
+from .llm_service import LLMServiceError, ProviderUnavailableError
+import asyncio
+import logging
+import math
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROVIDER_ROUTER_CONFIG = {
+    'providers': ['openai', 'anthropic'],
+    'budget': 30,
+    'hedge': True,
+    'hedge_quantile': 0.9,
+    'hedge_delay': 5,
+    'min_samples': 20,
+    'latency_window': 200,
+}
+
+CLOUD_PROVIDERS = ('openai', 'anthropic')
+
+
+def get_router_config() -> Dict[str, Any]:
+    """Get provider router configuration merged with defaults"""
+    return {**DEFAULT_PROVIDER_ROUTER_CONFIG, **getattr(settings, 'PROVIDER_ROUTER', {})}
+
+
+class LatencyTracker:
+    """
+    Recent successful parse latencies per provider
+
+    Keeps a bounded window of samples so quantiles follow the provider's
+    current behaviour rather than its whole history.
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(provider, deque(maxlen=self.window)).append(seconds)
+
+    def quantile(self, provider: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """Latency at quantile q, or None until min_samples have been recorded"""
+        with self._lock:
+            samples = sorted(self._samples.get(provider, ()))
+        if not samples or len(samples) < max(1, min_samples):
+            return None
+        return samples[min(len(samples) - 1, int(math.ceil(q * len(samples))) - 1)]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Sample count, p50 and p90 per provider"""
+        with self._lock:
+            providers = list(self._samples)
+        return {
+            provider: {
+                'samples': len(self._samples[provider]),
+                'p50': self.quantile(provider, 0.5),
+                'p90': self.quantile(provider, 0.9),
+            }
+            for provider in providers
+        }
+
+
+class ProviderRouter:
+    """
+    Routes a parse across providers with a latency budget, failover and hedging
+
+    Each provider has its own service (and client), built on first use, so
+    routing never switches a shared service's provider in place. The first
+    provider is called at once; if it fails, the next one starts
+    immediately. If it is still running at its p90 latency (or
+    PROVIDER_ROUTER['hedge_delay'] until enough samples exist), the next one
+    is started as a hedge and whichever answers first wins; the others are
+    cancelled. Nothing runs past the request's budget.
+    """
+
+    def __init__(
+        self,
+        services: Optional[Dict[str, Callable[[], Any]]] = None,
+        config: Optional[Dict[str, Any]] = None,
+        latency: Optional[LatencyTracker] = None
+    ):
+        """
+        Args:
+            services: Zero-argument factories by provider name, overriding the
+                defaults (the shared LLM service for the configured provider,
+                an LLMService per other cloud provider, the shared Ollama service)
+            config: Overrides for PROVIDER_ROUTER settings
+            latency: Latency samples (defaults to the process-wide tracker)
+        """
+        self.config = {**get_router_config(), **(config or {})}
+        self.latency = latency or get_latency_tracker()
+        self._factories = services or {}
+        self._services: Dict[str, Any] = {}
+        self._unavailable: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def providers(self) -> List[str]:
+        """Configured providers in failover order"""
+        return list(self.config['providers'])
+
+    def order(self, primary: Optional[str] = None) -> List[str]:
+        """Configured providers with primary moved to the front"""
+        if not primary:
+            return self.providers
+        return [primary] + [provider for provider in self.providers if provider != primary]
+
+    def service(self, provider: str):
+        """Get the service for provider, building it on first use"""
+        if provider in self._services:
+            return self._services[provider]
+
+        with self._lock:
+            if provider not in self._services:
+                factory = self._factories.get(provider) or _default_factory(provider)
+                self._services[provider] = factory()
+            return self._services[provider]
+
+    def available(self, providers: Optional[List[str]] = None) -> List[str]:
+        """Providers whose service can be built, in the given order"""
+        names = []
+        for provider in providers if providers is not None else self.providers:
+            if provider in self._unavailable or provider in names:
+                continue
+            try:
+                self.service(provider)
+                names.append(provider)
+            except Exception as e:
+                # Missing keys or SDKs do not change at runtime, so skip the provider from now on
+                self._unavailable[provider] = str(e)
+                logger.warning(f"Provider {provider} unavailable for routing: {str(e)}")
+        return names
+
+    def hedge_delay(self, provider: str) -> float:
+        """Seconds to wait on provider before starting the next one"""
+        if not self.config['hedge']:
+            return math.inf
+        observed = self.latency.quantile(
+            provider, self.config['hedge_quantile'], self.config['min_samples']
+        )
+        return observed if observed is not None else self.config['hedge_delay']
+
+    async def parse_events(
+        self,
+        text: str,
+        group=None,
+        budget: Optional[float] = None,
+        providers: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse text with the first provider to answer successfully
+
+        Args:
+            text: The natural language text to parse
+            group: The EventsGroup to associate the events with
+            budget: Seconds to wait for any provider (defaults to PROVIDER_ROUTER['budget'])
+            providers: Providers to try, in order (defaults to PROVIDER_ROUTER['providers'])
+
+        Returns:
+            List of parsed event dictionaries
+
+        Raises:
+            LLMServiceError: If every provider failed or none answered within the budget
+        """
+        queue = self.available(providers)
+        if not queue:
+            raise LLMServiceError("No LLM provider is available")
+
+        loop = asyncio.get_running_loop()
+        budget = self.config['budget'] if budget is None else budget
+        deadline = loop.time() + budget
+        next_start = loop.time()
+        running: Dict[asyncio.Task, str] = {}
+        errors = []
+        all_unavailable = True
+
+        try:
+            while True:
+                if queue and (not running or loop.time() >= next_start):
+                    provider = queue.pop(0)
+                    if running:
+                        logger.info(f"Hedging slow {', '.join(running.values())} with {provider}")
+                    running[asyncio.create_task(self._parse_with(provider, text, group))] = provider
+                    next_start = loop.time() + self.hedge_delay(provider)
+                    continue
+
+                if not running:
+                    # Distinguish "nothing could be called" so callers can fall back without waiting
+                    error_class = ProviderUnavailableError if all_unavailable else LLMServiceError
+                    raise error_class(f"All providers failed: {'; '.join(errors)}")
+
+                wake_at = min(deadline, next_start) if queue else deadline
+                done, _ = await asyncio.wait(
+                    running, timeout=max(0, wake_at - loop.time()), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    provider = running.pop(task)
+                    try:
+                        return task.result()
+                    except Exception as e:
+                        logger.warning(f"Provider {provider} failed: {str(e)}")
+                        errors.append(f"{provider}: {str(e)}")
+                        all_unavailable = all_unavailable and isinstance(e, ProviderUnavailableError)
+                        # Fail over at once rather than waiting for the hedge
+                        next_start = loop.time()
+
+                if loop.time() >= deadline:
+                    raise LLMServiceError(f"No provider answered within {budget} seconds")
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    async def stream_events(self, text: str, providers: Optional[List[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream parsed events from the first provider that starts answering
+
+        A provider that fails before yielding anything is skipped for the
+        next one. Once events have been yielded the stream cannot switch
+        providers, so later errors propagate. Streams are not hedged.
+
+        Raises:
+            LLMServiceError: If every provider failed (ProviderUnavailableError
+                if none of them could be called)
+        """
+        queue = self.available(providers)
+        if not queue:
+            raise LLMServiceError("No LLM provider is available")
+
+        errors = []
+        all_unavailable = True
+        for provider in queue:
+            yielded = False
+            stream = self.service(provider).stream_events(text)
+            try:
+                async for event_data in stream:
+                    yielded = True
+                    yield event_data
+                return
+            except Exception as e:
+                if yielded:
+                    raise
+                logger.warning(f"Provider {provider} failed to stream: {str(e)}")
+                errors.append(f"{provider}: {str(e)}")
+                all_unavailable = all_unavailable and isinstance(e, ProviderUnavailableError)
+            finally:
+                await stream.aclose()
+
+        error_class = ProviderUnavailableError if all_unavailable else LLMServiceError
+        raise error_class(f"All providers failed: {'; '.join(errors)}")
+
+    async def _parse_with(self, provider: str, text: str, group) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await self.service(provider).parse_events(text, group)
+        self.latency.record(provider, loop.time() - started)
+        return result
+
+
+def _default_factory(provider: str) -> Callable[[], Any]:
+    from .registry import get_llm_service, get_ollama_service
+
+    if provider == 'ollama':
+        return get_ollama_service
+    if provider in CLOUD_PROVIDERS:
+        def build():
+            from .llm_service import LLMService
+
+            # The shared service already covers the configured provider
+            service = get_llm_service()
+            return service if service.provider == provider else LLMService(provider=provider)
+        return build
+    raise LLMServiceError(f"Unsupported provider: {provider}")
+
+
+_latency_tracker: Optional[LatencyTracker] = None
+_latency_tracker_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get the process-wide provider latency tracker"""
+    global _latency_tracker
+    if _latency_tracker is None:
+        with _latency_tracker_lock:
+            if _latency_tracker is None:
+                _latency_tracker = LatencyTracker(get_router_config()['latency_window'])
+    return _latency_tracker
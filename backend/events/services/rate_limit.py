@@ -0,0 +1,192 @@
+# events/services/rate_limit.py
+from typing import Dict, Any, Optional, Tuple
+from django.conf import settings
+import asyncio
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMIT_CONFIG = {
+    'enabled': True,
+    'max_wait': 20,
+    'chars_per_token': 4,
+    'output_tokens': 1000,
+    'limits': {
+        'openai': {'requests_per_minute': 500, 'tokens_per_minute': 200000},
+        'anthropic': {'requests_per_minute': 50, 'tokens_per_minute': 40000},
+    },
+}
+
+
+def get_rate_limit_config() -> Dict[str, Any]:
+    """Get LLM rate limit configuration merged with defaults"""
+    return {**DEFAULT_RATE_LIMIT_CONFIG, **getattr(settings, 'LLM_RATE_LIMITS', {})}
+
+
+def estimate_tokens(prompt: str, output_tokens: Optional[int] = None) -> int:
+    """
+    Rough token cost of a call: the prompt at chars_per_token plus the output budget
+
+    Providers count max_tokens against tokens/min up front, so the output
+    budget is included even though most replies are shorter.
+    """
+    config = get_rate_limit_config()
+    if output_tokens is None:
+        output_tokens = config['output_tokens']
+    return int(math.ceil(len(prompt) / config['chars_per_token'])) + output_tokens
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of refusing
+
+    The level may go negative: a reservation that cannot be met now is
+    taken anyway and the caller is told how long to wait for the refill to
+    cover it. Later reservations queue behind earlier ones, so waiters are
+    served in arrival order without a separate queue.
+    """
+
+    def __init__(self, capacity: float, per_second: float):
+        self.capacity = capacity
+        self.per_second = per_second
+        self.level = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.per_second)
+        self.updated = now
+
+    def wait_for(self, amount: float, now: float) -> float:
+        """Seconds until amount would be available, without reserving it"""
+        self._refill(now)
+        # A single oversized request waits for a full bucket rather than forever
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self.level) / self.per_second)
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+    def drain_for(self, seconds: float, now: float) -> None:
+        """Empty the bucket so nothing is handed out for the next seconds"""
+        self._refill(now)
+        self.level = min(self.level, -seconds * self.per_second)
+
+
+class RateLimiter:
+    """
+    Client-side requests/min and tokens/min limits for one provider and model
+
+    Callers reserve one request and their estimated tokens from both
+    buckets and sleep until the reservation is due. A caller whose turn
+    would come after its deadline is refused at once instead, without
+    taking anything from the buckets.
+    """
+
+    def __init__(self, name: str, requests_per_minute: Optional[float], tokens_per_minute: Optional[float]):
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60) if tokens_per_minute else None
+        self.waiting = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int, max_wait: float) -> Optional[float]:
+        """Reserve a call, returning the seconds to wait, or None if that exceeds max_wait"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(
+                self.requests.wait_for(1, now) if self.requests else 0.0,
+                self.tokens.wait_for(tokens, now) if self.tokens else 0.0
+            )
+            if wait > max_wait:
+                self.rejected += 1
+                return None
+            if self.requests:
+                self.requests.take(1)
+            if self.tokens:
+                self.tokens.take(tokens)
+            return wait
+
+    async def acquire(self, tokens: int, max_wait: Optional[float] = None) -> None:
+        """
+        Wait for a slot for a call costing tokens
+
+        Raises:
+            ProviderRateLimitedError: If the slot would come later than max_wait
+        """
+        # Imported here: llm_service imports this module
+        from .llm_service import ProviderRateLimitedError
+
+        if max_wait is None:
+            max_wait = get_rate_limit_config()['max_wait']
+        wait = self.reserve(tokens, max_wait)
+        if wait is None:
+            raise ProviderRateLimitedError(f"{self.name} rate limit would delay the call past {max_wait}s")
+        if wait > 0:
+            with self._lock:
+                self.waiting += 1
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+
+    def penalize(self, retry_after: Optional[float]) -> None:
+        """Hold back every caller after the provider answered 429"""
+        seconds = retry_after if retry_after is not None else 1.0
+        with self._lock:
+            now = time.monotonic()
+            if self.requests:
+                self.requests.drain_for(seconds, now)
+            if self.tokens:
+                self.tokens.drain_for(seconds, now)
+        logger.warning(f"{self.name} returned 429, holding calls for {seconds:.1f}s")
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            for bucket in (self.requests, self.tokens):
+                if bucket:
+                    bucket._refill(now)
+            return {
+                'requests_available': int(self.requests.level) if self.requests else None,
+                'tokens_available': int(self.tokens.level) if self.tokens else None,
+                'waiting': self.waiting,
+                'rejected': self.rejected,
+            }
+
+
+_limiters: Dict[Tuple[str, str], Optional[RateLimiter]] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str) -> Optional[RateLimiter]:
+    """
+    Get the process-wide limiter for provider and model
+
+    Limits come from LLM_RATE_LIMITS['limits']['<provider>/<model>'], falling
+    back to ['<provider>']. Returns None when the provider has no limits or
+    rate limiting is disabled.
+    """
+    config = get_rate_limit_config()
+    if not config['enabled']:
+        return None
+
+    key = (provider, model)
+    with _limiters_lock:
+        if key not in _limiters:
+            limits = config['limits'].get(f'{provider}/{model}') or config['limits'].get(provider)
+            _limiters[key] = RateLimiter(
+                f'{provider}/{model}', limits.get('requests_per_minute'), limits.get('tokens_per_minute')
+            ) if limits else None
+        return _limiters[key]
+
+
+def rate_limiter_status() -> Dict[str, Dict[str, Any]]:
+    """Bucket levels and queue sizes of every rate-limited provider/model called so far"""
+    with _limiters_lock:
+        limiters = [limiter for limiter in _limiters.values() if limiter is not None]
+    return {limiter.name: limiter.status() for limiter in limiters}
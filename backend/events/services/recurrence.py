@@ -0,0 +1,243 @@
+# events/services/recurrence.py
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.conf import settings
+from django.utils import timezone
+import re
+
+DEFAULT_RECURRENCE_CONFIG = {
+    'max_occurrences': 1000,
+    'max_count': 1000,
+    'list_window_days': 30,
+    'conflict_horizon_days': 90,
+}
+
+# Frequencies accepted in stored rules; finer ones would expand into huge windows
+ALLOWED_FREQUENCIES = ('HOURLY', 'DAILY', 'WEEKLY', 'MONTHLY', 'YEARLY')
+
+# Frequencies with a fixed-length period, which series can be re-anchored by
+FIXED_PERIODS = {
+    'HOURLY': timedelta(hours=1),
+    'DAILY': timedelta(days=1),
+    'WEEKLY': timedelta(weeks=1),
+}
+
+UNTIL_PATTERN = re.compile(r'^(\d{8})(?:T(\d{6}))?(Z?)$')
+
+
+class RecurrenceError(Exception):
+    """Custom exception for invalid recurrence rules"""
+    pass
+
+def get_recurrence_config() -> Dict[str, Any]:
+    """Get recurrence configuration merged with defaults"""
+    return {**DEFAULT_RECURRENCE_CONFIG, **getattr(settings, 'RECURRENCE', {})}
+
+
+def normalize_rrule(value: Optional[str], start: Optional[datetime] = None) -> str:
+    """
+    Validate an RFC 5545 RRULE and return it in canonical form
+
+    Accepts an optional "RRULE:" prefix and any case. A floating or
+    date-only UNTIL is read as local time (end of day for dates) and stored
+    in UTC, so rules expand the same way regardless of how they were written.
+
+    Args:
+        value: Rule such as "FREQ=WEEKLY;BYDAY=MO;COUNT=10" (empty for none)
+        start: First occurrence, used to check the rule expands
+
+    Returns:
+        The canonical rule, or '' when value is empty
+
+    Raises:
+        RecurrenceError: If the rule is malformed or uses an unsupported frequency
+    """
+    if not value or not str(value).strip():
+        return ''
+
+    text = str(value).strip().upper()
+    if text.startswith('RRULE:'):
+        text = text[len('RRULE:'):]
+
+    parts = {}
+    for part in filter(None, text.split(';')):
+        key, separator, part_value = part.partition('=')
+        if not separator or not part_value:
+            raise RecurrenceError(f"Invalid recurrence rule part: {part}")
+        parts[key.strip()] = part_value.strip()
+
+    if parts.get('FREQ') not in ALLOWED_FREQUENCIES:
+        raise RecurrenceError(
+            f"Recurrence FREQ must be one of {', '.join(ALLOWED_FREQUENCIES)}"
+        )
+    if 'COUNT' in parts and 'UNTIL' in parts:
+        raise RecurrenceError("Recurrence rule cannot have both COUNT and UNTIL")
+    if 'UNTIL' in parts:
+        parts['UNTIL'] = _utc_until(parts['UNTIL'])
+    if 'COUNT' in parts:
+        max_count = get_recurrence_config()['max_count']
+        if not parts['COUNT'].isdigit() or not 0 < int(parts['COUNT']) <= max_count:
+            raise RecurrenceError(f"Recurrence COUNT must be between 1 and {max_count}")
+
+    # FREQ first, as most clients write it
+    rule = ';'.join(f'{key}={part_value}' for key, part_value in
+                    sorted(parts.items(), key=lambda item: item[0] != 'FREQ'))
+    try:
+        build_rule(rule, start or timezone.now())
+    except (ValueError, TypeError) as e:
+        raise RecurrenceError(f"Invalid recurrence rule: {str(e)}")
+    return rule
+
+
+def build_rule(rule: str, start: datetime):
+    """dateutil rrule anchored at start, expanded in local wall-clock time"""
+    from dateutil.rrule import rrulestr
+
+    return rrulestr(rule, dtstart=_local(start))
+
+
+def series_end(rule: str, start: datetime, end: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    When the last occurrence of a series ends, or None if it never ends
+
+    Stored on the event so range queries can skip finished series without
+    expanding them. UNTIL gives an upper bound directly; COUNT is expanded
+    once, at write time.
+    """
+    if not rule:
+        return None
+    duration = _duration(start, end)
+    parts = dict(part.split('=', 1) for part in rule.split(';'))
+    if 'UNTIL' in parts:
+        until = datetime.strptime(parts['UNTIL'].rstrip('Z'), '%Y%m%dT%H%M%S')
+        if settings.USE_TZ:
+            until = until.replace(tzinfo=dt_timezone.utc)
+        return until + duration
+    if 'COUNT' in parts:
+        last = None
+        for last in build_rule(rule, start):
+            pass
+        return (last or start) + duration
+    return None
+
+
+def occurrences(
+    rule: str,
+    start: datetime,
+    end: Optional[datetime],
+    window_start: datetime,
+    window_end: datetime,
+    limit: Optional[int] = None
+) -> Iterator[Tuple[datetime, datetime]]:
+    """
+    Lazily yield (start, end) of up to limit occurrences overlapping [window_start, window_end)
+
+    Endless HOURLY, DAILY and WEEKLY series are re-anchored just before the
+    window, so their cost depends on the window, not on how long ago they
+    started. Other series are walked from their first occurrence; that walk
+    is bounded by max_count for COUNT rules and is at most twelve steps a
+    year for MONTHLY and YEARLY ones.
+    """
+    if limit is None:
+        limit = get_recurrence_config()['max_occurrences']
+    duration = _duration(start, end)
+    reach = _local(window_start) - duration
+    parsed = build_rule(rule, _anchor(rule, start, reach))
+
+    found = 0
+    for occurrence_start in parsed.xafter(reach, inc=True):
+        if occurrence_start >= window_end or (limit and found >= limit):
+            return
+        occurrence_end = occurrence_start + duration
+        if occurrence_end > window_start or occurrence_start >= window_start:
+            found += 1
+            yield occurrence_start, occurrence_end
+
+
+def expand_rows(
+    rows: List[Tuple],
+    window_start: datetime,
+    window_end: datetime,
+    start_index: int = 2,
+    end_index: int = 3,
+    rule_index: int = -1
+) -> Tuple[List[Tuple], bool]:
+    """
+    Replace recurring rows (values_list tuples) with one row per occurrence in the window
+
+    Non-recurring rows pass through unchanged; occurrence rows carry the
+    occurrence's start and end in place of the series'. The result is
+    sorted by start.
+
+    Returns:
+        (rows, truncated) where truncated is True if a series had more than
+        max_occurrences occurrences in the window and was cut short
+    """
+    limit = get_recurrence_config()['max_occurrences']
+    expanded = []
+    truncated = False
+    for row in rows:
+        rule = row[rule_index]
+        if not rule:
+            expanded.append(row)
+            continue
+        for count, (occurrence_start, occurrence_end) in enumerate(occurrences(
+            rule, row[start_index], row[end_index], window_start, window_end,
+            limit=limit + 1 if limit else None
+        )):
+            if limit and count >= limit:
+                truncated = True
+                break
+            values = list(row)
+            values[start_index] = occurrence_start
+            values[end_index] = occurrence_end if row[end_index] else None
+            expanded.append(tuple(values))
+    expanded.sort(key=lambda row: row[start_index])
+    return expanded, truncated
+
+
+def _anchor(rule: str, start: datetime, not_before: datetime) -> datetime:
+    """
+    Series start moved forward by whole periods to just before not_before
+
+    Without COUNT, shifting DTSTART of a fixed-period series by whole
+    INTERVALs keeps every later occurrence: wall-clock time, weekday and
+    BYxxx filters are unchanged. COUNT rules depend on where they start and
+    are left alone.
+    """
+    parts = dict(part.split('=', 1) for part in rule.split(';'))
+    period = FIXED_PERIODS.get(parts.get('FREQ'))
+    if period is None or 'COUNT' in parts:
+        return start
+    period *= int(parts.get('INTERVAL', 1))
+
+    start = _local(start)
+    # Wall-clock difference, so 09:00 stays 09:00 across DST changes
+    gap = _local(not_before).replace(tzinfo=None) - start.replace(tzinfo=None)
+    periods = gap // period - 1
+    return start + periods * period if periods > 0 else start
+
+
+def _duration(start: datetime, end: Optional[datetime]) -> timedelta:
+    return end - start if end and end > start else timedelta(0)
+
+
+def _local(value: datetime) -> datetime:
+    # Weekly at 09:00 stays 09:00 local across DST changes
+    if not settings.USE_TZ:
+        return value
+    return timezone.localtime(value) if timezone.is_aware(value) else timezone.make_aware(value)
+
+
+def _utc_until(value: str) -> str:
+    match = UNTIL_PATTERN.match(value)
+    if not match:
+        raise RecurrenceError(f"Invalid recurrence UNTIL: {value}")
+    day, clock, utc = match.groups()
+    until = datetime.strptime(day + (clock or '235959'), '%Y%m%d%H%M%S')
+    if not settings.USE_TZ:
+        # Naive datetimes throughout, so the rule stays floating
+        return until.strftime('%Y%m%dT%H%M%S')
+    if not utc:
+        until = timezone.make_aware(until).astimezone(dt_timezone.utc)
+    return until.strftime('%Y%m%dT%H%M%SZ')
@@ -0,0 +1,163 @@
+# events/services/registry.py
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceRegistryError(Exception):
+    """Custom exception for unknown or failing registry services"""
+    pass
+
+class ServiceRegistry:
+    """
+    Process-wide registry of lazily built, shared services
+
+    Heavy dependencies (spaCy models, the OpenAI/Anthropic SDKs, the LLM
+    config file) are only imported and loaded the first time a service is
+    requested, so importing URLs, running management commands and booting
+    workers does not pay for them. Each service is built once per process.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """Register a zero-argument factory; replaces any instance already built"""
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Get the shared instance of a service, building it on first use"""
+        if name in self._instances:
+            return self._instances[name]
+
+        with self._lock:
+            if name not in self._instances:
+                factory = self._factories.get(name)
+                if factory is None:
+                    raise ServiceRegistryError(f"Unknown service: {name}")
+                started = time.perf_counter()
+                self._instances[name] = factory()
+                logger.info(f"Loaded {name} service in {time.perf_counter() - started:.2f}s")
+            return self._instances[name]
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """Drop one (or every) built instance so the next get rebuilds it"""
+        with self._lock:
+            if name is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(name, None)
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Build services ahead of the first request
+
+        Failures are logged rather than raised so a missing optional
+        dependency cannot stop the process from starting.
+
+        Args:
+            names: Services to build (defaults to every registered service)
+
+        Returns:
+            Names of the services that were loaded
+        """
+        loaded = []
+        for name in list(names if names is not None else self._factories):
+            try:
+                self.get(name)
+                loaded.append(name)
+            except Exception as e:
+                logger.error(f"Failed to warm up {name} service: {str(e)}")
+        return loaded
+
+
+def _build_llm_service():
+    from .llm_service import LLMService
+    return LLMService()
+
+
+def _build_ollama_service():
+    from django.conf import settings
+    from .ollama_service import OllamaService
+
+    ollama_config = getattr(settings, 'OLLAMA_CONFIG', {})
+    return OllamaService(
+        base_url=ollama_config.get('base_url', 'http://localhost:11434'),
+        model=ollama_config.get('default_model', 'llama3.2:1b'),
+        keep_alive=ollama_config.get('keep_alive', '30m')
+    )
+
+
+def _build_nlp_service():
+    """Build NLPService, or None when spaCy or its model is not installed"""
+    try:
+        from .nlp_service import NLPService
+        return NLPService()
+    except (ImportError, OSError) as e:
+        logger.warning(f"Rule-based parser unavailable, using LLM only: {str(e)}")
+        return None
+
+
+def _build_provider_router():
+    from .provider_router import ProviderRouter
+    return ProviderRouter()
+
+
+def _build_events_service():
+    from .events_service import EventsService
+    return EventsService()
+
+
+_registry: Optional[ServiceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_service_registry() -> ServiceRegistry:
+    """Get the process-wide service registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = ServiceRegistry()
+                registry.register('llm', _build_llm_service)
+                registry.register('ollama', _build_ollama_service)
+                registry.register('nlp', _build_nlp_service)
+                registry.register('router', _build_provider_router)
+                registry.register('events', _build_events_service)
+                _registry = registry
+    return _registry
+
+
+def get_llm_service():
+    """Get the shared LLMService (cloud provider client)"""
+    return get_service_registry().get('llm')
+
+
+def get_ollama_service():
+    """Get the shared OllamaService for the configured local server"""
+    return get_service_registry().get('ollama')
+
+
+def get_nlp_service():
+    """Get the shared NLPService, or None if spaCy is unavailable"""
+    return get_service_registry().get('nlp')
+
+
+def get_provider_router():
+    """Get the shared ProviderRouter for failover and hedging across LLM providers"""
+    return get_service_registry().get('router')
+
+
+def get_events_service():
+    """Get the shared EventsService"""
+    return get_service_registry().get('events')
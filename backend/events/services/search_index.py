@@ -0,0 +1,383 @@
+# events/services/search_index.py
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from django.conf import settings
+from django.db import connections, transaction, DatabaseError
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from ..models import Event, Attendee
+import logging
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TABLE = 'events_event_search'
+
+DEFAULT_SEARCH_CONFIG = {
+    'enabled': True,
+    'result_limit': 5,
+    'snippet_words': 12,
+}
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def get_search_config() -> Dict[str, Any]:
+    """Get search index configuration merged with defaults"""
+    return {**DEFAULT_SEARCH_CONFIG, **getattr(settings, 'SEARCH_INDEX', {})}
+
+
+def tokenize_query(query: str) -> List[str]:
+    """Split a user query into lowercase word tokens, dropping search syntax"""
+    return [token.lower() for token in TOKEN_PATTERN.findall(query or '')]
+
+
+class SearchIndexError(Exception):
+    """Custom exception for search index errors"""
+    pass
+
+class SearchBackend:
+    """
+    Database-specific search table maintenance and querying
+
+    Rows are (re)built with a single INSERT ... SELECT from the event,
+    note and attendee tables, so indexing never round-trips event data
+    through Python. The last query token is matched as a prefix so
+    partially typed words still hit.
+    """
+
+    vendor = None
+
+    def create_table(self, cursor) -> None:
+        raise NotImplementedError
+
+    def drop_table(self, cursor) -> None:
+        cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+    def refresh(self, cursor, event_ids: Optional[List[Any]] = None) -> None:
+        """Re-index the given events (every event if None)"""
+        if event_ids is None:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+            cursor.execute(self.populate_sql(''))
+            return
+        if not event_ids:
+            return
+        placeholders = ', '.join(['%s'] * len(event_ids))
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE event_id IN ({placeholders})', event_ids)
+        cursor.execute(self.populate_sql(f'WHERE e.id IN ({placeholders})'), event_ids)
+
+    def remove(self, cursor, event_ids: List[Any]) -> None:
+        if not event_ids:
+            return
+        placeholders = ', '.join(['%s'] * len(event_ids))
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE event_id IN ({placeholders})', event_ids)
+
+    def populate_sql(self, where: str) -> str:
+        raise NotImplementedError
+
+    def search_sql(self, tokens: List[str], limit: int, snippet_words: int) -> Tuple[str, List[Any]]:
+        """SQL returning (event_id, title, rank, snippet) rows, best match first"""
+        raise NotImplementedError
+
+    def match_sql(self, tokens: List[str], attendees_only: bool = False) -> Tuple[str, List[Any]]:
+        """SQL selecting the ids of matching events, for use as a subquery"""
+        raise NotImplementedError
+
+class SQLiteFTSBackend(SearchBackend):
+    """FTS5 virtual table ranked with bm25()"""
+
+    vendor = 'sqlite'
+
+    # bm25 weights per column: event_id, title, location, venue, notes, original_text, attendees
+    weights = (0.0, 10.0, 4.0, 4.0, 2.0, 1.0, 4.0)
+
+    def create_table(self, cursor) -> None:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+            "event_id UNINDEXED, title, location, venue, notes, original_text, attendees, "
+            "tokenize = 'porter unicode61')"
+        )
+
+    def populate_sql(self, where: str) -> str:
+        return (
+            f"INSERT INTO {SEARCH_TABLE} "
+            "(event_id, title, location, venue, notes, original_text, attendees) "
+            "SELECT e.id, e.title, COALESCE(e.location, ''), COALESCE(e.venue, ''), "
+            "COALESCE(n.content, ''), COALESCE(e.original_text, ''), "
+            "COALESCE((SELECT group_concat(a.name, ' ') FROM events_attendee a WHERE a.event_id = e.id), '') "
+            "FROM events_event e LEFT JOIN events_eventnote n ON n.event_id = e.id "
+            f"{where}"
+        )
+
+    def _match_expression(self, tokens: List[str], attendees_only: bool = False) -> str:
+        terms = [f'"{token}"' for token in tokens]
+        terms[-1] += '*'
+        expression = ' '.join(terms)
+        return f'attendees : ({expression})' if attendees_only else expression
+
+    def search_sql(self, tokens: List[str], limit: int, snippet_words: int) -> Tuple[str, List[Any]]:
+        weights = ', '.join(str(weight) for weight in self.weights)
+        return (
+            f"SELECT {SEARCH_TABLE}.event_id, events_event.title, "
+            f"-bm25({SEARCH_TABLE}, {weights}) AS rank, "
+            f"snippet({SEARCH_TABLE}, -1, '', '', '…', %s) "
+            f"FROM {SEARCH_TABLE} JOIN events_event ON events_event.id = {SEARCH_TABLE}.event_id "
+            f"WHERE {SEARCH_TABLE} MATCH %s ORDER BY rank DESC LIMIT %s",
+            [snippet_words, self._match_expression(tokens), limit]
+        )
+
+    def match_sql(self, tokens: List[str], attendees_only: bool = False) -> Tuple[str, List[Any]]:
+        return (
+            f"SELECT event_id FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s",
+            [self._match_expression(tokens, attendees_only)]
+        )
+
+class PostgresSearchBackend(SearchBackend):
+    """tsvector table with a GIN index, ranked with ts_rank and ts_headline snippets"""
+
+    vendor = 'postgresql'
+
+    def create_table(self, cursor) -> None:
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+            "event_id uuid PRIMARY KEY REFERENCES events_event (id) ON DELETE CASCADE "
+            "DEFERRABLE INITIALLY DEFERRED, "
+            "body text NOT NULL, "
+            "document tsvector NOT NULL)"
+        )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {SEARCH_TABLE}_document_idx "
+            f"ON {SEARCH_TABLE} USING GIN (document)"
+        )
+
+    def populate_sql(self, where: str) -> str:
+        # Weights: A title, B attendees, C location/venue, D notes/original text
+        return (
+            f"INSERT INTO {SEARCH_TABLE} (event_id, body, document) "
+            "SELECT e.id, "
+            "concat_ws(' ', e.title, e.location, e.venue, n.content, e.original_text), "
+            "setweight(to_tsvector('english', e.title), 'A') || "
+            "setweight(to_tsvector('english', COALESCE(a.names, '')), 'B') || "
+            "setweight(to_tsvector('english', concat_ws(' ', e.location, e.venue)), 'C') || "
+            "setweight(to_tsvector('english', concat_ws(' ', n.content, e.original_text)), 'D') "
+            "FROM events_event e "
+            "LEFT JOIN events_eventnote n ON n.event_id = e.id "
+            "LEFT JOIN (SELECT event_id, string_agg(name, ' ') AS names "
+            "FROM events_attendee GROUP BY event_id) a ON a.event_id = e.id "
+            f"{where}"
+        )
+
+    def _tsquery(self, tokens: List[str], attendees_only: bool = False) -> str:
+        weight = 'B' if attendees_only else ''
+        terms = [f"'{token}':{weight}" if weight else f"'{token}'" for token in tokens]
+        terms[-1] = f"'{tokens[-1]}':*{weight}"
+        return ' & '.join(terms)
+
+    def search_sql(self, tokens: List[str], limit: int, snippet_words: int) -> Tuple[str, List[Any]]:
+        headline_options = f'StartSel="", StopSel="", MaxWords={snippet_words}, MinWords={max(1, snippet_words // 2)}'
+        return (
+            f"SELECT s.event_id, e.title, ts_rank(s.document, q) AS rank, "
+            f"ts_headline('english', s.body, q, %s) "
+            f"FROM {SEARCH_TABLE} s JOIN events_event e ON e.id = s.event_id, "
+            "to_tsquery('english', %s) q "
+            "WHERE s.document @@ q ORDER BY rank DESC LIMIT %s",
+            [headline_options, self._tsquery(tokens), limit]
+        )
+
+    def match_sql(self, tokens: List[str], attendees_only: bool = False) -> Tuple[str, List[Any]]:
+        return (
+            f"SELECT event_id FROM {SEARCH_TABLE} WHERE document @@ to_tsquery('english', %s)",
+            [self._tsquery(tokens, attendees_only)]
+        )
+
+
+BACKENDS = {
+    'sqlite': SQLiteFTSBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def sqlite_has_fts5(connection) -> bool:
+    """Check whether the SQLite build behind a connection includes FTS5"""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def get_backend(connection) -> Optional[SearchBackend]:
+    """Get the search backend for a database connection, or None if unsupported"""
+    backend_class = BACKENDS.get(connection.vendor)
+    if backend_class is None:
+        return None
+    if connection.vendor == 'sqlite' and not sqlite_has_fts5(connection):
+        return None
+    return backend_class()
+
+
+class SearchIndex:
+    """
+    Full-text index over events
+
+    Covers event title, location, venue, note content, original text and
+    attendee names. The index lives in the same database as the events
+    (FTS5 on SQLite, tsvector/GIN on Postgres), so it is updated inside
+    the same transaction as the rows it mirrors: model signals refresh it
+    on save/delete and bulk writes call refresh_events explicitly.
+
+    On databases without a backend, `available` is False and callers fall
+    back to icontains filtering.
+    """
+
+    def __init__(self, using: str = 'default'):
+        self.using = using
+        self.config = get_search_config()
+        self._backend: Optional[SearchBackend] = None
+        self._resolved = False
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> Optional[SearchBackend]:
+        if not self._resolved:
+            with self._lock:
+                if not self._resolved:
+                    self._backend = get_backend(connections[self.using]) if self.config['enabled'] else None
+                    self._resolved = True
+        return self._backend
+
+    @property
+    def available(self) -> bool:
+        return self.backend is not None
+
+    def _db_ids(self, event_ids: Iterable[Any]) -> List[Any]:
+        connection = connections[self.using]
+        pk = Event._meta.pk
+        return [pk.get_db_prep_value(pk.to_python(event_id), connection) for event_id in event_ids]
+
+    def refresh_events(self, event_ids: Iterable[Any]) -> None:
+        """Re-index events after they or their notes/attendees change"""
+        self._write('refresh', list(dict.fromkeys(event_ids)))
+
+    def remove_events(self, event_ids: Iterable[Any]) -> None:
+        """Drop deleted events from the index"""
+        self._write('remove', list(dict.fromkeys(event_ids)))
+
+    def rebuild(self) -> None:
+        """Re-index every event"""
+        if not self.available:
+            raise SearchIndexError(f"No search backend for database '{self.using}'")
+        with transaction.atomic(using=self.using), connections[self.using].cursor() as cursor:
+            self.backend.refresh(cursor)
+
+    def _write(self, operation: str, event_ids: List[Any]) -> None:
+        if not self.available or not event_ids:
+            return
+        try:
+            # Savepoint, so a failed index write can't poison the caller's transaction
+            with transaction.atomic(using=self.using), connections[self.using].cursor() as cursor:
+                getattr(self.backend, operation)(cursor, self._db_ids(event_ids))
+        except DatabaseError as e:
+            logger.warning(f"Failed to {operation} search index entries: {str(e)}")
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Ranked full-text search over events
+
+        Returns:
+            Up to limit hits, best first, each with event_id, title, rank
+            and snippet keys
+
+        Raises:
+            SearchIndexError: If no backend is available or the query fails
+        """
+        tokens = tokenize_query(query)
+        if not tokens:
+            return []
+        if not self.available:
+            raise SearchIndexError(f"No search backend for database '{self.using}'")
+
+        sql, params = self.backend.search_sql(
+            tokens,
+            limit or self.config['result_limit'],
+            self.config['snippet_words']
+        )
+        try:
+            with connections[self.using].cursor() as cursor:
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+        except DatabaseError as e:
+            raise SearchIndexError(f"Search query failed: {str(e)}")
+
+        pk = Event._meta.pk
+        return [
+            {
+                'event_id': pk.to_python(event_id),
+                'title': title,
+                'rank': round(float(rank), 4),
+                'snippet': snippet or ''
+            }
+            for event_id, title, rank, snippet in rows
+        ]
+
+    def search_attendees(self, query: str, limit: Optional[int] = None) -> List[Attendee]:
+        """
+        Attendees whose names match the query, found through the index, or
+        whose email contains it
+
+        Emails are not indexed (the tokenizer would split them at '@' and
+        '.'), so they are matched with a plain icontains lookup.
+
+        Raises:
+            SearchIndexError: If no backend is available
+        """
+        tokens = tokenize_query(query)
+        if not tokens:
+            return []
+        matching = self.matching_event_ids(query, attendees_only=True)
+        term = query.strip().lower()
+
+        results = []
+        candidates = Attendee.objects.filter(
+            Q(event_id__in=matching) | Q(email__icontains=term)
+        ).select_related('event').order_by('name')
+        for attendee in candidates:
+            words = tokenize_query(attendee.name)
+            # Every full token must be a word of the name; the last may be a prefix
+            name_matches = all(token in words for token in tokens[:-1]) and any(
+                word.startswith(tokens[-1]) for word in words
+            )
+            if name_matches or term in (attendee.email or '').lower():
+                results.append(attendee)
+                if len(results) >= (limit or self.config['result_limit']):
+                    break
+        return results
+
+    def matching_event_ids(self, query: str, attendees_only: bool = False) -> RawSQL:
+        """
+        Subquery of matching event ids for filtering querysets
+
+        Usage: Event.objects.filter(id__in=index.matching_event_ids(term))
+
+        Raises:
+            SearchIndexError: If no backend is available
+        """
+        if not self.available:
+            raise SearchIndexError(f"No search backend for database '{self.using}'")
+        tokens = tokenize_query(query)
+        if not tokens:
+            return RawSQL(f'SELECT event_id FROM {SEARCH_TABLE} WHERE 1 = 0', [])
+        sql, params = self.backend.match_sql(tokens, attendees_only)
+        return RawSQL(sql, params)
+
+
+_search_index: Optional[SearchIndex] = None
+_search_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """Get the process-wide search index for the default database"""
+    global _search_index
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                _search_index = SearchIndex()
+    return _search_index
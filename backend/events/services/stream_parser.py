@@ -0,0 +1,107 @@
+# events/services/stream_parser.py
+from typing import Dict, Any, List
+import json
+
+
+class StreamParserError(Exception):
+    """Custom exception for malformed streamed JSON"""
+    pass
+
+class EventsStreamParser:
+    """
+    Incremental parser for streamed `{"events": [...]}` LLM responses
+
+    Text is fed in arbitrary chunks as the model generates it. Each object in
+    the top-level "events" array is returned as soon as its closing brace
+    arrives, without waiting for the rest of the document. Anything before the
+    first "{" (such as a markdown code fence) is ignored.
+    """
+
+    def __init__(self):
+        self._buffer = []
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = None
+        self._last_key = None
+        self._in_events_array = False
+        self._object_start = None
+        self._position = 0
+        self.events: List[Dict[str, Any]] = []
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Consume a chunk of model output
+
+        Returns:
+            Event objects completed by this chunk, in order
+        """
+        completed = []
+
+        for char in chunk:
+            index = self._position
+            self._position += 1
+            if self._stack or char == '{':
+                self._buffer.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._close_string(index)
+                continue
+
+            if not self._stack and char != '{':
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = index
+            elif char in '{[':
+                if char == '[' and len(self._stack) == 1 and self._last_key == 'events':
+                    self._in_events_array = True
+                if char == '{' and self._in_events_array and len(self._stack) == 2:
+                    self._object_start = index
+                self._stack.append(char)
+            elif char in '}]':
+                if not self._stack or self._stack[-1] != {'}': '{', ']': '['}[char]:
+                    raise StreamParserError(f"Unbalanced '{char}' in streamed JSON")
+                self._stack.pop()
+                if char == '}' and self._object_start is not None and len(self._stack) == 2:
+                    completed.append(self._complete_object(index))
+                elif char == ']' and len(self._stack) == 1:
+                    self._in_events_array = False
+
+        self.events.extend(completed)
+        return completed
+
+    @property
+    def complete(self) -> bool:
+        """True once the top-level object has been closed"""
+        return bool(self._buffer) and not self._stack
+
+    def _text(self, start: int, end: int) -> str:
+        offset = self._position - len(self._buffer)
+        return ''.join(self._buffer[start - offset:end - offset + 1])
+
+    def _close_string(self, index: int) -> None:
+        # Only strings directly inside the top-level object can be its keys
+        if len(self._stack) == 1:
+            try:
+                self._last_key = json.loads(self._text(self._string_start, index))
+            except json.JSONDecodeError:
+                self._last_key = None
+
+    def _complete_object(self, index: int) -> Dict[str, Any]:
+        raw = self._text(self._object_start, index)
+        self._object_start = None
+        try:
+            event = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise StreamParserError(f"Invalid event object in stream: {str(e)}")
+        if not isinstance(event, dict):
+            raise StreamParserError("Event entries must be objects")
+        return event
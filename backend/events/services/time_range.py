@@ -0,0 +1,145 @@
+# events/services/time_range.py
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from .recurrence import expand_rows
+
+DEFAULT_RANGE_CONFIG = {
+    'max_days': 366,
+    'max_events': 5000,
+    'max_event_days': 31,
+}
+
+# Columns returned by compact range payloads, in row order
+COMPACT_FIELDS = ['id', 'title', 'start', 'end', 'location', 'venue', 'group', 'rrule']
+COMPACT_COLUMNS = ['id', 'title', 'start_datetime', 'end_datetime', 'location', 'venue', 'group_id', 'rrule']
+
+
+class RangeQueryError(Exception):
+    """Custom exception for invalid time range queries"""
+    pass
+
+def get_range_config() -> Dict[str, Any]:
+    """Get range query configuration merged with defaults"""
+    return {**DEFAULT_RANGE_CONFIG, **getattr(settings, 'RANGE_QUERY', {})}
+
+
+def parse_bound(value: Optional[str], name: str) -> datetime:
+    """
+    Parse an ISO datetime or YYYY-MM-DD date (midnight) into an aware datetime
+
+    Naive values are taken to be in the current timezone.
+    """
+    if not value:
+        raise RangeQueryError(f"'{name}' is required")
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            parsed = datetime.combine(day, time.min) if day else None
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise RangeQueryError(f"'{name}' must be an ISO date or datetime")
+    if settings.USE_TZ and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def parse_range(start: Optional[str], end: Optional[str]) -> Tuple[datetime, datetime]:
+    """Parse and validate a [start, end) window from query parameters"""
+    start_dt = parse_bound(start, 'start')
+    end_dt = parse_bound(end, 'end')
+    if end_dt <= start_dt:
+        raise RangeQueryError("'end' must be after 'start'")
+    max_days = get_range_config()['max_days']
+    if max_days and end_dt - start_dt > timedelta(days=max_days):
+        raise RangeQueryError(f"Range cannot be longer than {max_days} days")
+    return start_dt, end_dt
+
+
+def overlapping(queryset: QuerySet, start: datetime, end: datetime) -> QuerySet:
+    """
+    Events, and recurring series, that may overlap [start, end), unordered
+
+    An event overlaps when it starts before the window ends and either
+    starts inside the window or ends after it opens. Events without an end
+    are treated as instants at their start. A series is included while its
+    last occurrence ends after the window opens (or it never ends); use
+    recurrence.expand_rows to turn series rows into their occurrences.
+
+    Single events are only looked for from max_event_days before the
+    window, a range bounded at both ends on the (start_datetime,
+    end_datetime) index; longer events are missed unless they start within
+    that reach. Series have no lower bound, so they come from the partial
+    index that holds only rows with a rule. Callers sort the rows
+    themselves, which keeps the planner from walking the whole start index
+    in order instead.
+    """
+    return queryset.filter(
+        single_overlap_q(start, end) | series_overlap_q(start, end)
+    ).order_by()
+
+
+def single_overlap_q(start: datetime, end: datetime) -> Q:
+    """Non-recurring events overlapping [start, end), see overlapping"""
+    reach = start - timedelta(days=get_range_config()['max_event_days'])
+    return (
+        Q(rrule='', start_datetime__gte=reach, start_datetime__lt=end) &
+        (Q(start_datetime__gte=start) | Q(end_datetime__gt=start))
+    )
+
+
+def series_overlap_q(start: datetime, end: datetime) -> Q:
+    """Recurring series that may have an occurrence in [start, end), see overlapping"""
+    # rrule > '' (not != '') is the condition of the partial index
+    return (
+        Q(rrule__gt='', start_datetime__lt=end) &
+        (Q(recurrence_end__gt=start) | Q(recurrence_end__isnull=True))
+    )
+
+
+def compact_events(
+    queryset: QuerySet,
+    start: datetime,
+    end: datetime,
+    limit: Optional[int] = None
+) -> Tuple[List[List[Any]], bool]:
+    """
+    Rows of COMPACT_FIELDS for events overlapping [start, end), without
+    building model instances
+
+    Recurring series contribute one row per occurrence inside the window,
+    carrying the occurrence's start and end and the series' id and rule.
+
+    Returns:
+        (rows, truncated) where truncated is True if more than limit rows
+        matched or a series had more than max_occurrences in the window
+    """
+    if limit is None:
+        limit = get_range_config()['max_events']
+    single = queryset.filter(single_overlap_q(start, end)).order_by('start_datetime').values_list(*COMPACT_COLUMNS)
+    rows = list(single[:limit + 1] if limit else single)
+    series = list(queryset.filter(series_overlap_q(start, end)).values_list(*COMPACT_COLUMNS))
+    capped = False
+    if series:
+        rows, capped = expand_rows(rows + series, start, end)
+
+    truncated = capped or (bool(limit) and len(rows) > limit)
+    if truncated:
+        rows = rows[:limit]
+    return [
+        [str(event_id), title, _iso(event_start), _iso(event_end), location, venue,
+         str(group_id) if group_id else None, rule or None]
+        for event_id, title, event_start, event_end, location, venue, group_id, rule in rows
+    ], truncated
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    # Same local-time rendering as the serializers' DateTimeFields
+    if value is None:
+        return None
+    return (timezone.localtime(value) if timezone.is_aware(value) else value).isoformat()
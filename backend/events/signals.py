@@ -1,8 +1,12 @@
 # events/signals.py
-from django.db.models.signals import post_delete
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.db.models import Count
-from .models import Event, EventsGroup
+from .models import Event, EventsGroup, Attendee, EventNote
+from .services.search_index import get_search_index
+from .services.autocomplete import get_autocomplete_index
 
 @receiver(post_delete, sender=Event)
 def delete_empty_group(sender, instance, **kwargs):
@@ -13,16 +17,58 @@ def delete_empty_group(sender, instance, **kwargs):
     associated EventsGroup has any remaining events, and if not, deletes
     the group.
     """
-    if instance.group:
+    # group_id avoids fetching a group that may already have been deleted in a cascade
+    if instance.group_id:
         # Check if the group exists and has no remaining events
         try:
             group = EventsGroup.objects.annotate(
                 event_count=Count('events')
-            ).get(id=instance.group.id)
+            ).get(id=instance.group_id)
             
             if group.event_count == 0:
                 group.delete()
                 
         except EventsGroup.DoesNotExist:
             # Group was already deleted
-            pass
\ No newline at end of file
+            pass
+
+
+@receiver(post_save, sender=Event)
+def index_saved_event(sender, instance, raw=False, **kwargs):
+    """Keep the full-text search index in sync with saved events"""
+    if not raw:
+        get_search_index().refresh_events([instance.pk])
+
+@receiver(post_delete, sender=Event)
+def unindex_deleted_event(sender, instance, **kwargs):
+    """Drop deleted events from the full-text search index"""
+    get_search_index().remove_events([instance.pk])
+
+@receiver(post_save, sender=Attendee)
+@receiver(post_save, sender=EventNote)
+@receiver(post_delete, sender=Attendee)
+@receiver(post_delete, sender=EventNote)
+def reindex_parent_event(sender, instance, raw=False, **kwargs):
+    """Attendee names and note content are indexed with their event"""
+    if not raw:
+        get_search_index().refresh_events([instance.event_id])
+
+# The autocomplete index is in memory, so it is only updated once the write commits
+
+@receiver(post_save, sender=Event)
+def autocomplete_saved_event(sender, instance, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(partial(get_autocomplete_index().index_event, instance))
+
+@receiver(post_delete, sender=Event)
+def autocomplete_deleted_event(sender, instance, **kwargs):
+    transaction.on_commit(partial(get_autocomplete_index().remove_event, instance.pk))
+
+@receiver(post_save, sender=Attendee)
+def autocomplete_saved_attendee(sender, instance, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(partial(get_autocomplete_index().index_attendee, instance))
+
+@receiver(post_delete, sender=Attendee)
+def autocomplete_deleted_attendee(sender, instance, **kwargs):
+    transaction.on_commit(partial(get_autocomplete_index().remove_attendee, instance.pk))
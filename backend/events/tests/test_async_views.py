@@ -0,0 +1,119 @@
+# tests/test_async_views.py
+from django.test import TestCase, AsyncClient
+from django.urls import reverse
+from datetime import datetime, timedelta
+from unittest.mock import patch, AsyncMock
+from ..models import EventsGroup, Event, Attendee, ProcessingJob
+from ..api import async_views
+from ..services.llm_service import LLMServiceError
+
+
+class TestAsyncViews(TestCase):
+    def setUp(self):
+        self.client = AsyncClient()
+        self.create_url = reverse('v1:events-create-from-text')
+        start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+        self.parsed_events = [
+            {
+                'title': title,
+                'start_datetime': start,
+                'end_datetime': start + timedelta(hours=1),
+                'location': '',
+                'venue': '',
+                'notes': '',
+                'suggestions': 'Prepare agenda',
+                'attendees': [{'name': 'Sarah', 'email': ''}]
+            }
+            for title in ['Planning', 'Retro']
+        ]
+
+    async def test_create_from_text_missing_text(self):
+        response = await self.client.post(self.create_url, {}, content_type='application/json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error']['code'], 'MISSING_TEXT')
+
+    async def test_create_from_text_creates_events(self):
+        with patch.object(async_views.events_service.llm_service, 'parse_events',
+                          new_callable=AsyncMock) as mock_parse:
+            mock_parse.return_value = self.parsed_events
+            response = await self.client.post(
+                self.create_url,
+                {'text': 'Planning and retro tomorrow', 'use_llm': True},
+                content_type='application/json'
+            )
+
+        self.assertEqual(response.status_code, 201)
+        data = response.json()['data']
+        self.assertTrue(data['multiple_events'])
+        self.assertEqual(data['event']['title'], 'Planning')
+        self.assertEqual(data['event']['attendees'][0]['name'], 'Sarah')
+        # Both parsed events share a time slot
+        self.assertEqual(len(data['conflicts']), 1)
+        self.assertEqual(await Event.objects.acount(), 2)
+
+    async def test_create_from_text_reports_parse_errors(self):
+        with patch.object(async_views.events_service.ollama_service, 'parse_events',
+                          new_callable=AsyncMock) as mock_parse:
+            mock_parse.side_effect = LLMServiceError("connection refused")
+            response = await self.client.post(
+                self.create_url,
+                {'text': 'Planning tomorrow', 'use_llm': False},
+                content_type='application/json'
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error']['code'], 'EVENT_CREATION_ERROR')
+
+    async def test_create_from_text_enqueue(self):
+        response = await self.client.post(
+            self.create_url,
+            {'text': 'Planning tomorrow', 'enqueue': True},
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 202)
+        group_id = response.json()['data']['group']['id']
+        job = await ProcessingJob.objects.aget(group_id=group_id)
+        self.assertEqual(job.status, ProcessingJob.STATUS_PENDING)
+
+        status_response = await self.client.get(
+            reverse('v1:events-group-status-async', kwargs={'pk': group_id})
+        )
+        self.assertEqual(status_response.json()['data']['job_status'], 'pending')
+        self.assertFalse(status_response.json()['data']['processing_complete'])
+
+    async def test_group_detail_not_found(self):
+        response = await self.client.get(
+            reverse('v1:events-group-detail-async',
+                    kwargs={'pk': '00000000-0000-0000-0000-000000000000'})
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()['error']['code'], 'GROUP_NOT_FOUND')
+
+    async def test_global_search(self):
+        group = await EventsGroup.objects.acreate(processing_complete=True)
+        event = await Event.objects.acreate(
+            group=group,
+            title='Quarterly review',
+            start_datetime=datetime.now() + timedelta(days=1)
+        )
+        await Attendee.objects.acreate(event=event, name='Quinn')
+
+        response = await self.client.get(reverse('v1:global-search'), {'q': 'qu'})
+
+        self.assertEqual(response.status_code, 200)
+        types = [result['type'] for result in response.json()['data']]
+        self.assertEqual(types, ['event', 'attendee'])
+
+    async def test_create_from_texts_rejects_oversized_batch(self):
+        with self.settings(EVENTS_BATCH={'max_texts': 2}):
+            response = await self.client.post(
+                reverse('v1:events-create-from-texts'),
+                {'texts': ['a', 'b', 'c']},
+                content_type='application/json'
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error']['code'], 'BATCH_TOO_LARGE')
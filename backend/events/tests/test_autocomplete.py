@@ -0,0 +1,149 @@
+# tests/test_autocomplete.py
+from django.test import TestCase
+from django.urls import reverse
+from datetime import timedelta
+from django.utils import timezone
+import threading
+import time
+from unittest.mock import patch
+from ..models import EventsGroup, Event, Attendee
+from ..services.autocomplete import PrefixIndex, get_autocomplete_index
+
+
+class TestPrefixIndex(TestCase):
+    def setUp(self):
+        self.group = EventsGroup.objects.create()
+        self.start = timezone.now() + timedelta(days=1)
+        for title in ['Quarterly review', 'Quarterly review', 'Quick sync']:
+            self._event(title, location='Berlin Office')
+        self.index = PrefixIndex(max_age=0)
+        self.index.build()
+
+    def _event(self, title, **fields):
+        return Event.objects.create(group=self.group, title=title, start_datetime=self.start, **fields)
+
+    def _texts(self, prefix, limit=8):
+        return [suggestion['text'] for suggestion in self.index.suggest(prefix, limit)]
+
+    def test_ranked_by_frequency(self):
+        suggestions = self.index.suggest('qu')
+
+        self.assertEqual([s['text'] for s in suggestions], ['Quarterly review', 'Quick sync'])
+        self.assertEqual(suggestions[0]['count'], 2)
+
+    def test_matches_start_of_any_word_case_insensitively(self):
+        self.assertEqual(self._texts('REV'), ['Quarterly review'])
+        self.assertEqual(self._texts('office'), ['Berlin Office'])
+
+    def test_limit(self):
+        self.assertEqual(len(self.index.suggest('q', limit=1)), 1)
+        self.assertEqual(self.index.suggest('', limit=5), [])
+
+    def test_incremental_updates(self):
+        event = self._event('Design critique')
+
+        self.index.index_event(event)
+        self.assertEqual(self._texts('crit'), ['Design critique'])
+
+        event.title = 'Design jam'
+        self.index.index_event(event)
+        self.assertEqual(self._texts('crit'), [])
+        self.assertEqual(self._texts('design'), ['Design jam'])
+
+        self.index.remove_event(event.pk)
+        self.assertEqual(self._texts('design'), [])
+
+    def test_shared_text_survives_removal_of_one_source(self):
+        event = Event.objects.filter(title='Quarterly review').first()
+
+        self.index.remove_event(event.pk)
+
+        self.assertEqual(self.index.suggest('quarterly')[0]['count'], 1)
+
+    def test_signals_update_a_built_index(self):
+        index = get_autocomplete_index()
+        index.build()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            event = self._event('Offsite planning')
+            Attendee.objects.create(event=event, name='Priya Patel')
+
+        self.assertEqual([s['text'] for s in index.suggest('offs')], ['Offsite planning'])
+        self.assertEqual([s['type'] for s in index.suggest('priya')], ['attendee'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            event.delete()
+
+        self.assertEqual(index.suggest('offs'), [])
+        self.assertEqual(index.suggest('priya'), [])
+
+    def test_ranks_every_match_of_a_common_prefix(self):
+        for index in range(6000):
+            self.index._add_source(('event', f'a{index}'), [('title', f'Meeting {index:05d}')], 0.0)
+        for index in range(3):
+            self.index._add_source(('event', f'z{index}'), [('title', 'Meeting zeta')], 0.0)
+        self.index._keys.sort()
+
+        # Sorts after 6000 other "meeting" keys but is used three times
+        self.assertEqual(self._texts('meeting', limit=1), ['Meeting zeta'])
+
+    def test_stale_index_is_rebuilt_in_the_background(self):
+        loading = threading.Event()
+        release = threading.Event()
+        rows = ([{'id': 'new', 'title': 'Board meeting', 'location': '', 'venue': '', 'updated_at': None}], [])
+
+        def slow_load():
+            loading.set()
+            release.wait(5)
+            return rows
+
+        with patch.object(self.index, '_load', slow_load):
+            self.assertTrue(self.index.refresh_in_background())
+            self.assertTrue(loading.wait(5))
+            self.assertFalse(self.index.refresh_in_background())
+
+            # The old index keeps serving, and takes changes made during the rebuild
+            self.assertEqual(self._texts('quick'), ['Quick sync'])
+            event = self._event('Retro')
+            self.index.index_event(event)
+            release.set()
+            self.assertTrue(self.index._build_lock.acquire(timeout=5))
+            self.index._build_lock.release()
+
+        self.assertEqual(self._texts('quick'), [])
+        self.assertEqual(self._texts('board'), ['Board meeting'])
+        self.assertEqual(self._texts('retro'), ['Retro'])
+
+    def test_lookup_is_sub_millisecond(self):
+        for index in range(2000):
+            self.index._add_source(('event', index), [('title', f'Meeting {index}')], 0.0, keep_sorted=True)
+
+        started = time.perf_counter()
+        for _ in range(100):
+            self.index.suggest('meeting 1', 8)
+        elapsed = (time.perf_counter() - started) / 100
+
+        self.assertLess(elapsed, 0.001)
+
+
+class TestAutocompleteView(TestCase):
+    async def test_suggestions(self):
+        group = await EventsGroup.objects.acreate()
+        await Event.objects.acreate(
+            group=group,
+            title='Team lunch',
+            start_datetime=timezone.now() + timedelta(days=1)
+        )
+        get_autocomplete_index()._built_at = None
+
+        response = await self.async_client.get(reverse('v1:autocomplete'), {'q': 'lun', 'limit': 3})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['suggestions'], [
+            {'text': 'Team lunch', 'type': 'title', 'count': 1}
+        ])
+
+    async def test_invalid_limit(self):
+        response = await self.async_client.get(reverse('v1:autocomplete'), {'q': 'x', 'limit': 'many'})
+
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,208 @@
+# tests/test_circuit_breaker.py
+import asyncio
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from ..models import EventsGroup
+from ..services.circuit_breaker import CLOSED, OPEN, HALF_OPEN, ProviderGuard
+from ..services.events_service import EventsService
+from ..services.llm_service import LLMServiceError, ProviderUnavailableError
+
+
+def _guard(**config):
+    return ProviderGuard('test', {
+        'min_calls': 4, 'window_size': 4, 'failure_rate': 0.5, 'open_seconds': 60,
+        'slow_call_seconds': 60, 'queue_timeout': 0.05, **config
+    })
+
+
+async def _call(guard, error=None, delay=0):
+    async with guard.call():
+        await asyncio.sleep(delay)
+        if error:
+            raise LLMServiceError(error)
+
+
+class TestCircuitBreaker(SimpleTestCase):
+    async def _fail(self, guard, times):
+        for _ in range(times):
+            with self.assertRaises(LLMServiceError):
+                await _call(guard, 'timeout')
+
+    async def test_opens_on_failure_rate_and_fails_fast(self):
+        guard = _guard()
+        await _call(guard)
+        await self._fail(guard, 2)
+        self.assertEqual(guard.breaker.state, CLOSED)
+
+        await self._fail(guard, 1)
+        self.assertEqual(guard.breaker.state, OPEN)
+
+        with self.assertRaisesRegex(ProviderUnavailableError, 'circuit open'):
+            await _call(guard, delay=10)
+
+    async def test_half_open_probe(self):
+        guard = _guard(open_seconds=0)
+        await self._fail(guard, 4)
+        self.assertEqual(guard.breaker.state, OPEN)
+
+        # A failed probe reopens the breaker
+        await self._fail(guard, 1)
+        self.assertEqual(guard.breaker.state, OPEN)
+
+        ticket = guard.breaker.allow()
+        self.assertEqual(ticket[1], True)
+        self.assertEqual(guard.breaker.state, HALF_OPEN)
+        self.assertIsNone(guard.breaker.allow())
+        guard.breaker.record(True, ticket)
+        self.assertEqual(guard.breaker.state, CLOSED)
+
+    async def test_calls_admitted_before_opening_do_not_count_as_probes(self):
+        guard = _guard(open_seconds=0, min_limit=4)
+        slow = asyncio.create_task(_call(guard, delay=0.1))
+        await asyncio.sleep(0)
+        await self._fail(guard, 4)
+        self.assertEqual(guard.breaker.state, OPEN)
+
+        probe = guard.breaker.allow()
+        self.assertEqual(guard.breaker.state, HALF_OPEN)
+
+        # The slow call succeeding must not close the breaker or free the probe slot
+        await slow
+        self.assertEqual(guard.breaker.state, HALF_OPEN)
+        self.assertIsNone(guard.breaker.allow())
+
+        guard.breaker.record(False, probe)
+        self.assertEqual(guard.breaker.state, OPEN)
+
+    async def test_slow_calls_count_as_failures(self):
+        guard = _guard(slow_call_seconds=0)
+        for _ in range(4):
+            await _call(guard)
+        self.assertEqual(guard.breaker.state, OPEN)
+
+    async def _stream(self, guard, clock, first_token_after, duration):
+        async with guard.call() as timing:
+            clock.monotonic.return_value += first_token_after
+            timing.mark_first_token()
+            clock.monotonic.return_value += duration - first_token_after
+
+    async def test_long_streams_are_judged_on_time_to_first_token(self):
+        guard = _guard(slow_call_seconds=20, min_limit=1, max_limit=8)
+        with patch('events.services.circuit_breaker.time') as clock:
+            clock.monotonic.return_value = 1000.0
+            for _ in range(4):
+                await self._stream(guard, clock, first_token_after=1, duration=30)
+            self.assertEqual(guard.breaker.state, CLOSED)
+            self.assertGreater(guard.limit.limit, 1)
+
+            # A slow first token still counts against the provider
+            for _ in range(2):
+                await self._stream(guard, clock, first_token_after=25, duration=30)
+            self.assertEqual(guard.breaker.state, OPEN)
+
+    async def test_cancelled_calls_are_not_failures(self):
+        guard = _guard()
+        for _ in range(4):
+            task = asyncio.create_task(_call(guard, delay=10))
+            await asyncio.sleep(0)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        self.assertEqual(guard.breaker.state, CLOSED)
+        self.assertEqual(guard.limit.in_flight, 0)
+
+    async def test_disabled(self):
+        guard = _guard(enabled=False)
+        await self._fail(guard, 10)
+        await _call(guard)
+
+
+class TestAdaptiveLimit(SimpleTestCase):
+    async def test_additive_increase_multiplicative_decrease(self):
+        guard = _guard(min_limit=1, max_limit=8, window_size=100, min_calls=100)
+        guard.limit.limit = 4.0
+
+        await _call(guard)
+        self.assertAlmostEqual(guard.limit.limit, 4.25)
+
+        with self.assertRaises(LLMServiceError):
+            await _call(guard, 'overloaded')
+        self.assertAlmostEqual(guard.limit.limit, 2.125)
+
+        for _ in range(3):
+            with self.assertRaises(LLMServiceError):
+                await _call(guard, 'overloaded')
+        self.assertEqual(guard.limit.limit, 1)
+
+    async def test_calls_over_limit_wait_then_fail_fast(self):
+        guard = _guard(min_limit=1, max_limit=1, queue_timeout=0.5)
+        in_flight = []
+
+        async def tracked():
+            async with guard.call():
+                in_flight.append(guard.limit.in_flight)
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(tracked(), tracked(), tracked())
+        self.assertEqual(in_flight, [1, 1, 1])
+
+        guard.config['queue_timeout'] = 0.05
+        first = asyncio.create_task(_call(guard, delay=1))
+        await asyncio.sleep(0)
+        with self.assertRaisesRegex(ProviderUnavailableError, 'overloaded'):
+            await _call(guard)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+
+
+@override_settings(PROVIDER_ROUTER={'providers': []})
+class TestProviderUnavailableFallback(TestCase):
+    def setUp(self):
+        self.service = EventsService()
+        start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+        self.nlp_event = {
+            'title': 'Dentist', 'start_datetime': start, 'end_datetime': start + timedelta(hours=1),
+            'suggestions': '', 'attendees': []
+        }
+
+    def _nlp(self, confidence):
+        class FakeNLP:
+            def parse_with_confidence(_, text):
+                return dict(self.nlp_event), confidence
+        self.service._nlp_service = FakeNLP()
+
+    async def test_open_circuit_falls_back_to_rule_based_parse(self):
+        self._nlp(0.5)
+        group = await EventsGroup.objects.acreate()
+
+        with patch.object(self.service.llm_service, 'parse_events', new_callable=AsyncMock) as mock_parse:
+            mock_parse.side_effect = ProviderUnavailableError("openai is unavailable (circuit open)")
+            events = await self.service.process_events_group(group, 'dentist tomorrow at 3')
+
+        self.assertEqual([event.title for event in events], ['Dentist'])
+
+    async def test_fails_fast_without_a_usable_parse(self):
+        self._nlp(0.1)
+        group = await EventsGroup.objects.acreate()
+
+        with patch.object(self.service.llm_service, 'parse_events', new_callable=AsyncMock) as mock_parse:
+            mock_parse.side_effect = ProviderUnavailableError("openai is unavailable (circuit open)")
+            with self.assertRaises(Exception):
+                await self.service.process_events_group(group, 'something vague')
+
+        await group.arefresh_from_db()
+        self.assertIn('circuit open', group.processing_error)
+
+
+class TestLLMStatusEndpoint(TestCase):
+    def test_reports_breakers_and_limits(self):
+        response = self.client.get(reverse('v1:llm-status'))
+
+        self.assertEqual(response.status_code, 200)
+        providers = response.json()['data']['providers']
+        self.assertIn('ollama', providers)
+        for status in providers.values():
+            self.assertIn(status['state'], (CLOSED, OPEN, HALF_OPEN))
+            self.assertGreaterEqual(status['limit'], 1)
@@ -0,0 +1,125 @@
+# tests/test_conflicts.py
+import random
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from datetime import datetime, timedelta
+from django.utils import timezone
+from ..models import EventsGroup, Event
+from ..services.conflicts import sweep_overlaps, find_conflicts_for_events
+
+
+def _brute_force(intervals):
+    pairs = set()
+    for i, (start, end) in enumerate(intervals):
+        for j, (other_start, other_end) in enumerate(intervals[i + 1:], i + 1):
+            if start == end and other_start == other_end:
+                continue
+            if start == end:
+                overlaps = other_start <= start < other_end
+            elif other_start == other_end:
+                overlaps = start <= other_start < end
+            else:
+                overlaps = start < other_end and other_start < end
+            if overlaps:
+                pairs.add(frozenset((i, j)))
+    return pairs
+
+
+class TestSweepOverlaps(SimpleTestCase):
+    def _sweep(self, intervals, **kwargs):
+        return sweep_overlaps([start for start, _ in intervals], [end for _, end in intervals], **kwargs)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(25):
+            # Coarse starts so ties, touching ends and instants are common
+            intervals = []
+            for _ in range(rng.randint(0, 120)):
+                start = rng.randint(0, 20)
+                intervals.append((start, start + rng.choice([0, 0, 1, 2, 5])))
+            expected = _brute_force(intervals)
+
+            pairs, truncated = self._sweep(intervals)
+            self.assertEqual(len(pairs), len(expected))
+            self.assertEqual({frozenset(pair) for pair in pairs}, expected)
+            self.assertFalse(truncated)
+
+            only = {rng.randrange(len(intervals)) for _ in range(3)} if intervals else set()
+            pairs, _ = self._sweep(intervals, only=only)
+            self.assertEqual(len(pairs), len({frozenset(pair) for pair in pairs}))
+            self.assertEqual({frozenset(pair) for pair in pairs}, {pair for pair in expected if pair & only})
+
+    def test_touching_intervals_do_not_overlap(self):
+        self.assertEqual(self._sweep([(0, 1), (1, 2)]), ([], False))
+
+    def test_instant_inside_interval(self):
+        pairs, _ = self._sweep([(5, 5), (0, 10), (10, 10)])
+        self.assertEqual(pairs, [(1, 0)])
+
+    def test_limit(self):
+        pairs, truncated = self._sweep([(0, 10)] * 5, limit=3)
+        self.assertEqual(len(pairs), 3)
+        self.assertTrue(truncated)
+
+
+class TestConflictDetection(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = EventsGroup.objects.create()
+        cls.day = timezone.make_aware(datetime(2025, 3, 10, 9))
+        cls.standup = Event.objects.create(
+            group=cls.group, title='Standup', start_datetime=cls.day, end_datetime=cls.day + timedelta(hours=1)
+        )
+        Event.objects.create(
+            group=cls.group, title='Lunch', start_datetime=cls.day + timedelta(hours=3),
+            end_datetime=cls.day + timedelta(hours=4)
+        )
+
+    def test_new_events_against_existing_and_each_other(self):
+        review = Event.objects.create(
+            title='Review', start_datetime=self.day + timedelta(minutes=30),
+            end_datetime=self.day + timedelta(hours=2)
+        )
+        call = Event.objects.create(title='Call', start_datetime=self.day + timedelta(hours=1, minutes=30))
+
+        conflicts = find_conflicts_for_events([review.id, call.id])
+
+        self.assertEqual(
+            {frozenset((conflict['event_title'], conflict['conflicting_event_title'])) for conflict in conflicts},
+            {frozenset(('Review', 'Call')), frozenset(('Review', 'Standup'))}
+        )
+        # Conflicts with stored events are reported from the new event's side
+        standup = next(conflict for conflict in conflicts if conflict['conflicting_event_title'] == 'Standup')
+        self.assertEqual(standup['event_title'], 'Review')
+        self.assertEqual(standup['overlap_start'], '2025-03-10T09:30:00+08:00')
+        self.assertEqual(standup['overlap_end'], '2025-03-10T10:00:00+08:00')
+
+    def test_no_conflicts(self):
+        evening = Event.objects.create(title='Dinner', start_datetime=self.day + timedelta(hours=10))
+        self.assertEqual(find_conflicts_for_events([evening.id]), [])
+
+    def test_disabled(self):
+        review = Event.objects.create(title='Review', start_datetime=self.day)
+        with self.settings(CONFLICT_DETECTION={'enabled': False}):
+            self.assertEqual(find_conflicts_for_events([review.id]), [])
+
+    def test_conflicts_report(self):
+        Event.objects.create(
+            title='Overrun', start_datetime=self.day + timedelta(minutes=45),
+            end_datetime=self.day + timedelta(hours=3, minutes=15)
+        )
+        response = self.client.get(reverse('v1:event-conflicts') + '?start=2025-03-10&end=2025-03-11')
+
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()
+        self.assertEqual(data['count'], 2)
+        self.assertEqual(
+            {conflict['conflicting_event_title'] for conflict in data['conflicts']} |
+            {conflict['event_title'] for conflict in data['conflicts']},
+            {'Standup', 'Lunch', 'Overrun'}
+        )
+        self.assertFalse(data['truncated'])
+
+    def test_conflicts_report_requires_range(self):
+        response = self.client.get(reverse('v1:event-conflicts'))
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,190 @@
+# tests/test_events_service.py
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import asyncio
+from ..models import EventsGroup, Event, Attendee, EventNote
+from ..services.events_service import EventsService, EventsServiceError
+from ..services.concurrency import ProviderLimiter
+from ..services.llm_service import LLMServiceError
+
+
+def _parsed_events(count, attendees_per_event=5):
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    return [
+        {
+            'title': f'Session {index}',
+            'start_datetime': start + timedelta(hours=index),
+            'end_datetime': start + timedelta(hours=index + 1),
+            'notes': f'Agenda {index}',
+            'suggestions': 'Prepare slides',
+            'attendees': [
+                {'name': f'Person {index}-{n}', 'email': ''}
+                for n in range(attendees_per_event)
+            ]
+        }
+        for index in range(count)
+    ]
+
+
+class TestBulkEventPersistence(TestCase):
+    def setUp(self):
+        self.service = EventsService()
+
+    def _count_queries(self, parsed_events):
+        group = EventsGroup.objects.create()
+        with CaptureQueriesContext(connection) as queries:
+            self.service._create_events_from_parsed_data(parsed_events, group)
+        return len(queries), group
+
+    def test_query_count_is_independent_of_event_count(self):
+        single_count, _ = self._count_queries(_parsed_events(1))
+        many_count, group = self._count_queries(_parsed_events(20))
+
+        self.assertEqual(single_count, many_count)
+        self.assertEqual(group.events.count(), 20)
+        self.assertEqual(Attendee.objects.filter(event__group=group).count(), 100)
+        self.assertEqual(EventNote.objects.filter(event__group=group).count(), 20)
+
+    def test_invalid_event_creates_nothing(self):
+        parsed_events = _parsed_events(3)
+        del parsed_events[2]['start_datetime']
+        group = EventsGroup.objects.create()
+
+        with self.assertRaises(EventsServiceError):
+            self.service._create_events_from_parsed_data(parsed_events, group)
+
+        self.assertEqual(Event.objects.count(), 0)
+        self.assertEqual(Attendee.objects.count(), 0)
+
+    def test_attendees_without_names_are_skipped(self):
+        parsed_events = _parsed_events(1, attendees_per_event=1)
+        parsed_events[0]['attendees'].append({'name': '', 'email': 'x@example.com'})
+        group = EventsGroup.objects.create()
+
+        events = self.service._create_events_from_parsed_data(parsed_events, group)
+
+        self.assertEqual(events[0].attendees.count(), 1)
+        self.assertEqual(events[0].notes.content, 'Agenda 0')
+
+
+class TestBatchEventCreation(TestCase):
+    def setUp(self):
+        self.service = EventsService()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _fake_parse(self, text, group):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if text == 'fail':
+            raise LLMServiceError("rate limited")
+        return _parsed_events(1, attendees_per_event=0)
+
+    async def test_batch_is_bounded_and_reports_each_item(self):
+        texts = ['standup'] * 5 + ['fail', '  ']
+
+        with patch('events.services.events_service.get_provider_limiter',
+                   return_value=ProviderLimiter({'openai': 2})), \
+             patch.object(self.service.llm_service, 'parse_events', self._fake_parse):
+            results = await self.service.acreate_events_from_texts(texts, use_llm=True)
+
+        self.assertEqual(self.max_in_flight, 2)
+        self.assertEqual([result['index'] for result in results], list(range(7)))
+        self.assertTrue(all(result['success'] for result in results[:5]))
+        self.assertIn('rate limited', results[5]['error'])
+        self.assertIsNotNone(results[5]['group_id'])
+        self.assertEqual(results[6]['error'], "Text input cannot be empty")
+        self.assertEqual(await Event.objects.acount(), 5)
+
+
+class TestSyncEventCreation(TestCase):
+    def setUp(self):
+        self.service = EventsService()
+        self.service._nlp_unavailable = True
+
+    async def _fake_parse(self, text, group):
+        raise LLMServiceError("provider down")
+
+    def test_failure_keeps_group_with_error(self):
+        with patch.object(self.service.llm_service, 'parse_events', self._fake_parse):
+            with self.assertRaises(EventsServiceError):
+                self.service.create_events_from_text('Lunch with Sarah tomorrow at noon')
+
+        # Not rolled back with the failed parse
+        group = EventsGroup.objects.get()
+        self.assertTrue(group.processing_complete)
+        self.assertIn('provider down', group.processing_error)
+
+
+class _FakeNLPService:
+    def __init__(self, confidence):
+        self.confidence = confidence
+
+    def parse_with_confidence(self, text):
+        event_data = _parsed_events(1, attendees_per_event=1)[0]
+        event_data['title'] = 'Rule-based'
+        return event_data, self.confidence
+
+    def parse_batch_with_confidence(self, texts):
+        return [self.parse_with_confidence(text) for text in texts]
+
+
+class TestTieredParsing(TestCase):
+    def setUp(self):
+        self.service = EventsService()
+        self.llm_calls = []
+
+    async def _fake_parse(self, text, group):
+        self.llm_calls.append(text)
+        return _parsed_events(2, attendees_per_event=0)
+
+    async def _create(self, confidence):
+        self.service._nlp_service = _FakeNLPService(confidence)
+        self.service._nlp_unavailable = False
+        with patch.object(self.service.llm_service, 'parse_events', self._fake_parse):
+            return await self.service.acreate_events_from_text('Lunch with Sarah tomorrow at noon')
+
+    async def test_confident_parse_skips_llm(self):
+        group = await self._create(0.95)
+
+        self.assertEqual(self.llm_calls, [])
+        titles = [event.title async for event in Event.objects.filter(group=group)]
+        self.assertEqual(titles, ['Rule-based'])
+
+    async def test_low_confidence_escalates_to_llm(self):
+        group = await self._create(0.4)
+
+        self.assertEqual(len(self.llm_calls), 1)
+        self.assertEqual(await Event.objects.filter(group=group).acount(), 2)
+
+    async def test_fast_path_can_be_disabled(self):
+        with self.settings(NLP_FAST_PATH={'enabled': False}):
+            await self._create(1.0)
+
+        self.assertEqual(len(self.llm_calls), 1)
+
+    async def test_missing_model_falls_back_to_llm(self):
+        self.service._nlp_unavailable = True
+        with patch.object(self.service.llm_service, 'parse_events', self._fake_parse):
+            await self.service.acreate_events_from_text('Lunch with Sarah tomorrow at noon')
+
+        self.assertEqual(len(self.llm_calls), 1)
+
+    async def test_batch_only_escalates_unparsed_texts(self):
+        class _SelectiveNLPService(_FakeNLPService):
+            def parse_with_confidence(self, text):
+                event_data, _ = super().parse_with_confidence(text)
+                return event_data, 0.9 if 'noon' in text else 0.1
+
+        self.service._nlp_service = _SelectiveNLPService(0)
+        texts = ['Lunch at noon tomorrow', 'Plan the offsite', 'Coffee at noon today']
+        with patch.object(self.service.llm_service, 'parse_events', self._fake_parse):
+            results = await self.service.acreate_events_from_texts(texts, use_llm=True)
+
+        self.assertEqual(self.llm_calls, ['Plan the offsite'])
+        self.assertEqual([result['event_count'] for result in results], [1, 2, 1])
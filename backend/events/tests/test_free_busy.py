@@ -0,0 +1,92 @@
+# tests/test_free_busy.py
+import numpy as np
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from datetime import datetime, timedelta
+from django.utils import timezone
+from ..models import EventsGroup, Event, Attendee
+from ..services.free_busy import merge_intervals, free_slots
+
+
+class TestMergeIntervals(SimpleTestCase):
+    def _merge(self, intervals):
+        starts, ends = merge_intervals(
+            np.array([start for start, _ in intervals], dtype=float),
+            np.array([end for _, end in intervals], dtype=float)
+        )
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    def test_merges_overlapping_nested_and_touching(self):
+        self.assertEqual(
+            self._merge([(5, 6), (0, 2), (1, 3), (3, 4), (8, 12), (9, 10), (11, 11)]),
+            [(0, 4), (5, 6), (8, 12)]
+        )
+
+    def test_empty(self):
+        self.assertEqual(self._merge([]), [])
+
+    def test_free_slots(self):
+        starts, ends = free_slots(np.array([2.0, 5.0]), np.array([3.0, 9.0]), 0.0, 10.0, min_length=1.5)
+        self.assertEqual(list(zip(starts.tolist(), ends.tolist())), [(0.0, 2.0), (3.0, 5.0)])
+
+
+class TestFreeBusyEndpoint(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        group = EventsGroup.objects.create()
+        day = timezone.make_aware(datetime(2025, 3, 10))
+
+        def create(title, start_hour, end_hour=None, attendee=None):
+            event = Event.objects.create(
+                group=group,
+                title=title,
+                start_datetime=day + timedelta(hours=start_hour),
+                end_datetime=day + timedelta(hours=end_hour) if end_hour is not None else None
+            )
+            if attendee:
+                Attendee.objects.create(event=event, name=attendee, email=f'{attendee.lower()}@example.com')
+
+        create('Overnight', -2, 1)
+        create('Standup', 9, 10, 'Sarah')
+        create('Review', 9.5, 11)
+        create('Call', 14, attendee='Sarah')  # No end: busy for the default hour
+        create('Tomorrow', 24 + 9, 24 + 10, 'Sarah')
+
+    def _get(self, query):
+        response = self.client.get(reverse('v1:event-free-busy') + query)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_busy_and_free(self):
+        data = self._get('?start=2025-03-10&end=2025-03-11')
+        self.assertEqual(data['busy'], [
+            ['2025-03-10T00:00:00+08:00', '2025-03-10T01:00:00+08:00'],
+            ['2025-03-10T09:00:00+08:00', '2025-03-10T11:00:00+08:00'],
+            ['2025-03-10T14:00:00+08:00', '2025-03-10T15:00:00+08:00'],
+        ])
+        self.assertEqual(data['free'], [
+            ['2025-03-10T01:00:00+08:00', '2025-03-10T09:00:00+08:00'],
+            ['2025-03-10T11:00:00+08:00', '2025-03-10T14:00:00+08:00'],
+            ['2025-03-10T15:00:00+08:00', '2025-03-11T00:00:00+08:00'],
+        ])
+
+    def test_attendee_filter_and_min_length(self):
+        data = self._get('?start=2025-03-10T08:00:00&end=2025-03-10T16:00:00&attendee=SARAH@example.com&min_length=90')
+        self.assertEqual(data['busy'], [
+            ['2025-03-10T09:00:00+08:00', '2025-03-10T10:00:00+08:00'],
+            ['2025-03-10T14:00:00+08:00', '2025-03-10T15:00:00+08:00'],
+        ])
+        # The 08:00-09:00 and 15:00-16:00 gaps are shorter than 90 minutes
+        self.assertEqual(data['free'], [['2025-03-10T10:00:00+08:00', '2025-03-10T14:00:00+08:00']])
+
+    def test_invalid_params(self):
+        for query in [
+            '',
+            '?start=2025-03-10&end=2025-03-11&min_length=soon',
+            '?start=2025-03-10&end=2025-03-11&min_length=-5',
+            '?start=2025-03-10&end=2025-03-11&min_length=1441',
+            '?start=2025-03-10&end=2025-03-11&min_length=99999999999999999999',
+        ]:
+            with self.subTest(query=query):
+                response = self.client.get(reverse('v1:event-free-busy') + query)
+                self.assertEqual(response.status_code, 400)
@@ -0,0 +1,87 @@
+# tests/test_http_session.py
+from django.test import SimpleTestCase
+from asgiref.sync import sync_to_async
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from ..services.http_session import SessionPool, get_session_pool
+from ..services.loop_pools import run_sync
+from ..services.ollama_service import OllamaService
+
+
+class TestSessionPool(SimpleTestCase):
+    async def _start_server(self):
+        app = web.Application()
+        app.router.add_get('/api/tags', self._tags)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.connections = set()
+
+    async def _tags(self, request):
+        # Track client ports to see whether connections were reused
+        self.connections.add(request.transport.get_extra_info('peername'))
+        return web.json_response({'models': [{'name': 'llama3.2'}]})
+
+    def _service(self, pool):
+        service = OllamaService(base_url=str(self.server.make_url('')).rstrip('/'))
+        service.session_pool = pool
+        return service
+
+    async def test_requests_share_one_keep_alive_session(self):
+        await self._start_server()
+        pool = SessionPool('test', {'timeout': 5, 'pool_size_per_host': 2})
+        service = self._service(pool)
+
+        try:
+            self.assertEqual(await service.get_available_models(), ['llama3.2'])
+            first_session = pool.get_session()
+            self.assertTrue(await service.check_connectivity())
+            self.assertEqual(await service.get_available_models(), ['llama3.2'])
+
+            self.assertIs(pool.get_session(), first_session)
+            self.assertEqual(len(self.connections), 1)
+        finally:
+            await pool.close()
+            await self.server.close()
+
+        self.assertTrue(first_session.closed)
+
+    async def test_session_uses_configured_timeouts(self):
+        pool = SessionPool('test', {'timeout': 12, 'connect_timeout': 3})
+        session = pool.get_session()
+
+        self.assertEqual(session.timeout.total, 12)
+        self.assertEqual(session.timeout.sock_read, 12)
+        self.assertEqual(session.timeout.connect, 3)
+        await pool.close()
+
+    async def test_closed_session_is_replaced(self):
+        pool = SessionPool('test')
+        session = pool.get_session()
+        await session.close()
+
+        self.assertIsNot(pool.get_session(), session)
+        await pool.close()
+
+
+class TestRunSync(SimpleTestCase):
+    def setUp(self):
+        self.pool = get_session_pool('test-run-sync')
+
+    async def _open_session(self):
+        return self.pool.get_session()
+
+    def test_sessions_opened_on_the_private_loop_are_closed(self):
+        session = run_sync(self._open_session)
+
+        self.assertTrue(session.closed)
+
+    async def test_sessions_of_the_calling_loop_stay_open(self):
+        session = self.pool.get_session()
+        try:
+            private_session = await sync_to_async(run_sync)(self._open_session)
+
+            self.assertIsNot(private_session, session)
+            self.assertTrue(private_session.closed)
+            self.assertFalse(session.closed)
+        finally:
+            await self.pool.close()
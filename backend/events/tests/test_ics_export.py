@@ -0,0 +1,93 @@
+# tests/test_ics_export.py
+from django.test import TestCase
+from django.urls import reverse
+from datetime import datetime, timedelta
+from django.utils import timezone
+from ..models import EventsGroup, Event, Attendee
+
+
+def _local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+class TestICSExport(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = EventsGroup.objects.create()
+        cls.other_group = EventsGroup.objects.create()
+        cls.standup = Event.objects.create(
+            group=cls.group, title='Standup', rrule='FREQ=WEEKLY;BYDAY=MO',
+            start_datetime=_local(2025, 3, 10, 9), end_datetime=_local(2025, 3, 10, 9, 15)
+        )
+        cls.review = Event.objects.create(
+            group=cls.group, title='Review', start_datetime=_local(2025, 3, 12, 14)
+        )
+        Attendee.objects.create(event=cls.review, name='Sarah', email='sarah@example.com')
+        cls.offsite = Event.objects.create(
+            group=cls.other_group, title='Offsite',
+            start_datetime=_local(2025, 4, 2, 9), end_datetime=_local(2025, 4, 2, 17)
+        )
+
+    def _export(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        return b''.join(response.streaming_content)
+
+    def test_group_export(self):
+        content = self._export(reverse('v1:events-group-export-ics', args=[self.group.id]))
+
+        self.assertTrue(content.startswith(b'BEGIN:VCALENDAR'))
+        self.assertTrue(content.rstrip().endswith(b'END:VCALENDAR'))
+        self.assertEqual(content.count(b'BEGIN:VEVENT'), 2)
+        self.assertIn(b'SUMMARY:Standup', content)
+        self.assertIn(b'RRULE:FREQ=WEEKLY;BYDAY=MO', content)
+        self.assertIn(b'mailto:sarah@example.com', content)
+        self.assertNotIn(b'Offsite', content)
+
+    def test_uids_stable_across_exports(self):
+        url = reverse('v1:event-export-ics')
+        first, second = self._export(url), self._export(url)
+
+        self.assertIn(f'UID:{self.standup.id}@flowagenda'.encode(), first)
+        uids = [line for line in first.splitlines() if line.startswith(b'UID:')]
+        self.assertEqual(len(uids), 3)
+        self.assertEqual(uids, [line for line in second.splitlines() if line.startswith(b'UID:')])
+
+    def test_export_uses_list_filters(self):
+        content = self._export(reverse('v1:event-export-ics') + '?date_from=2025-04-01&date_to=2025-04-30')
+        self.assertIn(b'SUMMARY:Offsite', content)
+        self.assertNotIn(b'SUMMARY:Review', content)
+
+        content = self._export(reverse('v1:event-export-ics') + f'?group={self.other_group.id}')
+        self.assertEqual(content.count(b'BEGIN:VEVENT'), 1)
+
+    def test_queries_do_not_grow_with_events(self):
+        for day in range(30):
+            event = Event.objects.create(group=self.group, title=f'Event {day}', start_datetime=_local(2025, 5, 1) + timedelta(days=day))
+            Attendee.objects.create(event=event, name='Sam', email='sam@example.com')
+
+        url = reverse('v1:events-group-export-ics', args=[self.group.id])
+        # Group lookup, events joined with notes, attendees prefetch
+        with self.assertNumQueries(3):
+            content = self._export(url)
+        self.assertEqual(content.count(b'BEGIN:VEVENT'), 32)
+
+    def test_single_event_download(self):
+        response = self.client.get(reverse('v1:event-download-ics', args=[self.review.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(f'UID:{self.review.id}@flowagenda'.encode(), response.content)
+
+
+class TestICSExportASGI(TestCase):
+    async def test_streams_asynchronously(self):
+        group = await EventsGroup.objects.acreate()
+        await Event.objects.acreate(group=group, title='Standup', start_datetime=_local(2025, 3, 10, 9))
+
+        response = await self.async_client.get(reverse('v1:events-group-export-ics', args=[group.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        content = b''.join([chunk async for chunk in response.streaming_content])
+        self.assertIn(b'SUMMARY:Standup', content)
@@ -0,0 +1,101 @@
+# tests/test_job_queue.py
+from django.test import TestCase
+from datetime import datetime, timedelta
+from unittest.mock import patch, AsyncMock
+from django.utils import timezone
+from ..models import EventsGroup, ProcessingJob
+from ..services.events_service import EventsService
+from ..services.job_queue import JobQueue, JobWorkerPool
+from ..services.llm_service import LLMServiceError
+
+
+def _parsed_event(title='Team Sync'):
+    start = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    return {
+        'title': title,
+        'start_datetime': start,
+        'end_datetime': start + timedelta(hours=1),
+        'location': '',
+        'venue': '',
+        'notes': 'Bring slides',
+        'suggestions': 'Prepare agenda',
+        'attendees': [{'name': 'Sarah', 'email': ''}]
+    }
+
+
+class TestJobQueue(TestCase):
+    def setUp(self):
+        self.service = EventsService()
+        self.queue = JobQueue(lease_timeout=60, max_attempts=2)
+
+    def test_enqueue_creates_pending_group_and_job(self):
+        group = self.service.enqueue_events_from_text("Team sync tomorrow at 10am")
+
+        self.assertFalse(group.processing_complete)
+        self.assertEqual(group.job.status, ProcessingJob.STATUS_PENDING)
+        self.assertEqual(group.events.count(), 0)
+
+    def test_claim_next_claims_each_job_once(self):
+        self.service.enqueue_events_from_text("Team sync tomorrow at 10am")
+
+        job = self.queue.claim_next()
+        self.assertEqual(job.status, ProcessingJob.STATUS_RUNNING)
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNone(self.queue.claim_next())
+
+    def test_stale_jobs_are_reclaimed_then_expired(self):
+        group = self.service.enqueue_events_from_text("Team sync tomorrow at 10am")
+        self.queue.claim_next()
+        ProcessingJob.objects.filter(group=group).update(
+            started_at=timezone.now() - timedelta(minutes=5)
+        )
+
+        job = self.queue.claim_next()
+        self.assertEqual(job.attempts, 2)
+
+        ProcessingJob.objects.filter(group=group).update(
+            started_at=timezone.now() - timedelta(minutes=5)
+        )
+        self.assertIsNone(self.queue.claim_next())
+        self.assertEqual(self.queue.expire_stale(), 1)
+
+        group.refresh_from_db()
+        self.assertTrue(group.processing_complete)
+        self.assertIn("abandoned", group.processing_error)
+
+
+class TestJobWorkerPool(TestCase):
+    def setUp(self):
+        self.service = EventsService()
+        self.pool = JobWorkerPool(events_service=self.service, workers=2, poll_interval=0.01)
+
+    async def test_workers_persist_parsed_events(self):
+        group = await EventsGroup.objects.acreate()
+        await ProcessingJob.objects.acreate(group=group, text="Team sync tomorrow")
+
+        with patch.object(self.service.llm_service, 'parse_events',
+                          new_callable=AsyncMock) as mock_parse:
+            mock_parse.return_value = [_parsed_event()]
+            await self.pool.run(drain=True)
+
+        await group.arefresh_from_db()
+        job = await ProcessingJob.objects.aget(group=group)
+        self.assertTrue(group.processing_complete)
+        self.assertEqual(group.processing_error, '')
+        self.assertEqual(job.status, ProcessingJob.STATUS_DONE)
+        self.assertEqual(await group.events.acount(), 1)
+
+    async def test_worker_records_parse_failure(self):
+        group = await EventsGroup.objects.acreate()
+        await ProcessingJob.objects.acreate(group=group, text="gibberish", use_llm=False)
+
+        with patch.object(self.service.ollama_service, 'parse_events',
+                          new_callable=AsyncMock) as mock_parse:
+            mock_parse.side_effect = LLMServiceError("model unavailable")
+            await self.pool.run(drain=True)
+
+        await group.arefresh_from_db()
+        job = await ProcessingJob.objects.aget(group=group)
+        self.assertTrue(group.processing_complete)
+        self.assertIn("Ollama processing failed", group.processing_error)
+        self.assertEqual(job.status, ProcessingJob.STATUS_FAILED)
@@ -0,0 +1,109 @@
+# tests/test_llm_clients.py
+import asyncio
+import json
+import re
+import time
+from django.test import SimpleTestCase
+from django.utils import timezone
+from datetime import timedelta
+from unittest.mock import patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from ..services.llm_clients import LLMClientPool
+from ..services.circuit_breaker import ProviderGuard
+from ..services.llm_service import LLMService
+from ..services.parse_cache import ParseCache
+
+STUB_DELAY = 0.3
+
+
+class TestAnthropicClientPool(SimpleTestCase):
+    async def _start_server(self):
+        app = web.Application()
+        app.router.add_post('/v1/messages', self._messages)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _messages(self, request):
+        body = await request.json()
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(STUB_DELAY)
+        finally:
+            self.in_flight -= 1
+
+        tomorrow = (timezone.now() + timedelta(days=1)).date()
+        events = {'events': [{
+            'title': re.search(r'Meeting \d+', body['messages'][0]['content']).group(0),
+            'start_date': tomorrow.strftime('%Y-%m-%d'),
+            'start_time': '09:00',
+            'suggestions': ['Be on time'],
+        }]}
+        return web.json_response({
+            'id': 'msg_test',
+            'type': 'message',
+            'role': 'assistant',
+            'model': body['model'],
+            'content': [{'type': 'text', 'text': json.dumps(events)}],
+            'stop_reason': 'end_turn',
+            'stop_sequence': None,
+            'usage': {'input_tokens': 10, 'output_tokens': 10},
+        })
+
+    def _service(self, pool):
+        config = {
+            'provider': 'anthropic',
+            'anthropic': {
+                'api_key': 'test-key',
+                'model': 'claude-test',
+                'base_url': str(self.server.make_url('')).rstrip('/'),
+            },
+        }
+        with patch('events.services.llm_service.LLMConfig._load_config', return_value=config):
+            service = LLMService()
+        # The shared cache may already exist with its DB tier, which a SimpleTestCase cannot use
+        service.cache = ParseCache(db_enabled=False)
+        return service
+
+    async def test_concurrent_parses_overlap(self):
+        await self._start_server()
+        pool = LLMClientPool({'timeout': 5})
+
+        try:
+            # The adaptive limit would cap concurrency at LLM_CONCURRENCY['anthropic']
+            with patch('events.services.llm_service.get_llm_client_pool', return_value=pool), \
+                 patch('events.services.llm_service.get_provider_guard',
+                       return_value=ProviderGuard('anthropic', {'enabled': False})):
+                services = [self._service(pool) for _ in range(5)]
+                started = time.perf_counter()
+                results = await asyncio.gather(*(
+                    service.parse_events(f'Meeting {index:04d}', None)
+                    for index, service in enumerate(services)
+                ))
+                elapsed = time.perf_counter() - started
+
+                # Every service on this loop shares one client
+                self.assertEqual(len({id(service.client) for service in services}), 1)
+        finally:
+            await pool.close()
+            await self.server.close()
+
+        self.assertEqual([events[0]['title'] for events in results], [f'Meeting {index:04d}' for index in range(5)])
+        self.assertEqual(self.max_in_flight, 5)
+        self.assertLess(elapsed, STUB_DELAY * 3)
+
+    async def test_client_uses_configured_limits_and_timeouts(self):
+        pool = LLMClientPool({'timeout': 12, 'connect_timeout': 3, 'max_retries': 1})
+        client = pool.get_client('anthropic', {'api_key': 'test-key'})
+
+        self.assertEqual(client.max_retries, 1)
+        self.assertEqual(client._client.timeout.read, 12)
+        self.assertEqual(client._client.timeout.connect, 3)
+        self.assertIs(pool.get_client('anthropic', {'api_key': 'test-key'}), client)
+        self.assertIsNot(pool.get_client('openai', {'api_key': 'test-key'}), client)
+
+        await pool.close()
+        self.assertTrue(client.is_closed())
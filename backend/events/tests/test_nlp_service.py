@@ -0,0 +1,98 @@
+# tests/test_nlp_service.py
+from django.test import SimpleTestCase
+from datetime import time
+from unittest.mock import patch
+import unittest
+import spacy
+from ..services.nlp_service import NLPService
+
+
+@unittest.skipUnless(spacy.util.is_package('en_core_web_sm'), 'en_core_web_sm is not installed')
+class TestParseWithConfidence(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.service = NLPService()
+
+    def test_simple_event_is_confident(self):
+        event, confidence = self.service.parse_with_confidence('Lunch with Sarah tomorrow at noon in Cafe X')
+
+        self.assertGreaterEqual(confidence, 0.8)
+        self.assertEqual(event['start_datetime'].hour, 12)
+        self.assertEqual(event['location'], 'Cafe X')
+        self.assertTrue(event['suggestions'])
+
+    def test_missing_time_is_not_confident(self):
+        _, confidence = self.service.parse_with_confidence('Catch up with the design team')
+
+        self.assertLess(confidence, 0.8)
+
+    def test_multiple_events_score_zero(self):
+        _, confidence = self.service.parse_with_confidence(
+            'Standup at 9am tomorrow; retro on Friday at 4pm'
+        )
+
+        self.assertEqual(confidence, 0.0)
+
+    def test_recurring_event_scores_zero(self):
+        _, confidence = self.service.parse_with_confidence('Gym every Monday at 7am')
+
+        self.assertEqual(confidence, 0.0)
+
+
+class TestConfidenceScoring(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Scoring and time extraction only look at the text, so a blank pipeline will do
+        with patch('events.services.nlp_service.spacy.load', return_value=spacy.blank('en')):
+            cls.service = NLPService()
+
+    def _score(self, text):
+        return self.service._score_confidence(text, 'Meeting', '', '', ['Sarah'])
+
+    def test_modal_may_is_not_a_date(self):
+        self.assertEqual(self._score('We may meet with Sarah at 3pm'), self._score('We meet with Sarah at 3pm'))
+        self.assertLess(self._score('We may meet with Sarah at 3pm'), 0.8)
+
+    def test_month_with_day_is_a_date(self):
+        self.assertGreaterEqual(self._score('Meet Sarah on May 3 at 3pm'), 0.8)
+        self.assertGreaterEqual(self._score('Meet Sarah on the 3rd of May at 3pm'), 0.8)
+
+    def test_scored_times_are_the_times_extracted(self):
+        text = 'Standup with Sarah tomorrow at 15:30'
+        self.assertGreaterEqual(self._score(text), 0.8)
+
+        start, _ = self.service._extract_datetime(self.service.nlp(text), text)
+        self.assertEqual((start.hour, start.minute), (15, 30))
+        self.assertEqual(self.service._extract_time('Gym at 9:05')[0], time(9, 5))
+
+    def test_impossible_clock_time_is_not_explicit(self):
+        self.assertEqual(self._score('Standup with Sarah tomorrow at 27:90'), self._score('Standup with Sarah tomorrow'))
+
+
+@unittest.skipUnless(spacy.util.is_package('en_core_web_sm'), 'en_core_web_sm is not installed')
+class TestParseEventsBatch(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.service = NLPService(batch_size=4)
+
+    def test_unused_components_are_excluded(self):
+        self.assertNotIn('lemmatizer', self.service.nlp.pipe_names)
+
+    def test_batch_matches_single_parses(self):
+        texts = [
+            'Dentist appointment on Friday at 3pm',
+            'Team standup at 9:30am on Monday in the Conference Room',
+            'Dinner with Alex at Luigi Restaurant on Saturday at 7pm',
+        ] * 3
+
+        batch = self.service.parse_events_batch(texts)
+
+        self.assertEqual(len(batch), len(texts))
+        for text, event in zip(texts, batch):
+            single = self.service.parse_event(text)
+            self.assertEqual(event['title'], single['title'])
+            self.assertEqual(event['start_datetime'], single['start_datetime'])
+            self.assertEqual(event['venue'], single['venue'])
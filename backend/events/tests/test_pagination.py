@@ -0,0 +1,91 @@
+# tests/test_pagination.py
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import timedelta
+from django.utils import timezone
+from ..models import EventsGroup, Event
+
+
+class TestKeysetPagination(TestCase):
+    """Cursor pagination walks every row exactly once, in sort order"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = EventsGroup.objects.create(processing_complete=True)
+        start = timezone.now().replace(microsecond=0) + timedelta(days=1)
+        # Pairs of events share a start time and title so the id tiebreak matters
+        Event.objects.bulk_create([
+            Event(
+                group=cls.group,
+                title=f'Meeting {index // 2}',
+                start_datetime=start + timedelta(hours=index // 2)
+            )
+            for index in range(11)
+        ])
+
+    def _walk(self, url, link='next'):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, response.content)
+            pages.append(response.json())
+            url = response.json()[link]
+        return pages
+
+    def _ids(self, pages):
+        return [event['id'] for page in pages for event in page['results']]
+
+    def test_walks_all_rows_in_order(self):
+        for sort in ['start_datetime', 'created_at', 'title']:
+            for order in ['asc', 'desc']:
+                with self.subTest(sort=sort, order=order):
+                    expected = list(Event.objects.order_by(
+                        *(f"{'-' if order == 'desc' else ''}{field}" for field in (sort, 'id'))
+                    ).values_list('id', flat=True))
+                    pages = self._walk(
+                        reverse('v1:event-list') +
+                        f'?pagination=cursor&page_size=3&sort={sort}&order={order}'
+                    )
+                    self.assertEqual(self._ids(pages), [str(event_id) for event_id in expected])
+                    self.assertEqual([len(page['results']) for page in pages], [3, 3, 3, 2])
+
+    def test_previous_links_walk_back(self):
+        forward = self._walk(reverse('v1:event-list') + '?pagination=cursor&page_size=4')
+        backward = self._walk(forward[-1]['previous'], link='previous')
+        self.assertEqual(
+            [page['results'] for page in reversed(backward)],
+            [page['results'] for page in forward[:-1]]
+        )
+        self.assertIsNone(forward[0]['previous'])
+
+    def test_count_is_optional(self):
+        url = reverse('v1:event-list') + '?pagination=cursor'
+        self.assertNotIn('count', self.client.get(url).json())
+        self.assertEqual(self.client.get(url + '&count=true').json()['count'], 11)
+
+    def test_cursor_pages_skip_count_query(self):
+        first = self.client.get(reverse('v1:event-list') + '?pagination=cursor&page_size=3').json()
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(first['next'])
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries.captured_queries))
+
+    def test_page_number_pagination_is_default(self):
+        data = self.client.get(reverse('v1:event-list') + '?page=1').json()
+        self.assertEqual(data['count'], 11)
+        self.assertEqual(len(data['results']), 11)
+
+    def test_groups(self):
+        EventsGroup.objects.bulk_create([EventsGroup() for _ in range(4)])
+        pages = self._walk(reverse('v1:events-group-list') + '?pagination=cursor&page_size=2')
+        expected = EventsGroup.objects.order_by('-created_at', '-id').values_list('id', flat=True)
+        self.assertEqual(self._ids(pages), [str(group_id) for group_id in expected])
+
+    def test_unsupported_sort_rejected(self):
+        response = self.client.get(reverse('v1:events-group-list') + '?pagination=cursor&sort=event_count')
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_cursor_rejected(self):
+        response = self.client.get(reverse('v1:event-list') + '?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 400)
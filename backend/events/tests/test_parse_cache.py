@@ -0,0 +1,115 @@
+# tests/test_parse_cache.py
+from django.test import TestCase
+from datetime import date, datetime, timedelta
+from unittest.mock import patch, AsyncMock
+from ..models import ParseCacheEntry
+from ..services.parse_cache import ParseCache
+from ..services.llm_service import LLMService
+
+
+class TestParseCache(TestCase):
+    def setUp(self):
+        self.cache = ParseCache(memory_max_entries=2, db_max_entries=2, ttl=60, db_evict_interval=1)
+        self.today = date(2024, 11, 9)
+
+    def test_key_normalizes_whitespace_but_not_reference_date(self):
+        key = ParseCache.make_key("Lunch  with Sarah\n tomorrow ", 'openai', 'gpt-4o-mini', self.today)
+
+        self.assertEqual(
+            key,
+            ParseCache.make_key("Lunch with Sarah tomorrow", 'openai', 'gpt-4o-mini', self.today)
+        )
+        self.assertNotEqual(
+            key,
+            ParseCache.make_key("Lunch with Sarah tomorrow", 'openai', 'gpt-4o-mini',
+                                self.today + timedelta(days=1))
+        )
+        self.assertNotEqual(
+            key,
+            ParseCache.make_key("Lunch with Sarah tomorrow", 'ollama', 'gpt-4o-mini', self.today)
+        )
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        self.cache.db_enabled = False
+        self.cache.set('a', {'events': []})
+        self.cache.set('b', {'events': []})
+        self.cache.get('a')
+        self.cache.set('c', {'events': []})
+
+        self.assertIsNotNone(self.cache.get('a'))
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_db_tier_serves_entries_after_memory_is_lost(self):
+        self.cache.set('a', {'events': [{'title': 'Lunch'}]}, 'openai', 'gpt-4o-mini')
+        self.cache._memory.clear()
+
+        self.assertEqual(self.cache.get('a'), {'events': [{'title': 'Lunch'}]})
+        stats = self.cache.stats()
+        self.assertEqual(stats['db_hits'], 1)
+        self.assertEqual(stats['misses'], 0)
+
+    def test_db_tier_is_trimmed_to_max_entries(self):
+        for key in ['a', 'b', 'c']:
+            self.cache.set(key, {'events': []})
+
+        self.assertEqual(ParseCacheEntry.objects.count(), 2)
+        self.assertFalse(ParseCacheEntry.objects.filter(key='a').exists())
+
+    def test_db_tier_is_swept_every_interval_writes(self):
+        cache = ParseCache(db_max_entries=2, ttl=60, db_evict_interval=3)
+        for key in ['a', 'b', 'c', 'd', 'e']:
+            cache.set(key, {'events': []})
+
+        # Swept once after the third write; the next two wait for the following sweep
+        self.assertEqual(ParseCacheEntry.objects.count(), 4)
+        self.assertFalse(ParseCacheEntry.objects.filter(key='a').exists())
+        cache.set('f', {'events': []})
+        self.assertEqual(ParseCacheEntry.objects.count(), 2)
+
+    def test_expired_entries_are_misses(self):
+        cache = ParseCache(ttl=0)
+        cache.set('a', {'events': []})
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['misses'], 1)
+
+
+class TestLLMServiceParseCache(TestCase):
+    def setUp(self):
+        self.service = LLMService()
+        self.service.cache = ParseCache()
+        tomorrow = (datetime.now() + timedelta(days=1)).date()
+        self.llm_response = {
+            'is_multi_event': False,
+            'events': [{
+                'title': 'Lunch with Sarah',
+                'start_date': tomorrow.strftime('%Y-%m-%d'),
+                'start_time': '12:00',
+                'suggestions': ['Book a table']
+            }]
+        }
+
+    async def test_cache_hit_skips_provider_call(self):
+        with patch.object(self.service, '_process_with_openai',
+                          new_callable=AsyncMock) as mock_openai:
+            mock_openai.return_value = self.llm_response
+
+            first = await self.service.parse_events("Lunch with Sarah tomorrow at noon", None)
+            second = await self.service.parse_events("Lunch with  Sarah tomorrow at noon ", None)
+
+        self.assertEqual(mock_openai.await_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(self.service.cache.stats()['memory_hits'], 1)
+
+    async def test_failed_validation_is_not_cached(self):
+        self.llm_response['events'][0].pop('suggestions')
+
+        with patch.object(self.service, '_process_with_openai',
+                          new_callable=AsyncMock) as mock_openai:
+            mock_openai.return_value = self.llm_response
+            for _ in range(2):
+                with self.assertRaises(Exception):
+                    await self.service.parse_events("Lunch with Sarah tomorrow", None)
+
+        self.assertEqual(mock_openai.await_count, 2)
@@ -0,0 +1,56 @@
+# tests/test_prompts.py
+from datetime import date
+from io import StringIO
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from ..services.llm_service import LLMService
+from ..services.ollama_service import OllamaService
+from ..services.prompts import PARSE_INSTRUCTIONS, format_parse_prompt, parse_request_text
+from ..services.registry import _build_ollama_service
+
+
+class TestParsePrompt(SimpleTestCase):
+    def test_instructions_do_not_vary(self):
+        request_text = parse_request_text('Lunch with Sarah tomorrow at noon', date(2025, 6, 2))
+
+        self.assertEqual(request_text, "Today is 2025-06-02 (Monday).\n\nText to parse: Lunch with Sarah tomorrow at noon")
+        self.assertNotIn('Today is', PARSE_INSTRUCTIONS)
+        self.assertTrue(format_parse_prompt('Gym at 6pm', date(2025, 6, 3)).startswith(PARSE_INSTRUCTIONS))
+
+    def test_openai_request_keeps_instructions_in_system_message(self):
+        service = LLMService(provider='openai')
+        first = service._openai_request(parse_request_text('Gym at 6pm', date(2025, 6, 2)))
+        second = service._openai_request(parse_request_text('Dentist on Friday at 3pm', date(2025, 6, 3)))
+
+        self.assertEqual(first['messages'][0], second['messages'][0])
+        self.assertIn(PARSE_INSTRUCTIONS, first['messages'][0]['content'])
+        self.assertEqual(second['messages'][1]['content'], parse_request_text('Dentist on Friday at 3pm', date(2025, 6, 3)))
+
+    def test_anthropic_request_marks_instructions_for_caching(self):
+        service = LLMService(provider='anthropic')
+        request = service._anthropic_request(parse_request_text('Gym at 6pm'))
+
+        [system] = request['system']
+        self.assertTrue(system['text'].endswith(PARSE_INSTRUCTIONS))
+        self.assertEqual(system['cache_control'], {'type': 'ephemeral'})
+        self.assertNotIn(PARSE_INSTRUCTIONS, request['messages'][0]['content'])
+
+    @override_settings(OLLAMA_CONFIG={'default_model': 'llama3.2', 'keep_alive': '1h'})
+    def test_ollama_request_sends_system_prompt_and_keep_alive(self):
+        service = _build_ollama_service()
+        request = service._generate_request(parse_request_text('Gym at 6pm'), stream=False)
+
+        self.assertEqual(request['system'], PARSE_INSTRUCTIONS)
+        self.assertEqual(request['keep_alive'], '1h')
+        self.assertTrue(request['prompt'].startswith('Today is'))
+        self.assertEqual(OllamaService()._generate_request('x', stream=True)['keep_alive'], '30m')
+
+
+class TestMeasurePromptCacheCommand(SimpleTestCase):
+    def test_dry_run_estimates_both_layouts(self):
+        out = StringIO()
+        call_command('measure_prompt_cache', '--dry-run', '--provider', 'anthropic', stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertTrue(lines[1].strip().startswith('inline:'))
+        self.assertTrue(lines[2].strip().startswith('split:'))
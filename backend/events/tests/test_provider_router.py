@@ -0,0 +1,151 @@
+# tests/test_provider_router.py
+import asyncio
+import time
+from django.test import SimpleTestCase
+from unittest.mock import patch
+from ..services.llm_service import LLMService, LLMServiceError, ProviderUnavailableError
+from ..services.provider_router import LatencyTracker, ProviderRouter
+
+
+class FakeService:
+    def __init__(self, name, delay=0.0, error=None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def parse_events(self, text, group):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise LLMServiceError(self.error)
+        return [{'title': self.name}]
+
+    async def stream_events(self, text):
+        for event_data in await self.parse_events(text, None):
+            yield event_data
+
+
+class TestProviderRouter(SimpleTestCase):
+    def _router(self, *services, **config):
+        return ProviderRouter(
+            {service.name: (lambda service=service: service) for service in services},
+            config={'providers': [service.name for service in services], 'hedge_delay': 0.05, **config},
+            latency=LatencyTracker()
+        )
+
+    async def test_primary_answers(self):
+        primary, secondary = FakeService('openai'), FakeService('anthropic')
+        result = await self._router(primary, secondary).parse_events('text')
+
+        self.assertEqual(result, [{'title': 'openai'}])
+        self.assertEqual(secondary.calls, 0)
+
+    async def test_fails_over_without_waiting_for_hedge(self):
+        primary = FakeService('openai', error='rate limited')
+        secondary = FakeService('anthropic')
+        router = self._router(primary, secondary, hedge_delay=10)
+
+        started = time.perf_counter()
+        result = await router.parse_events('text')
+
+        self.assertEqual(result, [{'title': 'anthropic'}])
+        self.assertLess(time.perf_counter() - started, 1)
+
+    async def test_stream_fails_over_before_first_event(self):
+        primary = FakeService('openai', error='circuit open')
+        secondary = FakeService('anthropic')
+        events = [event async for event in self._router(primary, secondary).stream_events('text')]
+
+        self.assertEqual(events, [{'title': 'anthropic'}])
+        self.assertEqual(primary.calls, 1)
+
+    async def test_stream_reports_unavailable_when_no_provider_can_be_called(self):
+        class UnavailableService(FakeService):
+            async def stream_events(self, text):
+                raise ProviderUnavailableError(f'{self.name} circuit open')
+                yield
+
+        router = self._router(UnavailableService('openai'), UnavailableService('anthropic'))
+        with self.assertRaises(ProviderUnavailableError):
+            async for _ in router.stream_events('text'):
+                pass
+
+    async def test_hedges_slow_primary(self):
+        primary = FakeService('openai', delay=2)
+        secondary = FakeService('anthropic', delay=0.05)
+        router = self._router(primary, secondary)
+
+        started = time.perf_counter()
+        result = await router.parse_events('text')
+
+        self.assertEqual(result, [{'title': 'anthropic'}])
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertTrue(primary.cancelled)
+
+    async def test_slow_primary_still_wins_if_first(self):
+        primary = FakeService('openai', delay=0.1)
+        secondary = FakeService('anthropic', delay=1)
+        router = self._router(primary, secondary)
+
+        self.assertEqual(await router.parse_events('text'), [{'title': 'openai'}])
+        self.assertEqual(secondary.calls, 1)
+        self.assertTrue(secondary.cancelled)
+
+    async def test_hedge_delay_follows_observed_latency(self):
+        router = self._router(FakeService('openai'), min_samples=10)
+        self.assertEqual(router.hedge_delay('openai'), 0.05)
+
+        for latency in range(1, 11):
+            router.latency.record('openai', latency / 10)
+        self.assertAlmostEqual(router.hedge_delay('openai'), 0.9)
+
+        router.config['hedge'] = False
+        self.assertEqual(router.hedge_delay('openai'), float('inf'))
+
+    async def test_budget_bounds_latency(self):
+        primary, secondary = FakeService('openai', delay=5), FakeService('anthropic', delay=5)
+        router = self._router(primary, secondary)
+
+        started = time.perf_counter()
+        with self.assertRaisesRegex(LLMServiceError, 'within 0.2 seconds'):
+            await router.parse_events('text', budget=0.2)
+
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertTrue(primary.cancelled and secondary.cancelled)
+
+    async def test_all_providers_fail(self):
+        router = self._router(FakeService('openai', error='down'), FakeService('anthropic', error='overloaded'))
+
+        with self.assertRaisesRegex(LLMServiceError, 'openai: down; anthropic: overloaded'):
+            await router.parse_events('text')
+
+    async def test_unavailable_provider_is_skipped(self):
+        def missing():
+            raise LLMServiceError("Provider 'anthropic' not found in config")
+
+        router = ProviderRouter(
+            {'anthropic': missing, 'openai': lambda: FakeService('openai')},
+            config={'providers': ['anthropic', 'openai']},
+            latency=LatencyTracker()
+        )
+        self.assertEqual(router.available(), ['openai'])
+        self.assertEqual(await router.parse_events('text'), [{'title': 'openai'}])
+
+    async def test_fallback_does_not_switch_provider(self):
+        service = LLMService()
+        primary = FakeService(service.provider, error='down')
+        other = FakeService('anthropic' if service.provider == 'openai' else 'openai')
+        router = self._router(primary, other)
+
+        with patch('events.services.registry.get_provider_router', return_value=router):
+            result = await service.process_with_fallback('text', None)
+
+        self.assertEqual(result, [{'title': other.name}])
+        self.assertEqual(service.provider, service.config.provider)
+        self.assertEqual(primary.calls, 1)
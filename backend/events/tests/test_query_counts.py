@@ -0,0 +1,85 @@
+# tests/test_query_counts.py
+from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from datetime import timedelta
+from django.utils import timezone
+from ..models import EventsGroup, Event, Attendee, EventNote
+
+PAGE_SIZES = [1, 5, 20]
+
+
+def _create_groups(group_count, events_per_group=2, attendees_per_event=3):
+    start = timezone.now() + timedelta(days=1)
+    groups = []
+    for group_index in range(group_count):
+        group = EventsGroup.objects.create(processing_complete=True)
+        for event_index in range(events_per_group):
+            event = Event.objects.create(
+                group=group,
+                title=f'Meeting {group_index}-{event_index}',
+                start_datetime=start + timedelta(hours=event_index),
+                end_datetime=start + timedelta(hours=event_index + 1)
+            )
+            EventNote.objects.create(event=event, content='Agenda')
+            Attendee.objects.bulk_create([
+                Attendee(event=event, name=f'Person {n}') for n in range(attendees_per_event)
+            ])
+        groups.append(group)
+    return groups
+
+
+class TestQueryCounts(TestCase):
+    """Query counts must stay fixed as the number of rows on a page grows"""
+
+    def _queries_for(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return len(queries)
+
+    def _assert_constant(self, build_url, expected):
+        counts = []
+        for size in PAGE_SIZES:
+            EventsGroup.objects.all().delete()
+            groups = _create_groups(size)
+            counts.append(self._queries_for(build_url(groups)))
+        self.assertEqual(counts, [expected] * len(PAGE_SIZES))
+
+    def test_event_list(self):
+        # count, events joined with notes, attendees
+        self._assert_constant(lambda groups: reverse('v1:event-list'), 3)
+
+    def test_event_list_with_search(self):
+        self._assert_constant(lambda groups: reverse('v1:event-list') + '?search=Meeting', 3)
+
+    def test_event_detail(self):
+        self._assert_constant(
+            lambda groups: reverse('v1:event-detail', args=[groups[-1].events.first().id]), 2
+        )
+
+    def test_event_status(self):
+        self._assert_constant(
+            lambda groups: reverse('v1:event-status', args=[groups[-1].events.first().id]), 2
+        )
+
+    def test_group_list(self):
+        # count, groups, events joined with notes, attendees
+        self._assert_constant(lambda groups: reverse('v1:events-group-list'), 4)
+
+    def test_group_list_sorted_by_event_count(self):
+        self._assert_constant(
+            lambda groups: reverse('v1:events-group-list') + '?sort=event_count', 4
+        )
+
+    def test_group_detail(self):
+        # group joined with job, events joined with notes, attendees
+        self._assert_constant(
+            lambda groups: reverse('v1:events-group-detail-async', args=[groups[-1].id]), 3
+        )
+
+    def test_group_status(self):
+        self._assert_constant(
+            lambda groups: reverse('v1:events-group-status-async', args=[groups[-1].id]), 3
+        )
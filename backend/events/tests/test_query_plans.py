@@ -0,0 +1,82 @@
+# tests/test_query_plans.py
+from django.test import TestCase
+from django.db import connection
+from django.urls import reverse
+from datetime import datetime, timedelta
+from django.utils import timezone
+from ..models import EventsGroup, Event
+from ..services.time_range import overlapping, single_overlap_q
+from ..management.commands.explain_event_queries import event_query_shapes, explain, seed_events
+
+
+class TestEventQueryPlans(TestCase):
+    """
+    Every list filter/sort shape is answered from an index
+
+    Seeds a smaller table than the explain_event_queries command (1M rows by
+    default) and runs ANALYZE so the planner sees realistic statistics.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = seed_events(5000)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def test_shapes_use_indexes(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('Plan text assertions are written for SQLite')
+        for name, queryset in event_query_shapes(self.group.id):
+            with self.subTest(name):
+                plan = explain(queryset)
+                self.assertIn('USING INDEX', plan)
+                self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_overlap_scan_is_bounded_below(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('Plan text assertions are written for SQLite')
+        start = timezone.now()
+        end = start + timedelta(days=1)
+
+        # Single events: a range bounded at both ends; series: the partial index of rows with a rule
+        plan = overlapping(Event.objects.all(), start, end).explain()
+        self.assertIn('(start_datetime>? AND start_datetime<?)', plan)
+        self.assertIn('USING INDEX event_series_start_idx', plan)
+        self.assertNotIn('SCAN', plan)
+
+        # Range payloads read single events in start order straight off the index
+        plan = Event.objects.filter(single_overlap_q(start, end)).order_by('start_datetime').explain()
+        self.assertIn('(start_datetime>? AND start_datetime<?)', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_date_range_is_sargable(self):
+        _, queryset = next(shape for shape in event_query_shapes() if shape[0] == 'date range')
+        self.assertNotIn('django_datetime_cast_date', str(queryset.query))
+
+
+class TestDateFilters(TestCase):
+    """date_from/date_to cover whole local days as [start, next day start)"""
+
+    def setUp(self):
+        group = EventsGroup.objects.create()
+        day = timezone.make_aware(datetime(2025, 3, 10))
+        for title, start in [
+            ('before', day - timedelta(seconds=1)),
+            ('midnight', day),
+            ('late', day + timedelta(days=1, hours=23, minutes=59)),
+            ('after', day + timedelta(days=2)),
+        ]:
+            Event.objects.create(group=group, title=title, start_datetime=start)
+
+    def test_range_is_inclusive_of_whole_days(self):
+        response = self.client.get(
+            reverse('v1:event-list') + '?date_from=2025-03-10&date_to=2025-03-11&order=asc'
+        )
+        self.assertEqual(
+            [event['title'] for event in response.json()['results']],
+            ['midnight', 'late']
+        )
+
+    def test_invalid_dates_are_ignored(self):
+        response = self.client.get(reverse('v1:event-list') + '?date_from=10/03/2025')
+        self.assertEqual(response.json()['count'], 4)
@@ -0,0 +1,71 @@
+# tests/test_range.py
+from django.test import TestCase
+from django.urls import reverse
+from datetime import datetime, timedelta
+from django.utils import timezone
+from ..models import EventsGroup, Event
+from ..services.time_range import overlapping
+
+
+class TestRangeEndpoint(TestCase):
+    """/events/range/ returns every event overlapping the window"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = EventsGroup.objects.create()
+        cls.day = timezone.make_aware(datetime(2025, 3, 10))
+        day = cls.day
+        for title, start, end in [
+            ('ends before', day - timedelta(hours=2), day - timedelta(hours=1)),
+            ('ends at start', day - timedelta(hours=1), day),
+            ('spans start', day - timedelta(days=3), day + timedelta(hours=1)),
+            ('inside', day + timedelta(hours=9), day + timedelta(hours=10)),
+            ('no end inside', day + timedelta(hours=12), None),
+            ('spans window', day - timedelta(days=1), day + timedelta(days=2)),
+            ('starts at end', day + timedelta(days=1), day + timedelta(days=1, hours=1)),
+            ('no end before', day - timedelta(minutes=1), None),
+        ]:
+            Event.objects.create(group=cls.group, title=title, start_datetime=start, end_datetime=end)
+
+    def _get(self, **params):
+        query = '&'.join(f'{key}={value}' for key, value in params.items())
+        return self.client.get(reverse('v1:event-range') + '?' + query)
+
+    def test_overlapping_events(self):
+        response = self._get(start='2025-03-10', end='2025-03-11')
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()
+        titles = [row[data['fields'].index('title')] for row in data['events']]
+        self.assertEqual(titles, ['spans start', 'spans window', 'inside', 'no end inside'])
+        self.assertFalse(data['truncated'])
+
+    def test_compact_rows(self):
+        data = self._get(start='2025-03-10T09:00:00', end='2025-03-10T09:30:00').json()
+        self.assertEqual(data['fields'], ['id', 'title', 'start', 'end', 'location', 'venue', 'group', 'rrule'])
+        inside = next(row for row in data['events'] if row[1] == 'inside')
+        self.assertEqual(inside[2], '2025-03-10T09:00:00+08:00')
+        self.assertEqual(inside[6], str(self.group.id))
+
+    def test_truncated(self):
+        with self.settings(RANGE_QUERY={'max_events': 2}):
+            data = self._get(start='2025-03-10', end='2025-03-11').json()
+        self.assertEqual(len(data['events']), 2)
+        self.assertTrue(data['truncated'])
+
+    def test_invalid_ranges(self):
+        for params in [{}, {'start': '2025-03-10'}, {'start': 'soon', 'end': '2025-03-11'},
+                       {'start': '2025-03-11', 'end': '2025-03-10'},
+                       {'start': '2020-01-01', 'end': '2025-01-01'}]:
+            with self.subTest(params=params):
+                self.assertEqual(self._get(**params).status_code, 400)
+
+    def test_single_events_longer_than_the_reach_are_not_found(self):
+        Event.objects.create(
+            group=self.group, title='sabbatical',
+            start_datetime=self.day - timedelta(days=40), end_datetime=self.day + timedelta(days=40)
+        )
+        titles = set(overlapping(Event.objects.all(), self.day, self.day + timedelta(days=1)).values_list('title', flat=True))
+        self.assertNotIn('sabbatical', titles)
+        with self.settings(RANGE_QUERY={'max_event_days': 60}):
+            titles = set(overlapping(Event.objects.all(), self.day, self.day + timedelta(days=1)).values_list('title', flat=True))
+        self.assertIn('sabbatical', titles)
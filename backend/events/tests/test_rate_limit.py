@@ -0,0 +1,216 @@
+# tests/test_rate_limit.py
+import asyncio
+import json
+from django.test import SimpleTestCase, override_settings
+from django.utils import timezone
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+from ..services.circuit_breaker import ProviderGuard
+from ..services.coalescing import RequestCoalescer
+from ..services.llm_service import LLMService, ProviderRateLimitedError
+from ..services.parse_cache import ParseCache
+from ..services.rate_limit import RateLimiter, TokenBucket, estimate_tokens
+
+
+class TestTokenBucket(SimpleTestCase):
+    def test_reservations_queue_in_order(self):
+        bucket = TokenBucket(capacity=2, per_second=1)
+        waits = []
+        for _ in range(4):
+            waits.append(bucket.wait_for(1, bucket.updated))
+            bucket.take(1)
+        self.assertEqual(waits, [0, 0, 1, 2])
+
+    def test_oversized_request_waits_for_full_bucket(self):
+        bucket = TokenBucket(capacity=10, per_second=1)
+        bucket.take(10)
+        self.assertEqual(bucket.wait_for(50, bucket.updated), 10)
+
+
+class TestRateLimiter(SimpleTestCase):
+    def test_burst_beyond_budget_is_refused_without_calling(self):
+        limiter = RateLimiter('test', requests_per_minute=60, tokens_per_minute=None)
+        waits = [limiter.reserve(100, max_wait=2.5) for _ in range(65)]
+
+        self.assertEqual(waits[:60], [0] * 60)
+        # One request a second refills; calls due after max_wait are refused
+        self.assertEqual([round(wait) for wait in waits[60:62]], [1, 2])
+        self.assertEqual(waits[62:], [None] * 3)
+        self.assertEqual(limiter.rejected, 3)
+
+    def test_tokens_per_minute(self):
+        limiter = RateLimiter('test', requests_per_minute=1000, tokens_per_minute=6000)
+        self.assertEqual(limiter.reserve(5000, max_wait=1), 0)
+        # 4000 more tokens at 100/s needs 30s of refill
+        self.assertIsNone(limiter.reserve(4000, max_wait=1))
+        self.assertAlmostEqual(limiter.reserve(4000, max_wait=60), 30, places=0)
+
+    async def test_acquire_waits_then_fails_fast(self):
+        limiter = RateLimiter('test', requests_per_minute=600, tokens_per_minute=None)
+        for _ in range(600):
+            limiter.reserve(1, max_wait=0)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await limiter.acquire(1, max_wait=1)
+        self.assertGreaterEqual(loop.time() - started, 0.09)
+
+        with self.assertRaises(ProviderRateLimitedError):
+            await limiter.acquire(1, max_wait=0)
+
+    def test_penalize_holds_back_callers(self):
+        limiter = RateLimiter('test', requests_per_minute=600, tokens_per_minute=None)
+        limiter.penalize(2)
+        self.assertAlmostEqual(limiter.reserve(1, max_wait=10), 2.1, places=1)
+
+    def test_estimate_tokens(self):
+        self.assertEqual(estimate_tokens('x' * 400, output_tokens=100), 200)
+
+
+class TestRequestCoalescer(SimpleTestCase):
+    async def test_identical_requests_share_one_call(self):
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {'events': []}
+
+        results = await asyncio.gather(*(coalescer.run('key', call) for _ in range(5)))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([shared for _, shared in results], [False, True, True, True, True])
+        self.assertTrue(all(result is results[0][0] for result, _ in results))
+        self.assertEqual(coalescer.in_flight(), 0)
+
+        await coalescer.run('key', call)
+        self.assertEqual(len(calls), 2)
+
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        coalescer = RequestCoalescer()
+
+        async def call():
+            await asyncio.sleep(0.05)
+            return 'done'
+
+        first = asyncio.create_task(coalescer.run('key', call))
+        second = asyncio.create_task(coalescer.run('key', call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, ('done', True))
+
+    async def test_call_cancelled_when_nobody_waits(self):
+        coalescer = RequestCoalescer()
+        started = asyncio.Event()
+        cancelled = []
+
+        async def call():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        waiter = asyncio.create_task(coalescer.run('key', call))
+        await started.wait()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        self.assertEqual(cancelled, [True])
+
+    async def test_errors_fan_out(self):
+        coalescer = RequestCoalescer()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        results = await asyncio.gather(*(coalescer.run('key', call) for _ in range(3)), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+
+
+class TestLLMServiceRateLimiting(SimpleTestCase):
+    def setUp(self):
+        self.service = LLMService()
+        self.service.cache = ParseCache(enabled=False)
+        self.calls = 0
+        tomorrow = (timezone.now() + timedelta(days=1)).date()
+        self.response = {'events': [{
+            'title': 'Standup', 'start_date': tomorrow.strftime('%Y-%m-%d'),
+            'start_time': '09:00', 'suggestions': ['Be brief'],
+        }]}
+
+    async def _fake_process(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return json.loads(json.dumps(self.response))
+
+    def _patches(self, limiter=None):
+        return (
+            patch.object(self.service, f'_process_with_{self.service.provider}', self._fake_process),
+            patch('events.services.llm_service.get_provider_guard',
+                  return_value=ProviderGuard(self.service.provider, {'enabled': False})),
+            patch('events.services.llm_service.get_rate_limiter', return_value=limiter),
+            patch('events.services.llm_service.get_request_coalescer', return_value=RequestCoalescer()),
+        )
+
+    async def test_concurrent_identical_texts_coalesce(self):
+        process, guard, limiter, coalescer = self._patches()
+        with process, guard, limiter, coalescer:
+            results = await asyncio.gather(
+                *(self.service.parse_events('Standup tomorrow at 9', None) for _ in range(4)),
+                self.service.parse_events('Retro tomorrow at 9', None)
+            )
+
+        self.assertEqual(self.calls, 2)
+        self.assertEqual([events[0]['title'] for events in results], ['Standup'] * 5)
+
+    async def test_exhausted_bucket_fails_over_without_calling(self):
+        bucket = RateLimiter('test', requests_per_minute=1, tokens_per_minute=None)
+        process, guard, limiter, coalescer = self._patches(bucket)
+        with process, guard, limiter, coalescer, override_settings(LLM_RATE_LIMITS={'max_wait': 0}):
+            await self.service.parse_events('Planning tomorrow at 10', None)
+            with self.assertRaises(ProviderRateLimitedError):
+                await self.service.parse_events('Review tomorrow at 11', None)
+
+        self.assertEqual(self.calls, 1)
+
+    async def test_streams_are_rate_limited_and_guarded(self):
+        guard = ProviderGuard(self.service.provider, {'min_limit': 1, 'max_limit': 4})
+        in_flight = []
+
+        async def fake_stream(request_text):
+            self.calls += 1
+            in_flight.append(guard.limit.in_flight)
+            yield json.dumps(self.response)
+
+        bucket = RateLimiter('test', requests_per_minute=1, tokens_per_minute=None)
+        with patch.object(self.service, f'_stream_with_{self.service.provider}', fake_stream), \
+             patch('events.services.llm_service.get_provider_guard', return_value=guard), \
+             patch('events.services.llm_service.get_rate_limiter', return_value=bucket), \
+             override_settings(LLM_RATE_LIMITS={'max_wait': 0}):
+            events = [event async for event in self.service.stream_events('Planning tomorrow at 10')]
+            with self.assertRaises(ProviderRateLimitedError):
+                async for _ in self.service.stream_events('Review tomorrow at 11'):
+                    pass
+
+        self.assertEqual(events[0]['title'], 'Standup')
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(in_flight, [1])
+        self.assertEqual(guard.limit.in_flight, 0)
+
+    def test_429_becomes_rate_limited_error(self):
+        bucket = RateLimiter('test', requests_per_minute=600, tokens_per_minute=None)
+        error = Exception('Too many requests')
+        error.status_code = 429
+        error.response = MagicMock(headers={'retry-after': '3'})
+
+        with patch('events.services.llm_service.get_rate_limiter', return_value=bucket):
+            self.assertIsInstance(self.service._rate_limited_error(error), ProviderRateLimitedError)
+            self.assertIsNone(self.service._rate_limited_error(ValueError('bad json')))
+
+        self.assertGreater(bucket.reserve(1, max_wait=10), 2.9)
@@ -0,0 +1,167 @@
+# tests/test_recurrence.py
+from django.test import TestCase, SimpleTestCase, override_settings
+from django.urls import reverse
+from datetime import datetime, timedelta
+from django.utils import timezone
+from ..models import EventsGroup, Event
+from ..services.events_service import EventsService
+from ..services.llm_service import LLMService, LLMServiceError
+from ..services.recurrence import RecurrenceError, build_rule, normalize_rrule, occurrences, series_end
+from calendars.services.ics_service import ICSService
+
+
+def _local(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+class TestRecurrenceRules(SimpleTestCase):
+    def test_normalize(self):
+        self.assertEqual(normalize_rrule(''), '')
+        self.assertEqual(normalize_rrule('rrule:byday=mo;freq=weekly'), 'FREQ=WEEKLY;BYDAY=MO')
+        # Date-only UNTIL is the end of that local day, stored in UTC
+        self.assertEqual(normalize_rrule('FREQ=DAILY;UNTIL=20250630'), 'FREQ=DAILY;UNTIL=20250630T155959Z')
+
+    def test_rejects_invalid_rules(self):
+        for rule in ['FREQ=SECONDLY', 'BYDAY=MO', 'FREQ=WEEKLY;COUNT=2;UNTIL=20250101',
+                     'FREQ=WEEKLY;BYDAY=XX', 'FREQ=DAILY;COUNT=100000', 'FREQ=WEEKLY;UNTIL=soon']:
+            with self.subTest(rule=rule):
+                with self.assertRaises(RecurrenceError):
+                    normalize_rrule(rule)
+
+    def test_series_end(self):
+        start = _local(2025, 3, 10, 9)
+        end = start + timedelta(hours=1)
+        self.assertIsNone(series_end('FREQ=WEEKLY', start, end))
+        self.assertEqual(series_end('FREQ=WEEKLY;COUNT=3', start, end), _local(2025, 3, 24, 10))
+        self.assertEqual(
+            series_end(normalize_rrule('FREQ=DAILY;UNTIL=20250312'), start, end),
+            _local(2025, 3, 12, 23, 59, 59) + timedelta(hours=1)
+        )
+
+    def test_occurrences_only_inside_window(self):
+        start = _local(2025, 3, 10, 9)
+        found = list(occurrences(
+            'FREQ=WEEKLY;BYDAY=MO', start, start + timedelta(hours=1),
+            _local(2030, 1, 1), _local(2030, 1, 15)
+        ))
+        self.assertEqual([occurrence_start for occurrence_start, _ in found], [_local(2030, 1, 7, 9), _local(2030, 1, 14, 9)])
+
+    def test_occurrence_straddling_window_start(self):
+        start = _local(2025, 3, 10, 23)
+        found = list(occurrences('FREQ=DAILY', start, start + timedelta(hours=2), _local(2025, 3, 12), _local(2025, 3, 13)))
+        self.assertEqual([occurrence_start for occurrence_start, _ in found], [_local(2025, 3, 11, 23), _local(2025, 3, 12, 23)])
+
+    def test_old_endless_series_match_a_full_walk(self):
+        start = _local(2005, 3, 10, 9, 30)
+        window_start, window_end = _local(2025, 3, 28), _local(2025, 4, 11)
+        for rule in ['FREQ=HOURLY;INTERVAL=5', 'FREQ=DAILY;INTERVAL=3', 'FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH',
+                     'FREQ=DAILY;BYDAY=SA,SU', 'FREQ=WEEKLY;UNTIL=20300101T000000Z']:
+            with self.subTest(rule=rule):
+                expected = [
+                    occurrence for occurrence in build_rule(rule, start).between(window_start, window_end, inc=True)
+                    if occurrence < window_end
+                ]
+                found = [occurrence_start for occurrence_start, _ in occurrences(rule, start, None, window_start, window_end)]
+                self.assertEqual(found, expected)
+                self.assertTrue(found)
+
+
+class TestRecurringEvents(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = EventsGroup.objects.create()
+        cls.standup = Event.objects.create(
+            group=cls.group, title='Standup', rrule='FREQ=WEEKLY;BYDAY=MO,WE;COUNT=6',
+            start_datetime=_local(2025, 3, 10, 9), end_datetime=_local(2025, 3, 10, 9, 15)
+        )
+        Event.objects.create(
+            group=cls.group, title='Offsite',
+            start_datetime=_local(2025, 3, 12, 13), end_datetime=_local(2025, 3, 12, 17)
+        )
+
+    def test_one_row_per_series(self):
+        self.assertEqual(Event.objects.count(), 2)
+        self.assertEqual(self.standup.recurrence_end, _local(2025, 3, 26, 9, 15))
+
+    def test_range_expands_occurrences(self):
+        response = self.client.get(reverse('v1:event-range') + '?start=2025-03-17&end=2025-03-24')
+        data = response.json()
+        self.assertEqual(
+            [(row[1], row[2]) for row in data['events']],
+            [('Standup', '2025-03-17T09:00:00+08:00'), ('Standup', '2025-03-19T09:00:00+08:00')]
+        )
+        self.assertEqual(data['events'][0][0], str(self.standup.id))
+
+    @override_settings(RECURRENCE={'max_occurrences': 3})
+    def test_range_reports_capped_series_as_truncated(self):
+        response = self.client.get(reverse('v1:event-range') + '?start=2025-03-10&end=2025-03-27')
+        data = response.json()
+        self.assertEqual(len(data['events']), 4)
+        self.assertTrue(data['truncated'])
+
+    def test_range_skips_finished_series(self):
+        response = self.client.get(reverse('v1:event-range') + '?start=2025-04-01&end=2025-05-01')
+        self.assertEqual(response.json()['events'], [])
+
+    def test_list_includes_series_with_occurrences(self):
+        response = self.client.get(reverse('v1:event-list') + '?date_from=2025-03-24&date_to=2025-03-30')
+        results = response.json()['results']
+        self.assertEqual([event['title'] for event in results], ['Standup'])
+        self.assertEqual(
+            [occurrence['start_datetime'] for occurrence in results[0]['occurrences']],
+            ['2025-03-24T09:00:00+08:00', '2025-03-26T09:00:00+08:00']
+        )
+
+    def test_conflicts_use_occurrences(self):
+        response = self.client.get(reverse('v1:event-conflicts') + '?start=2025-03-12&end=2025-03-13')
+        self.assertEqual(response.json()['count'], 0)
+        Event.objects.create(title='Dentist', start_datetime=_local(2025, 3, 19, 9, 10))
+        response = self.client.get(reverse('v1:event-conflicts') + '?start=2025-03-17&end=2025-03-24')
+        self.assertEqual(response.json()['count'], 1)
+
+    def test_ics_carries_rule(self):
+        content = ICSService.create_ics_event({
+            'title': 'Standup',
+            'start_datetime': self.standup.start_datetime,
+            'end_datetime': self.standup.end_datetime,
+            'rrule': self.standup.rrule,
+        })
+        self.assertIn(b'RRULE:FREQ=WEEKLY;COUNT=6;BYDAY=MO,WE', content)
+        # The rule is expanded in local wall-clock time, as recurrence.py does
+        local_start = timezone.localtime(self.standup.start_datetime).strftime('%Y%m%dT%H%M%S')
+        self.assertIn(f'DTSTART;TZID=Asia/Hong_Kong:{local_start}'.encode(), content)
+        self.assertIn(b'BEGIN:VTIMEZONE', content)
+
+    def test_created_from_parsed_data(self):
+        start = datetime(2025, 3, 10, 9)
+        events = EventsService()._create_events_from_parsed_data([{
+            'title': 'Gym', 'start_datetime': start, 'end_datetime': start + timedelta(hours=1),
+            'rrule': 'FREQ=DAILY;COUNT=30', 'attendees': []
+        }], self.group)
+        event = Event.objects.get(id=events[0].id)
+        self.assertEqual(event.rrule, 'FREQ=DAILY;COUNT=30')
+        self.assertEqual(event.recurrence_end, _local(2025, 4, 8, 10))
+
+
+class TestRecurrenceParsing(SimpleTestCase):
+    def setUp(self):
+        self.service = LLMService()
+        tomorrow = (timezone.now() + timedelta(days=1)).date()
+        self.event_data = {
+            'title': 'Standup',
+            'start_date': tomorrow.strftime('%Y-%m-%d'),
+            'start_time': '09:00',
+            'suggestions': ['Keep it short'],
+        }
+
+    def test_prompt_asks_for_rules(self):
+        self.assertIn('"recurrence"', self.service._format_prompt('Standup every Monday'))
+
+    def test_recurrence_is_normalized(self):
+        event = self.service._validate_and_format_event({**self.event_data, 'recurrence': 'RRULE:FREQ=WEEKLY;BYDAY=MO'})
+        self.assertEqual(event['rrule'], 'FREQ=WEEKLY;BYDAY=MO')
+        self.assertEqual(self.service._validate_and_format_event(self.event_data)['rrule'], '')
+
+    def test_invalid_recurrence_rejected(self):
+        with self.assertRaises(LLMServiceError):
+            self.service._validate_and_format_event({**self.event_data, 'recurrence': 'every monday'})
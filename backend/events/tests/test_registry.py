@@ -0,0 +1,79 @@
+# tests/test_registry.py
+from django.test import SimpleTestCase
+import json
+import os
+import subprocess
+import sys
+from ..services.registry import ServiceRegistry, ServiceRegistryError, get_service_registry
+from ..services.events_service import EventsService
+
+
+class TestServiceRegistry(SimpleTestCase):
+    def setUp(self):
+        self.registry = ServiceRegistry()
+        self.builds = 0
+
+    def _factory(self):
+        self.builds += 1
+        return object()
+
+    def test_services_are_built_lazily_and_shared(self):
+        self.registry.register('thing', self._factory)
+        self.assertFalse(self.registry.is_loaded('thing'))
+
+        first = self.registry.get('thing')
+        second = self.registry.get('thing')
+
+        self.assertIs(first, second)
+        self.assertEqual(self.builds, 1)
+
+    def test_reset_rebuilds_on_next_get(self):
+        self.registry.register('thing', self._factory)
+        first = self.registry.get('thing')
+
+        self.registry.reset('thing')
+
+        self.assertIsNot(self.registry.get('thing'), first)
+        self.assertEqual(self.builds, 2)
+
+    def test_unknown_service_raises(self):
+        with self.assertRaises(ServiceRegistryError):
+            self.registry.get('missing')
+
+    def test_warm_up_skips_failing_services(self):
+        def broken():
+            raise RuntimeError("no model")
+
+        self.registry.register('thing', self._factory)
+        self.registry.register('broken', broken)
+
+        with self.assertLogs('events.services.registry', level='ERROR'):
+            loaded = self.registry.warm_up()
+
+        self.assertEqual(loaded, ['thing'])
+        self.assertTrue(self.registry.is_loaded('thing'))
+
+    def test_events_service_is_shared(self):
+        events_service = get_service_registry().get('events')
+
+        self.assertIsInstance(events_service, EventsService)
+        self.assertIs(get_service_registry().get('events'), events_service)
+
+
+class TestColdImport(SimpleTestCase):
+    def test_url_import_does_not_load_heavy_modules(self):
+        script = (
+            "import django, json, sys; django.setup(); import config.urls; "
+            "print(json.dumps([m for m in ('spacy', 'openai', 'anthropic') if m in sys.modules]))"
+        )
+        backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=backend_dir,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'config.settings'},
+            capture_output=True,
+            text=True
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(json.loads(result.stdout.strip().splitlines()[-1]), [])
@@ -0,0 +1,100 @@
+# tests/test_search_index.py
+from django.test import TestCase
+from django.urls import reverse
+from datetime import timedelta
+from django.utils import timezone
+from ..models import EventsGroup, Event, Attendee, EventNote
+from ..services.events_service import EventsService
+from ..services.search_index import get_search_index
+
+
+class TestSearchIndex(TestCase):
+    def setUp(self):
+        self.index = get_search_index()
+        if not self.index.available:
+            self.skipTest('No full-text search backend for this database')
+
+        start = timezone.now() + timedelta(days=1)
+        self.group = EventsGroup.objects.create(processing_complete=True)
+        self.review = Event.objects.create(
+            group=self.group,
+            title='Quarterly review',
+            start_datetime=start,
+            location='Berlin',
+            original_text='Quarterly review with finance in Berlin'
+        )
+        self.lunch = Event.objects.create(
+            group=self.group,
+            title='Team lunch',
+            start_datetime=start,
+            venue='Cafe Central',
+            original_text='Lunch at Cafe Central, quarterly numbers optional'
+        )
+        Attendee.objects.create(event=self.review, name='Sarah Connor', email='sconnor@cyberdyne.example')
+
+    def _ids(self, query):
+        return [hit['event_id'] for hit in self.index.search(query)]
+
+    def test_results_are_ranked(self):
+        # A title match outranks a match in the original text
+        self.assertEqual(self._ids('quarterly'), [self.review.id, self.lunch.id])
+
+    def test_last_token_matches_as_prefix(self):
+        self.assertEqual(self._ids('cafe cent'), [self.lunch.id])
+
+    def test_hits_include_snippets(self):
+        hit = self.index.search('finance')[0]
+
+        self.assertEqual(hit['title'], 'Quarterly review')
+        self.assertIn('finance', hit['snippet'])
+
+    def test_attendees_notes_and_edits_are_kept_in_sync(self):
+        EventNote.objects.create(event=self.lunch, content='Bring the budget spreadsheet')
+        self.assertEqual(self._ids('sarah'), [self.review.id])
+        self.assertEqual(self._ids('spreadsheet'), [self.lunch.id])
+
+        self.lunch.title = 'Offsite planning'
+        self.lunch.save()
+        self.review.attendees.all().delete()
+
+        self.assertEqual(self._ids('offsite'), [self.lunch.id])
+        self.assertEqual(self._ids('sarah'), [])
+
+    def test_deleted_events_are_removed(self):
+        self.review.delete()
+
+        self.assertEqual(self._ids('berlin'), [])
+
+    def test_bulk_created_events_are_indexed(self):
+        EventsService()._create_events_from_parsed_data([{
+            'title': 'Dentist appointment',
+            'start_datetime': timezone.now() + timedelta(days=2),
+            'suggestions': 'Bring insurance card',
+            'attendees': [{'name': 'Dr Molar', 'email': ''}]
+        }], self.group)
+
+        self.assertEqual(len(self._ids('dentist')), 1)
+        self.assertEqual([attendee.name for attendee in self.index.search_attendees('mol')], ['Dr Molar'])
+
+    def test_query_syntax_is_not_interpreted(self):
+        self.assertEqual(self._ids('"quarterly" OR NOT *'), [])
+        self.assertEqual(self.index.search('!!'), [])
+
+    def test_viewset_search_uses_index(self):
+        response = self.client.get(reverse('v1:event-list'), {'search': 'sarah'})
+
+        self.assertEqual([row['id'] for row in response.json()['results']], [str(self.review.id)])
+
+    async def test_global_search_returns_ranked_results(self):
+        response = await self.async_client.get(reverse('v1:global-search'), {'q': 'sarah'})
+        results = response.json()['data']
+
+        self.assertEqual([result['type'] for result in results], ['event', 'attendee'])
+        self.assertEqual(results[0]['title'], 'Quarterly review')
+        self.assertEqual(results[1]['title'], 'Sarah Connor')
+
+    async def test_global_search_matches_attendee_email(self):
+        response = await self.async_client.get(reverse('v1:global-search'), {'q': 'sconnor@cyberdyne'})
+        results = response.json()['data']
+
+        self.assertIn(('attendee', 'Sarah Connor'), [(result['type'], result['title']) for result in results])
@@ -0,0 +1,154 @@
+# tests/test_streaming.py
+from django.test import TestCase, AsyncClient
+from django.urls import reverse
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import json
+from ..models import Event, EventsGroup
+from ..api import async_views
+from ..services.http_session import SessionPool
+from ..services.ollama_service import OllamaService
+from ..services.parse_cache import ParseCache
+from ..services.stream_parser import EventsStreamParser, StreamParserError
+
+
+def _raw_event(title):
+    tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+    return {
+        'title': title,
+        'start_date': tomorrow,
+        'start_time': '10:00',
+        'suggestions': ['Bring notes {and} "quotes"']
+    }
+
+
+class TestEventsStreamParser(TestCase):
+    def test_emits_each_event_as_soon_as_it_closes(self):
+        document = '```json\n' + json.dumps({
+            'is_multi_event': True,
+            'events': [_raw_event('Standup [daily]'), _raw_event('Retro')]
+        }) + '\n```'
+        parser = EventsStreamParser()
+
+        emitted_at = []
+        for index, char in enumerate(document):
+            for event in parser.feed(char):
+                emitted_at.append((index, event['title']))
+
+        self.assertEqual([title for _, title in emitted_at], ['Standup [daily]', 'Retro'])
+        # The first event is emitted on its own closing brace, not at the end
+        self.assertEqual(emitted_at[0][0], document.index('}, {"title": "Retro"'))
+        self.assertTrue(parser.complete)
+
+    def test_ignores_objects_outside_events_array(self):
+        parser = EventsStreamParser()
+        parser.feed('{"meta": {"title": "x"}, "events": [{"title": "A"}], "extra": [{"title": "B"}]}')
+
+        self.assertEqual(parser.events, [{'title': 'A'}])
+
+    def test_rejects_unbalanced_json(self):
+        with self.assertRaises(StreamParserError):
+            EventsStreamParser().feed('{"events": [}')
+
+
+class TestOllamaStreaming(TestCase):
+    async def test_stream_events_from_ndjson(self):
+        document = json.dumps({'events': [_raw_event('Standup'), _raw_event('Retro')]})
+
+        async def generate(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            for start in range(0, len(document), 7):
+                line = json.dumps({'response': document[start:start + 7], 'done': False})
+                await response.write(line.encode() + b'\n')
+            await response.write(json.dumps({'response': '', 'done': True}).encode() + b'\n')
+            return response
+
+        app = web.Application()
+        app.router.add_post('/api/generate', generate)
+        server = TestServer(app)
+        await server.start_server()
+        pool = SessionPool('test')
+
+        try:
+            service = OllamaService(base_url=str(server.make_url('')).rstrip('/'))
+            service.session_pool = pool
+            service.cache = ParseCache(db_enabled=False)
+            titles = [event['title'] async for event in service.stream_events("standup and retro")]
+        finally:
+            await pool.close()
+            await server.close()
+
+        self.assertEqual(titles, ['Standup', 'Retro'])
+        self.assertEqual(service.cache.stats()['sets'], 1)
+
+
+class TestCreateFromTextStreamView(TestCase):
+    def setUp(self):
+        self.client = AsyncClient()
+        self.url = reverse('v1:events-create-from-text-stream')
+
+    async def _frames(self, response):
+        body = b''.join([chunk async for chunk in response.streaming_content]).decode()
+        frames = []
+        for block in body.strip().split('\n\n'):
+            event_line, data_line = block.split('\n')
+            frames.append((event_line[len('event: '):], json.loads(data_line[len('data: '):])))
+        return frames
+
+    async def test_streams_saved_events(self):
+        service = async_views.events_service.llm_service
+
+        async def fake_stream(text):
+            for title in ['Standup', 'Retro']:
+                yield service._validate_and_format_event(_raw_event(title))
+
+        with patch.object(service, 'stream_events', fake_stream):
+            response = await self.client.post(
+                self.url, {'text': 'standup and retro tomorrow'}, content_type='application/json'
+            )
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+            frames = await self._frames(response)
+
+        self.assertEqual([name for name, _ in frames], ['group', 'event', 'event', 'done'])
+        self.assertEqual(frames[1][1]['title'], 'Standup')
+        group = await EventsGroup.objects.aget(id=frames[0][1]['id'])
+        self.assertTrue(group.processing_complete)
+        self.assertEqual(await Event.objects.filter(group=group).acount(), 2)
+
+    async def test_reports_errors_after_partial_results(self):
+        service = async_views.events_service.llm_service
+
+        async def failing_stream(text):
+            yield service._validate_and_format_event(_raw_event('Standup'))
+            yield service._validate_and_format_event({'title': 'Broken'})
+
+        with patch.object(service, 'stream_events', failing_stream):
+            response = await self.client.post(
+                self.url, {'text': 'standup and retro tomorrow'}, content_type='application/json'
+            )
+            frames = await self._frames(response)
+
+        self.assertEqual([name for name, _ in frames], ['group', 'event', 'error'])
+        group = await EventsGroup.objects.aget(id=frames[0][1]['id'])
+        self.assertIn('Missing required fields', group.processing_error)
+
+    async def test_disconnect_mid_stream_closes_group(self):
+        service = async_views.events_service.llm_service
+
+        async def fake_stream(text):
+            for title in ['Standup', 'Retro']:
+                yield service._validate_and_format_event(_raw_event(title))
+
+        group = await async_views.events_service.acreate_pending_group(True)
+        with patch.object(service, 'stream_events', fake_stream):
+            stream = async_views.events_service.astream_events_from_text(group, 'standup and retro tomorrow')
+            await stream.__anext__()
+            await stream.aclose()
+
+        await group.arefresh_from_db()
+        self.assertTrue(group.processing_complete)
+        self.assertIn('interrupted after 1 event', group.processing_error)
+        self.assertEqual(await Event.objects.filter(group=group).acount(), 1)